@@ -5,6 +5,8 @@ from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth import authenticate
 
+from api.profiles import get_profile
+
 class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         # Try to authenticate with email as username
@@ -33,11 +35,5 @@ class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user = request.user
-        return Response({
-            "id": user.id,
-            "email": user.email,
-            "username": user.username,
-            "full_name": user.get_full_name(),
-            "is_staff": user.is_staff,
-        })
+        # Same cached payload as api.views.me
+        return Response(get_profile(request.user))
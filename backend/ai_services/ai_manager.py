@@ -4,6 +4,10 @@ from .dynamic_pricing import DynamicPricingAI
 from .occupancy_forecast import OccupancyForecastAI
 from .risk_assessment import RiskAssessmentAI
 from django.db import models
+from django.utils import timezone
+
+from api.replicas import use_replica
+from api.versioning import memoize_by_version
 
 class AIServiceManager:
     """Main AI service manager that coordinates all AI services"""
@@ -26,6 +30,7 @@ class AIServiceManager:
         self.occupancy_forecast.train_model()
         self.risk_assessment.train_model()
     
+    @use_replica
     def get_tenant_recommendations(self, tenant, properties=None):
         """Get property recommendations for a tenant"""
         if properties is None:
@@ -34,6 +39,18 @@ class AIServiceManager:
         
         return self.tenant_allocation.find_best_matches(tenant, properties)
     
+    @use_replica
+    def get_tenant_risk_assessment(self, tenant):
+        """Risk assessment for a tenant, without saving it"""
+        return self.risk_assessment.calculate_tenant_risk_score(tenant)
+    
+    @use_replica
+    def get_property_risk_assessment(self, property):
+        """Risk assessment for a property, without saving it"""
+        return self.risk_assessment.calculate_property_risk_score(property)
+    
+    # The update_* methods persist what they compute, so they read from the
+    # primary: a lagging replica would store a stale score
     def update_payment_predictions(self, payment):
         """Update payment predictions"""
         return self.payment_prediction.update_payment_predictions(payment)
@@ -50,28 +67,25 @@ class AIServiceManager:
         """Update risk scores"""
         return self.risk_assessment.update_risk_scores(tenant, property)
     
+    @use_replica
     def get_dashboard_analytics(self):
         """Get comprehensive analytics for dashboard"""
         from api.models import Property, Tenant, Payment, MaintenanceRequest
         
-        # Basic statistics
-        total_properties = Property.objects.count()
+        # Property statistics in one conditional-aggregate query
+        property_stats = Property.objects.aggregate(
+            total=models.Count('id'),
+            available=models.Count('id', filter=models.Q(available=True)),
+            avg_occupancy=models.Avg('occupancy_rate'),
+        )
         total_tenants = Tenant.objects.filter(active=True).count()
-        total_properties_available = Property.objects.filter(available=True).count()
         
-        # Calculate total revenue (current month)
-        from datetime import datetime, timedelta
-        current_month_start = datetime.now().replace(day=1).date()
-        current_month_payments = Payment.objects.filter(
+        # Calculate total revenue (current month) in the database
+        current_month_start = timezone.now().date().replace(day=1)
+        total_revenue = Payment.objects.filter(
             payment_date__gte=current_month_start,
             status='paid'
-        )
-        total_revenue = sum(p.amount for p in current_month_payments)
-        
-        # Average occupancy rate
-        avg_occupancy = Property.objects.aggregate(
-            avg_occupancy=models.Avg('occupancy_rate')
-        )['avg_occupancy'] or 0
+        ).aggregate(total=models.Sum('amount'))['total'] or 0
         
         # Maintenance requests
         pending_maintenance = MaintenanceRequest.objects.filter(
@@ -79,21 +93,21 @@ class AIServiceManager:
         ).count()
         
         return {
-            'total_properties': total_properties,
+            'total_properties': property_stats['total'],
             'total_tenants': total_tenants,
-            'available_properties': total_properties_available,
+            'available_properties': property_stats['available'],
             'total_revenue': float(total_revenue),
-            'average_occupancy_rate': float(avg_occupancy),
+            'average_occupancy_rate': float(property_stats['avg_occupancy'] or 0),
             'pending_maintenance_requests': pending_maintenance,
-            'ai_insights': self._get_ai_insights()
+            'ai_insights': memoize_by_version('ai:insights', self._get_ai_insights)
         }
     
     def _get_ai_insights(self):
         """Get AI-powered insights"""
+        from api.models import Tenant, Property
         insights = []
         
         # High-risk tenants
-        from api.models import Tenant
         high_risk_tenants = Tenant.objects.filter(
             behavior_risk_score__gte=7.0,
             active=True
@@ -107,11 +121,17 @@ class AIServiceManager:
                 'priority': 'high'
             })
         
-        # Properties with pricing opportunities
-        from api.models import Property
-        underpriced_properties = Property.objects.filter(
-            suggested_price__gt=models.F('price') * 1.1
-        ).count()
+        # Pricing opportunities and low occupancy in one query
+        property_flags = Property.objects.aggregate(
+            underpriced=models.Count('id', filter=models.Q(
+                suggested_price__gt=models.F('price') * 1.1
+            )),
+            low_occupancy=models.Count('id', filter=models.Q(
+                occupancy_rate__lt=0.5,
+                available=True
+            )),
+        )
+        underpriced_properties = property_flags['underpriced']
         
         if underpriced_properties > 0:
             insights.append({
@@ -122,10 +142,7 @@ class AIServiceManager:
             })
         
         # Low occupancy properties
-        low_occupancy_properties = Property.objects.filter(
-            occupancy_rate__lt=0.5,
-            available=True
-        ).count()
+        low_occupancy_properties = property_flags['low_occupancy']
         
         if low_occupancy_properties > 0:
             insights.append({
@@ -5,6 +5,8 @@ from sklearn.preprocessing import StandardScaler
 from datetime import datetime, timedelta
 import logging
 
+from django.db import models
+
 from api.models import Property, Payment, AIModelPrediction
 
 logger = logging.getLogger(__name__)
@@ -145,9 +147,9 @@ class DynamicPricingAI:
                 models.Avg('price')
             )['price__avg'] or property.price
             
-            if property.price < avg_price:
+            if float(property.price) < float(avg_price):
                 score += 2.0  # Below average price increases demand
-            elif property.price > avg_price * 1.2:
+            elif float(property.price) > float(avg_price) * 1.2:
                 score -= 1.5  # Too expensive reduces demand
         
         # Property features
@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from api.benchmarking import benchmark_database, time_call
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark AIServiceManager.get_dashboard_analytics against growing "
+        "volumes of paid payments in a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--volumes', default='1000,10000,50000',
+            help='Comma separated payment counts to benchmark (cumulative).',
+        )
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        volumes = sorted(int(v) for v in options['volumes'].split(','))
+
+        with benchmark_database():
+            from api.models import Property, Tenant, Payment
+            from ai_services.ai_manager import ai_service
+
+            prop = Property.objects.create(name='Bench Property', price=Decimal('10000.00'))
+            tenant = Tenant.objects.create(
+                first_name='Bench', last_name='Tenant', email='bench@example.com', property=prop,
+            )
+            today = timezone.now().date()
+
+            def python_sum():
+                # Baseline: the previous implementation summed model instances in Python
+                return sum(p.amount for p in Payment.objects.filter(
+                    payment_date__gte=today.replace(day=1), status='paid',
+                ))
+
+            self.stdout.write(f"{'payments':>10} {'python sum (ms)':>16} {'analytics (ms)':>15}")
+            created = 0
+            for volume in volumes:
+                Payment.objects.bulk_create(
+                    [
+                        Payment(
+                            tenant=tenant, property=prop, amount=Decimal('10000.00'),
+                            due_date=today, payment_date=today, status='paid',
+                        )
+                        for _ in range(volume - created)
+                    ],
+                    batch_size=5000,
+                )
+                created = volume
+
+                baseline = time_call(python_sum, repeat=options['repeat'])
+
+                def analytics():
+                    cache.clear()
+                    return ai_service.get_dashboard_analytics()
+
+                current = time_call(analytics, repeat=options['repeat'])
+                self.stdout.write(
+                    f"{volume:>10} {baseline['median_ms']:>16.2f} {current['median_ms']:>15.2f}"
+                )
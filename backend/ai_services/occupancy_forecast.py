@@ -5,6 +5,9 @@ from sklearn.preprocessing import StandardScaler
 from datetime import datetime, timedelta
 import logging
 
+from django.db import models
+from django.utils import timezone
+
 from api.models import Property, Payment, Tenant, AIModelPrediction
 
 logger = logging.getLogger(__name__)
@@ -25,7 +28,7 @@ class OccupancyForecastAI:
         # Calculate recent payment trends (indicator of tenant satisfaction)
         recent_payments = Payment.objects.filter(
             property=property,
-            created_at__gte=datetime.now() - timedelta(days=90)
+            created_at__gte=timezone.now() - timedelta(days=90)
         )
         
         if recent_payments.exists():
@@ -98,9 +101,9 @@ class OccupancyForecastAI:
                 models.Avg('price')
             )['price__avg'] or property.price
             
-            if property.price < avg_price * 0.9:
+            if float(property.price) < float(avg_price) * 0.9:
                 price_factor = 1.05  # Competitive price
-            elif property.price > avg_price * 1.1:
+            elif float(property.price) > float(avg_price) * 1.1:
                 price_factor = 0.95  # Expensive
         
         predicted_occupancy = current_occupancy + trend
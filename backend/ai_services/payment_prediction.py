@@ -5,6 +5,8 @@ from sklearn.preprocessing import StandardScaler
 from datetime import datetime, timedelta
 import logging
 
+from django.db import models
+
 from api.models import Tenant, Payment, AIModelPrediction
 
 logger = logging.getLogger(__name__)
@@ -2,9 +2,10 @@ import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
 from django.db import models
+from django.utils import timezone
 
 from api.models import Tenant, Property, Payment, MaintenanceRequest, TenantBehavior, AIModelPrediction
 
@@ -91,7 +92,7 @@ class RiskAssessmentAI:
         # Check for recent concerning behaviors
         recent_behaviors = TenantBehavior.objects.filter(
             tenant=tenant,
-            timestamp__gte=datetime.now() - timedelta(days=90)
+            timestamp__gte=timezone.now() - timedelta(days=90)
         )
         
         if not recent_behaviors.exists():
@@ -114,7 +115,7 @@ class RiskAssessmentAI:
         
         total_requests = maintenance_requests.count()
         recent_requests = maintenance_requests.filter(
-            created_at__gte=datetime.now() - timedelta(days=90)
+            created_at__gte=timezone.now() - timedelta(days=90)
         ).count()
         
         # High frequency of maintenance requests increases risk
@@ -132,7 +133,7 @@ class RiskAssessmentAI:
         if not tenant.created_at:
             return 5.0
         
-        days_as_tenant = (datetime.now().date() - tenant.created_at).days
+        days_as_tenant = (timezone.now() - tenant.created_at).days
         
         if days_as_tenant < 30:
             return 7.0  # New tenant
@@ -249,7 +250,7 @@ class RiskAssessmentAI:
             return 3.0
         
         recent_requests = maintenance_requests.filter(
-            created_at__gte=datetime.now() - timedelta(days=90)
+            created_at__gte=timezone.now() - timedelta(days=90)
         ).count()
         
         if recent_requests > 5:
@@ -5,6 +5,8 @@ from django.shortcuts import get_object_or_404
 
 from api.models import Property, Tenant, Payment
 from ai_services.ai_manager import ai_service
+from api import prewarm
+from api.sqlstats import query_budget
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
@@ -19,7 +21,11 @@ def tenant_recommendations(request):
         tenant = get_object_or_404(Tenant, id=tenant_id)
         properties = Property.objects.filter(available=True)
         
-        recommendations = ai_service.get_tenant_recommendations(tenant, properties)
+        # Matches carry the Property instance; the id, name, price and location are returned instead
+        recommendations = [
+            {key: value for key, value in match.items() if key != 'property'}
+            for match in ai_service.get_tenant_recommendations(tenant, properties)
+        ]
         
         return Response({
             'tenant_id': tenant_id,
@@ -64,13 +70,16 @@ def update_property_pricing(request):
         property = get_object_or_404(Property, id=property_id)
         ai_service.update_property_pricing(property)
         
+        # suggested_price is still the engine's float until the row is reloaded
+        current_price = float(property.price)
+        suggested_price = float(property.suggested_price)
         return Response({
             'property_id': property_id,
-            'current_price': float(property.price),
-            'suggested_price': float(property.suggested_price),
+            'current_price': current_price,
+            'suggested_price': suggested_price,
             'demand_score': property.demand_score,
-            'price_difference': float(property.suggested_price - property.price),
-            'price_difference_percent': ((property.suggested_price - property.price) / property.price) * 100
+            'price_difference': suggested_price - current_price,
+            'price_difference_percent': ((suggested_price - current_price) / current_price) * 100
         })
     except Exception as e:
         return Response({'error': str(e)}, status=500)
@@ -128,13 +137,13 @@ def update_risk_scores(request):
     except Exception as e:
         return Response({'error': str(e)}, status=500)
 
+@query_budget(9)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def dashboard_analytics(request):
     """Get comprehensive AI-powered dashboard analytics"""
     try:
-        analytics = ai_service.get_dashboard_analytics()
-        return Response(analytics)
+        return prewarm.payload_response(prewarm.get_payload('dashboard_analytics'))
     except Exception as e:
         return Response({'error': str(e)}, status=500)
 
@@ -149,7 +158,7 @@ def tenant_risk_assessment(request):
     
     try:
         tenant = get_object_or_404(Tenant, id=tenant_id)
-        risk_assessment = ai_service.risk_assessment.calculate_tenant_risk_score(tenant)
+        risk_assessment = ai_service.get_tenant_risk_assessment(tenant)
         
         return Response({
             'tenant_id': tenant_id,
@@ -169,7 +178,7 @@ def property_risk_assessment(request):
     
     try:
         property = get_object_or_404(Property, id=property_id)
-        risk_assessment = ai_service.risk_assessment.calculate_property_risk_score(property)
+        risk_assessment = ai_service.get_property_risk_assessment(property)
         
         return Response({
             'property_id': property_id,
@@ -177,3 +186,7 @@ def property_risk_assessment(request):
         })
     except Exception as e:
         return Response({'error': str(e)}, status=500)
+
+
+# Served through the stale-while-revalidate dashboard cache
+prewarm.register_payload('dashboard_analytics', ai_service.get_dashboard_analytics)
@@ -0,0 +1,90 @@
+"""
+Cheap activity recording for the admin activity feed.
+
+Events become ``ActivityLog`` rows once the surrounding transaction commits;
+events recorded inside a transaction that rolls back are never written.
+Within ``request_batch()`` (every request, see
+``api.middleware.ActivityLogMiddleware``) committed events are collected and
+written with one ``bulk_create`` when the block ends, or as soon as
+``ACTIVITY_LOG_BATCH_SIZE`` are waiting. Elsewhere each event is written as
+it commits. Nothing outlives the request that recorded it, so a worker that
+dies loses at most the events of the requests it was serving.
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Committed events waiting for the end of the current request_batch() block
+_batch = ContextVar('activity_batch', default=None)
+
+
+def _batch_size():
+    return getattr(settings, 'ACTIVITY_LOG_BATCH_SIZE', 100)
+
+
+def record_activity(activity_type, title, description='', status='info',
+                    actor=None, object_id=None, metadata=None):
+    """Record an activity event; it is written once the transaction commits."""
+    from .models import ActivityLog
+
+    entry = ActivityLog(
+        activity_type=activity_type,
+        title=title,
+        description=description,
+        status=status,
+        actor_id=getattr(actor, 'pk', actor),
+        object_id=object_id,
+        metadata=metadata or {},
+        created_at=timezone.now(),
+    )
+    transaction.on_commit(lambda: _enqueue(entry))
+
+
+def _enqueue(entry):
+    pending = _batch.get()
+    if pending is None:
+        _write([entry])
+        return
+    pending.append(entry)
+    if len(pending) >= _batch_size():
+        flush()
+
+
+def flush():
+    """Write the events collected by the current ``request_batch()``."""
+    pending = _batch.get()
+    if not pending:
+        return 0
+    entries = pending[:]
+    del pending[:]
+    return _write(entries)
+
+
+def _write(entries):
+    from .models import ActivityLog
+
+    try:
+        ActivityLog.objects.bulk_create(entries, batch_size=_batch_size())
+    except Exception as e:
+        logger.error(f"Error writing {len(entries)} activity events: {str(e)}")
+        return 0
+    return len(entries)
+
+
+@contextmanager
+def request_batch():
+    """Collect events committed in this block and write them together at its end."""
+    token = _batch.set([])
+    try:
+        yield
+    finally:
+        try:
+            flush()
+        finally:
+            _batch.reset(token)
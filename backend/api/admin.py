@@ -1,17 +1,33 @@
 from django.contrib import admin
+from . import fulltext
 from .models import Property, Tenant, Payment, MaintenanceRequest
 
+
+class FullTextSearchMixin:
+    """Answer the changelist search box from the full-text index (see api.fulltext)."""
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip() or not fulltext.is_supported():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(pk__in=fulltext.search_ids(self.model, search_term)), False
+
+
 @admin.register(Property)
-class PropertyAdmin(admin.ModelAdmin):
+class PropertyAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ('id','name','owner','location','price','available')
     list_filter = ('available',)
     search_fields = ('name','location')
 
 @admin.register(Tenant)
-class TenantAdmin(admin.ModelAdmin):
+class TenantAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ('id','first_name','last_name','email','user','property','active')
     list_filter = ('active',)
-    search_fields = ('first_name','last_name','email')
+    search_fields = ('first_name','last_name','email','phone')
+
+@admin.register(MaintenanceRequest)
+class MaintenanceRequestAdmin(FullTextSearchMixin, admin.ModelAdmin):
+    list_display = ('id','property','tenant','category','priority','status','created_at')
+    list_filter = ('status','priority')
+    search_fields = ('issue_description','resolution_notes')
 
 admin.site.register(Payment)
-admin.site.register(MaintenanceRequest)
@@ -1,17 +1,109 @@
 from rest_framework import status, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes, parser_classes
+from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.http import StreamingHttpResponse
+from django.db import transaction
 from django.db.models import Count, Sum, Avg, Q, F
 from django.utils import timezone
-from datetime import timedelta, date
+from django.utils.dateparse import parse_date, parse_datetime
+from datetime import datetime, timedelta, date
 from decimal import Decimal
+import base64
+import csv
+import json
 import logging
+import threading
+import time
 
-from .models import Property, Tenant, Payment, MaintenanceRequest, AIModelPrediction, TenantPreference, TenantBehavior
+from . import activity
+from . import prewarm
+from .filters import TRUE_VALUES, FALSE_VALUES
+from .exporting import EXPORTS, CSVRenderer, JSONLinesRenderer, export_queryset, csv_stream, jsonl_stream, gzip_stream
+from .importing import IMPORT_FIELDS, FORMATS, DEFAULT_CHUNK_SIZE, Importer, detect_format, iter_records
+from .changefeed import feed
+from .profiles import invalidate_profiles
+from .sqlstats import query_budget
+from .versioning import bump_data_version_on_commit
+from .models import Property, Tenant, Payment, MaintenanceRequest, AIModelPrediction, TenantPreference, TenantBehavior, ActivityLog
 
 logger = logging.getLogger(__name__)
 
+def _dashboard_stats_payload():
+    """Build the admin dashboard statistics payload"""
+    # User statistics
+    user_counts = User.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+        admins=Count('id', filter=Q(is_staff=True)),
+    )
+    total_users = user_counts['total']
+    active_users = user_counts['active']
+    admin_users = user_counts['admins']
+    tenant_users = total_users - admin_users
+    
+    # Property statistics
+    # In this schema a property is considered "occupied" when `available` is False
+    property_counts = Property.objects.aggregate(
+        total=Count('id'),
+        occupied=Count('id', filter=Q(available=False)),
+    )
+    total_properties = property_counts['total']
+    occupied_properties = property_counts['occupied']
+    available_properties = total_properties - occupied_properties
+    occupancy_rate = (occupied_properties / total_properties * 100) if total_properties > 0 else 0
+    
+    # Financial statistics
+    current_month = timezone.now().replace(day=1)
+    monthly_revenue = Payment.objects.filter(
+        status='paid',
+        payment_date__gte=current_month
+    ).aggregate(total=Sum('amount'))['total'] or 0
+    
+    last_month_revenue = Payment.objects.filter(
+        status='paid',
+        payment_date__gte=current_month - timedelta(days=30),
+        payment_date__lt=current_month
+    ).aggregate(total=Sum('amount'))['total'] or 0
+    
+    revenue_growth = ((monthly_revenue - last_month_revenue) / last_month_revenue * 100) if last_month_revenue > 0 else 0
+    
+    # Maintenance statistics
+    # "submitted" is the initial state for maintenance requests
+    maintenance_counts = MaintenanceRequest.objects.aggregate(
+        pending=Count('id', filter=Q(status='submitted')),
+        in_progress=Count('id', filter=Q(status='in_progress')),
+    )
+    pending_maintenance = maintenance_counts['pending']
+    in_progress_maintenance = maintenance_counts['in_progress']
+    
+    # AI predictions
+    high_risk_tenants = Tenant.objects.filter(
+        behavior_risk_score__gt=7.0
+    ).count()
+    
+    return {
+        'totalUsers': total_users,
+        'activeUsers': active_users,
+        'adminUsers': admin_users,
+        'tenantUsers': tenant_users,
+        'totalProperties': total_properties,
+        'occupiedProperties': occupied_properties,
+        'availableProperties': available_properties,
+        'occupancyRate': round(occupancy_rate, 1),
+        'monthlyRevenue': float(monthly_revenue),
+        'revenueGrowth': round(revenue_growth, 1),
+        'pendingMaintenance': pending_maintenance,
+        'inProgressMaintenance': in_progress_maintenance,
+        'highRiskTenants': high_risk_tenants,
+    }
+
+
+@query_budget(8)
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def dashboard_stats(request):
@@ -23,59 +115,7 @@ def dashboard_stats(request):
         if not user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        # User statistics
-        total_users = User.objects.count()
-        active_users = User.objects.filter(is_active=True).count()
-        admin_users = User.objects.filter(is_staff=True).count()
-        tenant_users = total_users - admin_users
-        
-        # Property statistics
-        total_properties = Property.objects.count()
-        # In this schema a property is considered "occupied" when `available` is False
-        occupied_properties = Property.objects.filter(available=False).count()
-        available_properties = Property.objects.filter(available=True).count()
-        occupancy_rate = (occupied_properties / total_properties * 100) if total_properties > 0 else 0
-        
-        # Financial statistics
-        current_month = timezone.now().replace(day=1)
-        monthly_revenue = Payment.objects.filter(
-            status='paid',
-            payment_date__gte=current_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        last_month_revenue = Payment.objects.filter(
-            status='paid',
-            payment_date__gte=current_month - timedelta(days=30),
-            payment_date__lt=current_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        revenue_growth = ((monthly_revenue - last_month_revenue) / last_month_revenue * 100) if last_month_revenue > 0 else 0
-        
-        # Maintenance statistics
-        # "submitted" is the initial state for maintenance requests
-        pending_maintenance = MaintenanceRequest.objects.filter(status='submitted').count()
-        in_progress_maintenance = MaintenanceRequest.objects.filter(status='in_progress').count()
-        
-        # AI predictions
-        high_risk_tenants = Tenant.objects.filter(
-            behavior_risk_score__gt=7.0
-        ).count()
-        
-        return Response({
-            'totalUsers': total_users,
-            'activeUsers': active_users,
-            'adminUsers': admin_users,
-            'tenantUsers': tenant_users,
-            'totalProperties': total_properties,
-            'occupiedProperties': occupied_properties,
-            'availableProperties': available_properties,
-            'occupancyRate': round(occupancy_rate, 1),
-            'monthlyRevenue': float(monthly_revenue),
-            'revenueGrowth': round(revenue_growth, 1),
-            'pendingMaintenance': pending_maintenance,
-            'inProgressMaintenance': in_progress_maintenance,
-            'highRiskTenants': high_risk_tenants,
-        })
+        return prewarm.payload_response(prewarm.get_payload('dashboard_stats'))
         
     except Exception as e:
         logger.error(f"Error fetching dashboard stats: {str(e)}")
@@ -84,6 +124,68 @@ def dashboard_stats(request):
             'details': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+def _ai_insights_payload():
+    """Build the AI insights payload"""
+    # Payment risk analysis
+    high_risk_count = Tenant.objects.filter(
+        behavior_risk_score__gt=7.0
+    ).count()
+    
+    medium_risk_count = Tenant.objects.filter(
+        behavior_risk_score__gt=4.0,
+        behavior_risk_score__lte=7.0
+    ).count()
+    
+    payment_risk = 'High' if high_risk_count > 5 else 'Medium' if high_risk_count > 2 else 'Low'
+    
+    # Revenue forecasting (simplified)
+    current_month = timezone.now().replace(day=1)
+    current_revenue = Payment.objects.filter(
+        status='paid',
+        payment_date__gte=current_month
+    ).aggregate(total=Sum('amount'))['total'] or 0
+    
+    # Predict next month based on trends
+    revenue_forecast = float(current_revenue) * 1.05  # 5% growth assumption
+    
+    # Price optimization analysis
+    price_optimization = 8  # Simplified AI recommendation
+    
+    # Tenant performance insights
+    top_performers = Tenant.objects.filter(
+        payment_reliability_score__gt=8.0
+    ).count()
+    
+    at_risk_tenants = Tenant.objects.filter(
+        behavior_risk_score__gt=6.0,
+        payment_reliability_score__lt=6.0
+    ).count()
+    
+    # Maintenance predictions
+    urgent_maintenance = MaintenanceRequest.objects.filter(
+        priority_score__gt=7.0,
+        status='submitted',
+    ).count()
+    
+    return {
+        'paymentRisk': payment_risk,
+        'highRiskCount': high_risk_count,
+        'mediumRiskCount': medium_risk_count,
+        'revenueForecast': revenue_forecast,
+        'priceOptimization': price_optimization,
+        'topPerformers': top_performers,
+        'atRiskTenants': at_risk_tenants,
+        'urgentMaintenance': urgent_maintenance,
+        'recommendations': [
+            'Consider increasing rent by 5-8% for high-demand properties',
+            'Focus on retaining top-performing tenants',
+            'Implement early payment incentives for at-risk tenants',
+            'Schedule preventive maintenance for high-priority issues'
+        ]
+    }
+
+
+@query_budget(9)
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def ai_insights(request):
@@ -95,68 +197,7 @@ def ai_insights(request):
         if not user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        # Payment risk analysis
-        high_risk_count = Tenant.objects.filter(
-            behavior_risk_score__gt=7.0
-        ).count()
-        
-        medium_risk_count = Tenant.objects.filter(
-            behavior_risk_score__gt=4.0,
-            behavior_risk_score__lte=7.0
-        ).count()
-        
-        payment_risk = 'High' if high_risk_count > 5 else 'Medium' if high_risk_count > 2 else 'Low'
-        
-        # Revenue forecasting (simplified)
-        current_month = timezone.now().replace(day=1)
-        current_revenue = Payment.objects.filter(
-            status='paid',
-            payment_date__gte=current_month
-        ).aggregate(total=Sum('amount'))['total'] or 0
-        
-        # Predict next month based on trends
-        revenue_forecast = float(current_revenue * 1.05)  # 5% growth assumption
-        
-        # Price optimization analysis
-        avg_occupancy = Property.objects.aggregate(
-            avg_price=Avg('price'),
-            avg_occupancy=Avg(F('price') * 0.8)  # Simplified occupancy calculation
-        )
-        
-        price_optimization = 8  # Simplified AI recommendation
-        
-        # Tenant performance insights
-        top_performers = Tenant.objects.filter(
-            payment_reliability_score__gt=8.0
-        ).count()
-        
-        at_risk_tenants = Tenant.objects.filter(
-            behavior_risk_score__gt=6.0,
-            payment_reliability_score__lt=6.0
-        ).count()
-        
-        # Maintenance predictions
-        urgent_maintenance = MaintenanceRequest.objects.filter(
-            priority_score__gt=7.0,
-            status='submitted',
-        ).count()
-        
-        return Response({
-            'paymentRisk': payment_risk,
-            'highRiskCount': high_risk_count,
-            'mediumRiskCount': medium_risk_count,
-            'revenueForecast': revenue_forecast,
-            'priceOptimization': price_optimization,
-            'topPerformers': top_performers,
-            'atRiskTenants': at_risk_tenants,
-            'urgentMaintenance': urgent_maintenance,
-            'recommendations': [
-                'Consider increasing rent by 5-8% for high-demand properties',
-                'Focus on retaining top-performing tenants',
-                'Implement early payment incentives for at-risk tenants',
-                'Schedule preventive maintenance for high-priority issues'
-            ]
-        })
+        return prewarm.payload_response(prewarm.get_payload('ai_insights'))
         
     except Exception as e:
         logger.error(f"Error fetching AI insights: {str(e)}")
@@ -165,6 +206,7 @@ def ai_insights(request):
             'details': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+@query_budget(4)
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def user_management(request):
@@ -176,16 +218,15 @@ def user_management(request):
         if not user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        users = User.objects.all().annotate(
-            user_type=Case(
-                When(is_staff=True, then=Value('admin')),
-                default=Value('tenant'),
-                output_field=CharField(),
-            )
-        ).values(
+        users = User.objects.values(
             'id', 'username', 'email', 'first_name', 'last_name',
             'is_staff', 'is_active', 'date_joined', 'last_login'
         )
+        # One query for every tenant linked by email instead of one per user
+        emails = [user_data['email'] for user_data in users if user_data['email']]
+        tenants_by_email = {}
+        for tenant in Tenant.objects.select_related('property').filter(email__in=emails).order_by('-id'):
+            tenants_by_email[tenant.email] = tenant
         
         # Add tenant-specific data
         user_list = []
@@ -193,8 +234,8 @@ def user_management(request):
             user_dict = dict(user_data)
             
             # Get tenant data if applicable
-            try:
-                tenant = Tenant.objects.get(email=user_data['email'])
+            tenant = tenants_by_email.get(user_data['email'])
+            if tenant is not None:
                 user_dict.update({
                     'user_type': 'tenant',
                     'property_name': tenant.property.name if tenant.property else None,
@@ -205,19 +246,18 @@ def user_management(request):
                     'active': tenant.active,
                     'risk_score': int(tenant.behavior_risk_score * 10)  # Convert to percentage
                 })
-            except Tenant.DoesNotExist:
-                if user_data['is_staff']:
-                    user_dict.update({
-                        'user_type': 'admin',
-                        'property_name': 'All Properties',
-                        'risk_score': 0
-                    })
-                else:
-                    user_dict.update({
-                        'user_type': 'unknown',
-                        'property_name': None,
-                        'risk_score': 50
-                    })
+            elif user_data['is_staff']:
+                user_dict.update({
+                    'user_type': 'admin',
+                    'property_name': 'All Properties',
+                    'risk_score': 0
+                })
+            else:
+                user_dict.update({
+                    'user_type': 'unknown',
+                    'property_name': None,
+                    'risk_score': 50
+                })
             
             user_list.append(user_dict)
         
@@ -262,6 +302,14 @@ def user_action(request, user_id, action):
                 pass
             
             message = 'User suspended successfully'
+            activity.record_activity(
+                'user',
+                'User Suspended',
+                f"{target_user.email} was suspended",
+                status='warning',
+                actor=user,
+                object_id=target_user.id,
+            )
             
         elif action == 'activate':
             target_user.is_active = True
@@ -276,6 +324,14 @@ def user_action(request, user_id, action):
                 pass
             
             message = 'User activated successfully'
+            activity.record_activity(
+                'user',
+                'User Activated',
+                f"{target_user.email} was activated",
+                status='success',
+                actor=user,
+                object_id=target_user.id,
+            )
             
         elif action == 'delete':
             # Don't allow deletion of admin users
@@ -289,6 +345,14 @@ def user_action(request, user_id, action):
             except Tenant.DoesNotExist:
                 pass
             
+            activity.record_activity(
+                'user',
+                'User Deleted',
+                f"{target_user.email} was deleted",
+                status='warning',
+                actor=user,
+                object_id=target_user.id,
+            )
             target_user.delete()
             message = 'User deleted successfully'
             
@@ -309,66 +373,252 @@ def user_action(request, user_id, action):
             'details': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+BULK_USER_ACTIONS = ('suspend', 'activate', 'delete')
+
+
+def _resolve_bulk_targets(data):
+    """
+    Build the queryset of users targeted by a bulk action, either from an
+    explicit ``user_ids`` list or from a ``filter`` object.
+    """
+    user_ids = data.get('user_ids')
+    if user_ids is not None:
+        if not isinstance(user_ids, list):
+            raise ValueError('user_ids must be a list')
+        try:
+            user_ids = [int(user_id) for user_id in user_ids]
+        except (TypeError, ValueError):
+            raise ValueError('user_ids must contain integers')
+        return User.objects.filter(id__in=user_ids), user_ids
+
+    filters = data.get('filter')
+    if not isinstance(filters, dict) or not filters:
+        raise ValueError('user_ids or filter is required')
+
+    users = User.objects.all()
+    if 'property_id' in filters:
+        try:
+            property_id = int(filters['property_id'])
+        except (TypeError, ValueError):
+            raise ValueError('filter.property_id must be an integer')
+        # Tenants are linked to users by email throughout the admin views
+        users = users.filter(
+            email__in=Tenant.objects.filter(property_id=property_id).values('email')
+        )
+    if 'is_active' in filters:
+        users = users.filter(is_active=_bulk_filter_bool(filters, 'is_active'))
+    if 'is_staff' in filters:
+        users = users.filter(is_staff=_bulk_filter_bool(filters, 'is_staff'))
+    if 'joined_before' in filters:
+        users = users.filter(date_joined__lt=_bulk_filter_datetime(filters, 'joined_before'))
+    if 'joined_after' in filters:
+        users = users.filter(date_joined__gte=_bulk_filter_datetime(filters, 'joined_after'))
+    return users, None
+
+
+def _bulk_filter_bool(filters, name):
+    value = str(filters[name]).lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValueError(f'filter.{name} must be true or false')
+
+
+def _bulk_filter_datetime(filters, name):
+    """An ISO date or datetime; dates mean midnight in the current time zone."""
+    value = filters[name]
+    parsed = None
+    if isinstance(value, str):
+        try:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                day = parse_date(value)
+                parsed = datetime.combine(day, datetime.min.time()) if day else None
+        except ValueError:
+            parsed = None
+    if parsed is None:
+        raise ValueError(f'filter.{name} must be an ISO date or datetime')
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+def bulk_user_action(request):
+    """
+    Apply suspend, activate or delete to many users at once.
+
+    Each action runs as one set-based UPDATE/DELETE on ``User`` and one on
+    ``Tenant`` inside a single transaction. Returns a result per user id.
+    """
+    try:
+        user = request.user
+        if not user.is_staff:
+            return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
+
+        action = request.data.get('action')
+        if action not in BULK_USER_ACTIONS:
+            return Response({'error': 'Invalid action'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            users, requested_ids = _resolve_bulk_targets(request.data)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        targets = list(users.values_list('id', 'email', 'is_staff'))
+        results = {}
+
+        if requested_ids is not None:
+            found_ids = {user_id for user_id, _, _ in targets}
+            for user_id in requested_ids:
+                if user_id not in found_ids:
+                    results[user_id] = {'id': user_id, 'status': 'not_found'}
+
+        eligible = []
+        for user_id, email, is_staff in targets:
+            if action == 'delete' and is_staff:
+                # Don't allow deletion of admin users
+                results[user_id] = {'id': user_id, 'status': 'skipped', 'error': 'Cannot delete admin users'}
+            elif action != 'activate' and user_id == user.id:
+                results[user_id] = {'id': user_id, 'status': 'skipped', 'error': 'Cannot apply this action to yourself'}
+            else:
+                eligible.append((user_id, email))
+
+        eligible_ids = [user_id for user_id, _ in eligible]
+        emails = [email for _, email in eligible if email]
+
+        with transaction.atomic():
+            if action == 'delete':
+                Tenant.objects.filter(email__in=emails).delete()
+                User.objects.filter(id__in=eligible_ids).delete()
+                outcome = 'deleted'
+            else:
+                is_active = action == 'activate'
+                User.objects.filter(id__in=eligible_ids).update(is_active=is_active)
+                # update() bypasses auto_now, so stamp updated_at explicitly
+                Tenant.objects.filter(email__in=emails).update(
+                    active=is_active,
+                    updated_at=timezone.now(),
+                )
+                outcome = 'activated' if is_active else 'suspended'
+
+            # Set-based updates skip model signals, so invalidate cached aggregates here
+            bump_data_version_on_commit()
+            invalidate_profiles(eligible_ids)
+
+            if eligible_ids:
+                activity.record_activity(
+                    'user',
+                    f"Bulk {action.capitalize()}",
+                    f"{len(eligible_ids)} users {outcome}",
+                    status='success' if action == 'activate' else 'warning',
+                    actor=user,
+                    metadata={'user_ids': eligible_ids},
+                )
+
+        for user_id in eligible_ids:
+            results[user_id] = {'id': user_id, 'status': outcome}
+
+        ordered_ids = requested_ids if requested_ids is not None else [t[0] for t in targets]
+        result_list = []
+        seen = set()
+        for user_id in ordered_ids:
+            if user_id not in seen:
+                seen.add(user_id)
+                result_list.append(results[user_id])
+
+        return Response({
+            'success': True,
+            'action': action,
+            'affected_count': len(eligible_ids),
+            'results': result_list,
+        })
+
+    except Exception as e:
+        logger.error(f"Error performing bulk user action: {str(e)}")
+        return Response({
+            'error': 'Failed to perform bulk user action',
+            'details': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def _encode_activity_cursor(entry):
+    raw = f"{entry.created_at.isoformat()}|{entry.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_activity_cursor(cursor):
+    try:
+        created_at, entry_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(created_at), int(entry_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError('Invalid cursor')
+
+
+@query_budget(4)
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def system_activity(request):
     """
-    Get recent system activity logs
+    Get recent system activity logs.
+
+    Supports ``type`` (repeatable or comma separated), ``limit`` and an
+    opaque ``cursor`` returned as ``next_cursor`` by the previous page.
+    Pages are read by keyset on ``(created_at, id)`` so every page costs
+    the same regardless of depth.
     """
     try:
         user = request.user
         if not user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
-        
-        # Simulated activity data (in production, this would come from actual logs)
+
+        try:
+            limit = min(max(int(request.GET.get('limit', 20)), 1), 100)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        entries = ActivityLog.objects.order_by('-created_at', '-id')
+
+        activity_types = [
+            t for value in request.GET.getlist('type') for t in value.split(',') if t
+        ]
+        if activity_types:
+            entries = entries.filter(activity_type__in=activity_types)
+
+        cursor = request.GET.get('cursor')
+        if cursor:
+            try:
+                created_at, entry_id = _decode_activity_cursor(cursor)
+            except ValueError as e:
+                return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            entries = entries.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=entry_id)
+            )
+
+        page = list(entries[:limit + 1])
+        has_more = len(page) > limit
+        page = page[:limit]
+
         activities = [
             {
-                'id': 1,
-                'type': 'user',
-                'title': 'New User Registration',
-                'description': 'John Doe registered as tenant',
-                'timestamp': timezone.now() - timedelta(hours=2),
-                'status': 'success'
-            },
-            {
-                'id': 2,
-                'type': 'payment',
-                'title': 'Payment Received',
-                'description': 'Monthly rent payment from Jane Smith',
-                'timestamp': timezone.now() - timedelta(hours=4),
-                'status': 'success'
-            },
-            {
-                'id': 3,
-                'type': 'maintenance',
-                'title': 'Maintenance Request',
-                'description': 'New plumbing issue reported at Property A',
-                'timestamp': timezone.now() - timedelta(hours=6),
-                'status': 'warning'
-            },
-            {
-                'id': 4,
-                'type': 'user',
-                'title': 'User Suspended',
-                'description': 'Admin suspended user due to policy violation',
-                'timestamp': timezone.now() - timedelta(hours=8),
-                'status': 'warning'
-            },
-            {
-                'id': 5,
-                'type': 'payment',
-                'title': 'Late Payment Alert',
-                'description': 'AI detected high risk of late payment',
-                'timestamp': timezone.now() - timedelta(hours=12),
-                'status': 'warning'
+                'id': entry.id,
+                'type': entry.activity_type,
+                'title': entry.title,
+                'description': entry.description,
+                'timestamp': entry.created_at,
+                'status': entry.status,
+                'metadata': entry.metadata,
             }
+            for entry in page
         ]
-        
+
         return Response({
             'activities': activities,
-            'total_count': len(activities)
+            'total_count': len(activities),
+            'next_cursor': _encode_activity_cursor(page[-1]) if has_more else None,
         })
-        
+
     except Exception as e:
         logger.error(f"Error fetching system activity: {str(e)}")
         return Response({
@@ -376,98 +626,212 @@ def system_activity(request):
             'details': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+class EventStreamRenderer(BaseRenderer):
+    """Lets content negotiation accept ``Accept: text/event-stream`` clients."""
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode(self.charset)
+
+
+# Each open event stream holds a worker thread, so only a few run at once
+# per process; other clients long-poll
+_stream_slots = threading.BoundedSemaphore(getattr(settings, 'DASHBOARD_STREAM_MAX_CONNECTIONS', 2))
+
+
+def _dashboard_event_stream(seq, resumed, max_seconds, heartbeat):
+    """Yield server-sent events from the change feed until ``max_seconds``."""
+    if not _stream_slots.acquire(blocking=False):
+        # EventSource reconnects after ``retry``; clients can long-poll meanwhile
+        yield 'retry: 30000\nevent: busy\ndata: {"mode": "poll"}\n\n'
+        return
+    try:
+        yield 'retry: 3000\n\n'
+        if seq is None:
+            seq = feed.parse_id(feed.last_id)
+            if resumed:
+                # The client's position is unknown to the feed; it must refetch
+                yield f"id: {feed.format_id(seq)}\nevent: reset\ndata: {{}}\n\n"
+        deadline = time.monotonic() + max_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            events, missed, seq = feed.wait(seq, min(heartbeat, remaining))
+            if missed:
+                yield f"event: reset\ndata: {{}}\n\n"
+            if not events:
+                yield ': keepalive\n\n'
+                continue
+            for change in events:
+                yield f"id: {change['id']}\nevent: {change['type']}\ndata: {json.dumps(change['data'])}\n\n"
+    finally:
+        _stream_slots.release()
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
-def analytics_data(request):
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+def dashboard_stream(request):
     """
-    Get comprehensive analytics data for charts and reports
+    Push payment, maintenance and risk score changes to admin dashboards.
+
+    Long-polls by default, returning as soon as a change newer than
+    ``last_event_id`` arrives or ``timeout`` seconds (default 10, max 30)
+    pass. ``?mode=stream`` or ``Accept: text/event-stream`` streams
+    server-sent events instead for up to ``DASHBOARD_STREAM_MAX_SECONDS``;
+    each stream holds a worker thread, so at most
+    ``DASHBOARD_STREAM_MAX_CONNECTIONS`` run per process and further clients
+    get a ``busy`` event telling them to poll. Clients resume with the
+    ``Last-Event-ID`` header or ``last_event_id`` parameter; a ``reset``
+    event means the client should refetch the full dashboard payloads.
     """
     try:
         user = request.user
         if not user.is_staff:
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
-        
-        # Revenue trends (last 6 months)
-        revenue_data = []
-        for i in range(6):
-            month_start = (timezone.now() - timedelta(days=30*i)).replace(day=1)
-            month_end = month_start + timedelta(days=32)
-            month_end = month_end.replace(day=1) - timedelta(days=1)
-            
-            revenue = Payment.objects.filter(
-                status='paid',
-                payment_date__gte=month_start,
-                payment_date__lte=month_end
-            ).aggregate(total=Sum('amount'))['total'] or 0
-            
-            revenue_data.append({
-                'month': month_start.strftime('%b'),
-                'revenue': float(revenue)
+
+        last_event_id = request.META.get('HTTP_LAST_EVENT_ID') or request.GET.get('last_event_id')
+        seq = feed.parse_id(last_event_id)
+
+        streaming = request.GET.get('mode') == 'stream' or request.accepted_renderer.format == 'event-stream'
+        if not streaming:
+            try:
+                timeout = min(max(float(request.GET.get('timeout', 10)), 0), 30)
+            except ValueError:
+                return Response({'error': 'timeout must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+            if seq is None:
+                return Response({
+                    'events': [],
+                    'last_event_id': feed.last_id,
+                    'reset': bool(last_event_id),
+                })
+            events, missed, seq = feed.wait(seq, timeout)
+            return Response({
+                'events': events,
+                'last_event_id': feed.format_id(seq),
+                'reset': missed,
             })
-        
-        revenue_data.reverse()
-        
-        # Occupancy trends
-        occupancy_data = []
-        for i in range(6):
-            month_start = (timezone.now() - timedelta(days=30 * i)).replace(day=1)
-            month_end = month_start + timedelta(days=32)
-            month_end = month_end.replace(day=1) - timedelta(days=1)
-
-            total_props = Property.objects.count()
-            # Treat properties marked as unavailable as occupied during this window
-            occupied_props = Property.objects.filter(
-                available=False,
-                updated_at__gte=month_start,
-                updated_at__lte=month_end,
-            ).count()
-
-            occupancy_rate = (occupied_props / total_props * 100) if total_props > 0 else 0
-
-            occupancy_data.append(
-                {
-                    'month': month_start.strftime('%b'),
-                    'occupancy': round(occupancy_rate, 1),
-                }
-            )
-        
-        occupancy_data.reverse()
-        
-        # Tenant performance distribution
-        tenant_performance = {
-            'excellent': Tenant.objects.filter(payment_reliability_score__gt=8.0).count(),
-            'good': Tenant.objects.filter(payment_reliability_score__gt=6.0, payment_reliability_score__lte=8.0).count(),
-            'average': Tenant.objects.filter(payment_reliability_score__gt=4.0, payment_reliability_score__lte=6.0).count(),
-            'poor': Tenant.objects.filter(payment_reliability_score__lte=4.0).count()
-        }
-        
-        # Property performance
-        property_performance = []
-        for prop in Property.objects.all()[:10]:  # Top 10 properties
-            total_revenue = (
-                Payment.objects.filter(
-                    property=prop,
-                    status='paid',
-                ).aggregate(total=Sum('amount'))['total']
-                or 0
-            )
 
-            property_performance.append(
-                {
-                    'name': prop.name,
-                    'revenue': float(total_revenue),
-                    # Occupancy is 100% when the property is currently not available
-                    'occupancy': 100 if not prop.available else 0,
-                    'price': float(prop.price),
-                }
-            )
-        
+        response = StreamingHttpResponse(
+            _dashboard_event_stream(
+                seq,
+                resumed=bool(last_event_id),
+                max_seconds=getattr(settings, 'DASHBOARD_STREAM_MAX_SECONDS', 60),
+                heartbeat=getattr(settings, 'DASHBOARD_STREAM_HEARTBEAT_SECONDS', 15),
+            ),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    except Exception as e:
+        logger.error(f"Error opening dashboard stream: {str(e)}")
         return Response({
-            'revenue_trends': revenue_data,
-            'occupancy_trends': occupancy_data,
-            'tenant_performance': tenant_performance,
-            'property_performance': property_performance
+            'error': 'Failed to open dashboard stream',
+            'details': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def _analytics_data_payload():
+    """Build the analytics payload for charts and reports"""
+    # Revenue trends (last 6 months)
+    revenue_data = []
+    for i in range(6):
+        month_start = (timezone.now() - timedelta(days=30*i)).replace(day=1)
+        month_end = month_start + timedelta(days=32)
+        month_end = month_end.replace(day=1) - timedelta(days=1)
+        
+        revenue = Payment.objects.filter(
+            status='paid',
+            payment_date__gte=month_start,
+            payment_date__lte=month_end
+        ).aggregate(total=Sum('amount'))['total'] or 0
+        
+        revenue_data.append({
+            'month': month_start.strftime('%b'),
+            'revenue': float(revenue)
         })
+    
+    revenue_data.reverse()
+    
+    # Occupancy trends
+    occupancy_data = []
+    total_props = Property.objects.count()
+    for i in range(6):
+        month_start = (timezone.now() - timedelta(days=30 * i)).replace(day=1)
+        month_end = month_start + timedelta(days=32)
+        month_end = month_end.replace(day=1) - timedelta(days=1)
+
+        # Treat properties marked as unavailable as occupied during this window
+        occupied_props = Property.objects.filter(
+            available=False,
+            updated_at__gte=month_start,
+            updated_at__lte=month_end,
+        ).count()
+
+        occupancy_rate = (occupied_props / total_props * 100) if total_props > 0 else 0
+
+        occupancy_data.append(
+            {
+                'month': month_start.strftime('%b'),
+                'occupancy': round(occupancy_rate, 1),
+            }
+        )
+    
+    occupancy_data.reverse()
+    
+    # Tenant performance distribution
+    tenant_performance = Tenant.objects.aggregate(
+        excellent=Count('id', filter=Q(payment_reliability_score__gt=8.0)),
+        good=Count('id', filter=Q(payment_reliability_score__gt=6.0, payment_reliability_score__lte=8.0)),
+        average=Count('id', filter=Q(payment_reliability_score__gt=4.0, payment_reliability_score__lte=6.0)),
+        poor=Count('id', filter=Q(payment_reliability_score__lte=4.0)),
+    )
+    
+    # Property performance
+    properties = list(Property.objects.all()[:10])  # Top 10 properties
+    revenue_by_property = dict(
+        Payment.objects.filter(property__in=properties, status='paid')
+        .values('property_id').annotate(total=Sum('amount')).values_list('property_id', 'total')
+    )
+    property_performance = []
+    for prop in properties:
+        total_revenue = revenue_by_property.get(prop.pk) or 0
+
+        property_performance.append(
+            {
+                'name': prop.name,
+                'revenue': float(total_revenue),
+                # Occupancy is 100% when the property is currently not available
+                'occupancy': 100 if not prop.available else 0,
+                'price': float(prop.price),
+            }
+        )
+    
+    return {
+        'revenue_trends': revenue_data,
+        'occupancy_trends': occupancy_data,
+        'tenant_performance': tenant_performance,
+        'property_performance': property_performance
+    }
+
+
+@query_budget(18)
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def analytics_data(request):
+    """
+    Get comprehensive analytics data for charts and reports
+    """
+    try:
+        user = request.user
+        if not user.is_staff:
+            return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
+        
+        return prewarm.payload_response(prewarm.get_payload('analytics_data'))
         
     except Exception as e:
         logger.error(f"Error fetching analytics data: {str(e)}")
@@ -504,3 +868,98 @@ def system_configuration(request):
             'error': 'Failed to update system configuration',
             'details': str(e)
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAuthenticated])
+@parser_classes([MultiPartParser, FormParser])
+def bulk_import(request, kind):
+    """
+    Import properties, tenants or payments from an uploaded CSV or JSONL
+    ``file``. Rows are streamed and inserted in chunks; the response reports
+    how many rows were created and the errors for rows that were rejected.
+    """
+    try:
+        user = request.user
+        if not user.is_staff:
+            return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
+
+        if kind not in IMPORT_FIELDS:
+            return Response({'error': 'Unknown import type'}, status=status.HTTP_404_NOT_FOUND)
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'A file upload is required'}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.data.get('format') or detect_format(upload.name)
+        if fmt not in FORMATS:
+            return Response({'error': 'Invalid format', 'details': f"Expected one of {', '.join(FORMATS)}"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            chunk_size = int(request.data.get('chunk_size', DEFAULT_CHUNK_SIZE))
+        except (TypeError, ValueError):
+            chunk_size = 0
+        if not 1 <= chunk_size <= 10000:
+            return Response({'error': 'chunk_size must be between 1 and 10000'}, status=status.HTTP_400_BAD_REQUEST)
+
+        importer = Importer(kind, chunk_size=chunk_size, owner=user)
+        try:
+            summary = importer.run(iter_records(upload.file, fmt))
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Rows before the unreadable part have already been imported
+            summary = importer.summary()
+            summary['aborted'] = f"Could not read file: {str(e)}"
+        return Response(summary, status=status.HTTP_201_CREATED if summary['created'] else status.HTTP_200_OK)
+
+    except Exception as e:
+        logger.error(f"Error importing {kind}: {str(e)}")
+        return Response({
+            'error': 'Failed to import data',
+            'details': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+@renderer_classes([CSVRenderer, JSONLinesRenderer])
+def export_data(request, kind):
+    """
+    Stream the payment ledger or tenant register as CSV (default) or JSONL
+    (``?format=jsonl`` or ``Accept: application/x-ndjson``), optionally
+    gzipped with ``?gzip=1``. Accepts the same filters as the list endpoints.
+    """
+    try:
+        user = request.user
+        if not user.is_staff:
+            return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
+
+        if kind not in EXPORTS:
+            return Response({'error': 'Unknown export type'}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            headers, rows = export_queryset(kind, request)
+        except ValidationError as e:
+            return Response({'error': 'Invalid filter', 'details': e.detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        renderer = request.accepted_renderer
+        chunks = jsonl_stream(headers, rows) if renderer.format == 'jsonl' else csv_stream(headers, rows)
+        filename = f"{kind}-{timezone.now():%Y%m%d}.{renderer.format}"
+        content_type = f"{renderer.media_type}; charset=utf-8"
+        if request.GET.get('gzip') in ('1', 'true', 'yes'):
+            chunks = gzip_stream(chunks)
+            filename += '.gz'
+            content_type = 'application/gzip'
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    except Exception as e:
+        logger.error(f"Error exporting {kind}: {str(e)}")
+        return Response({
+            'error': 'Failed to export data',
+            'details': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+# Expensive dashboard payloads served through the stale-while-revalidate cache
+prewarm.register_payload('dashboard_stats', _dashboard_stats_payload)
+prewarm.register_payload('ai_insights', _ai_insights_payload)
+prewarm.register_payload('analytics_data', _analytics_data_payload)
@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+
+
+class ApiConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'api'
+
+    def ready(self):
+        # Register model signal handlers
+        from . import signals  # noqa: F401
+        from django.db.backends.signals import connection_created
+        from .sqlite_tuning import configure_connection
+        connection_created.connect(configure_connection, dispatch_uid='api.sqlite_tuning')
+        from django.core import checks
+        from .versioning import check_shared_cache
+        checks.register(check_shared_cache, checks.Tags.caches)
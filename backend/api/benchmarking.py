@@ -0,0 +1,126 @@
+"""
+Helpers shared by the ``bench_*`` management commands.
+
+Benchmarks never touch the configured database: they run against a
+throwaway test database created for the duration of the run.
+"""
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+
+
+@contextmanager
+def benchmark_database(keepdb=False, test_name=None):
+    """
+    Create a throwaway test database and remove it afterwards. ``test_name``
+    overrides the test database name, e.g. to benchmark SQLite on a file
+    rather than in memory.
+    """
+    setup_test_environment()
+    old_name = connection.settings_dict['NAME']
+    test_settings = connection.settings_dict.setdefault('TEST', {})
+    old_test_name = test_settings.get('NAME')
+    if test_name is not None:
+        test_settings['NAME'] = test_name
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        test_settings['NAME'] = old_test_name
+        teardown_test_environment()
+
+
+@contextmanager
+def without_background_work():
+    """
+    Stop the in-process dashboard refresher for the block, so dashboard
+    payloads are computed by the requests being measured and nothing writes
+    concurrently on another connection.
+    """
+    from . import prewarm
+
+    with override_settings(DASHBOARD_PREWARM_IN_PROCESS=False):
+        prewarm.stop_refresher()
+        yield
+
+
+def time_call(func, repeat=5, warmup=1):
+    """Run ``func`` and return timing stats in milliseconds."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'min_ms': round(samples[0], 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'max_ms': round(samples[-1], 3),
+    }
+
+
+def percentile(samples, fraction):
+    """The ``fraction`` (0-1) nearest-rank percentile of ``samples``; 0.0 when empty."""
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+def latency_summary(samples):
+    """p50/p95/p99/mean of ``samples`` (milliseconds), rounded for a baseline file."""
+    return {
+        'p50_ms': round(percentile(samples, 0.50), 3),
+        'p95_ms': round(percentile(samples, 0.95), 3),
+        'p99_ms': round(percentile(samples, 0.99), 3),
+        'mean_ms': round(statistics.fmean(samples), 3) if samples else 0.0,
+    }
+
+
+def compare_to_baseline(baseline, current, threshold=0.2, noise_ms=1.0):
+    """
+    Regressions in ``current`` against ``baseline`` (both as written by
+    ``bench_endpoints``), as ``[(name, message)]``.
+
+    An endpoint regresses when its p95 latency grows by more than
+    ``threshold`` (a fraction) and by more than ``noise_ms``, when it runs
+    more queries than before (warm or cold), or when its status code
+    changes. An AI scoring path regresses when its throughput drops by more
+    than ``threshold`` or it runs more queries per item. Anything in the
+    baseline that this run did not measure is reported too.
+    """
+    regressions = []
+    for name, before in baseline.get('endpoints', {}).items():
+        after = current.get('endpoints', {}).get(name)
+        if after is None:
+            regressions.append((name, "missing from this run"))
+            continue
+        if after['status'] != before['status']:
+            regressions.append((name, f"status {before['status']} -> {after['status']}"))
+        growth = after['p95_ms'] - before['p95_ms']
+        if growth > noise_ms and after['p95_ms'] > before['p95_ms'] * (1 + threshold):
+            regressions.append((name, f"p95 {before['p95_ms']}ms -> {after['p95_ms']}ms"))
+        if after['queries'] > before['queries']:
+            regressions.append((name, f"queries {before['queries']} -> {after['queries']}"))
+        # Cached endpoints only do their real work on the cold request
+        if after['cold_queries'] > before.get('cold_queries', after['cold_queries']):
+            regressions.append((name, f"cold queries {before['cold_queries']} -> {after['cold_queries']}"))
+
+    for name, before in baseline.get('ai', {}).items():
+        after = current.get('ai', {}).get(name)
+        if after is None:
+            regressions.append((name, "missing from this run"))
+            continue
+        if after['items_per_s'] < before['items_per_s'] * (1 - threshold):
+            regressions.append((name, f"throughput {before['items_per_s']}/s -> {after['items_per_s']}/s"))
+        if after['queries_per_item'] > before['queries_per_item']:
+            regressions.append((
+                name, f"queries per item {before['queries_per_item']} -> {after['queries_per_item']}",
+            ))
+    return regressions
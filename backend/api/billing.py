@@ -0,0 +1,114 @@
+"""
+Monthly rent invoice generation.
+
+``generate_rent_invoices`` creates one pending rent Payment per active
+tenant for a billing period with chunked ``bulk_create``. The
+``payment_unique_rent_period`` constraint makes it idempotent: rows that
+already exist are skipped by the database, so re-running after a partial
+failure only fills in what is missing.
+"""
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .activity import record_activity
+from .ledger import recompute_balances
+from .models import Tenant, Payment
+from .versioning import bump_data_version_on_commit
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def parse_period(value):
+    """
+    Return the first day of the month for ``value`` ('YYYY-MM', an ISO date
+    or a date). Defaults to the current month. Raises ValueError.
+    """
+    if not value:
+        return timezone.now().date().replace(day=1)
+    if isinstance(value, date):
+        return value.replace(day=1)
+    value = str(value).strip()
+    parsed = parse_date(f"{value}-01" if len(value) == 7 else value)
+    if parsed is None:
+        raise ValueError(f"Invalid billing period: {value}")
+    return parsed.replace(day=1)
+
+
+def _rent_payments_for(period):
+    return Payment.objects.filter(payment_type='rent', billing_period=period)
+
+
+def generate_rent_invoices(period, due_day=1, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Create the rent payments for ``period`` and return a summary dict.
+
+    Each chunk is inserted in its own transaction, so a failure part way
+    through keeps the chunks already written.
+    """
+    if not 1 <= due_day <= 28:
+        raise ValueError("due_day must be between 1 and 28")
+    due_date = period + timedelta(days=due_day - 1)
+    notes = f"Rent for {period:%B %Y}"
+
+    tenants = Tenant.objects.filter(active=True, monthly_rent__gt=0)
+    eligible = tenants.filter(property__isnull=False)
+    pending = eligible.exclude(
+        id__in=_rent_payments_for(period).values('tenant_id')
+    ).order_by('id').values_list('id', 'property_id', 'monthly_rent')
+
+    existing_before = _rent_payments_for(period).count()
+    batch = []
+
+    def write(rows):
+        with transaction.atomic():
+            Payment.objects.bulk_create(
+                [
+                    Payment(
+                        tenant_id=tenant_id,
+                        property_id=property_id,
+                        amount=monthly_rent,
+                        due_date=due_date,
+                        status='pending',
+                        payment_type='rent',
+                        billing_period=period,
+                        notes=notes,
+                    )
+                    for tenant_id, property_id, monthly_rent in rows
+                ],
+                # Rows created by a concurrent run are skipped, not duplicated
+                ignore_conflicts=True,
+            )
+            # bulk_create skips the signal that maintains Tenant.balance
+            recompute_balances([tenant_id for tenant_id, _, _ in rows])
+
+    for row in pending.iterator(chunk_size=batch_size):
+        batch.append(row)
+        if len(batch) >= batch_size:
+            write(batch)
+            batch = []
+    if batch:
+        write(batch)
+
+    created = _rent_payments_for(period).count() - existing_before
+    summary = {
+        'period': period.isoformat(),
+        'due_date': due_date.isoformat(),
+        'eligible_tenants': eligible.count(),
+        'created': created,
+        'already_invoiced': existing_before,
+        'skipped_without_property': tenants.filter(property__isnull=True).count(),
+    }
+    if created:
+        # bulk_create skips model signals
+        bump_data_version_on_commit()
+        record_activity(
+            'payment',
+            'Rent Invoices Generated',
+            f"{created} rent payments created for {period:%B %Y}",
+            status='success',
+            metadata=summary,
+        )
+    return summary
@@ -0,0 +1,124 @@
+"""
+Change feed used to push live deltas to admin dashboards.
+
+Model signal handlers publish small events once their transaction commits.
+Events are numbered by a counter in the default cache and stored there, so
+with a shared cache (Redis via ``REDIS_URL``) a reader sees the events of
+every worker process, not only the one serving it. Readers check the
+counter every ``CHANGEFEED_POLL_INTERVAL`` seconds until something newer
+than their last seen event id arrives, so waiting connections cost a cache
+read and no queries.
+"""
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class ChangeFeed:
+    """Bounded, sequence-numbered log of recent change events."""
+
+    def __init__(self, name='changefeed', maxlen=1000):
+        self.name = name
+        self.maxlen = maxlen
+
+    def _key(self, suffix):
+        return f"{self.name}:{suffix}"
+
+    @property
+    def epoch(self):
+        # Event ids are prefixed with an epoch kept next to the counter, so a
+        # client resuming after the cache was cleared can tell its position
+        # is meaningless.
+        epoch = cache.get(self._key('epoch'))
+        if epoch is None:
+            cache.add(self._key('epoch'), uuid.uuid4().hex[:8], timeout=None)
+            epoch = cache.get(self._key('epoch'))
+        return epoch
+
+    def _current(self):
+        return cache.get(self._key('seq'), 0)
+
+    @property
+    def last_id(self):
+        return self.format_id(self._current())
+
+    def format_id(self, seq, epoch=None):
+        return f"{epoch or self.epoch}-{seq}"
+
+    def parse_id(self, event_id):
+        """Return the sequence number for ``event_id`` or None if it is stale."""
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.partition('-')
+        if epoch != self.epoch:
+            return None
+        try:
+            seq = int(seq)
+        except ValueError:
+            return None
+        return seq if seq <= self._current() else None
+
+    def publish(self, event_type, data):
+        self.epoch  # created before the first sequence number
+        try:
+            seq = cache.incr(self._key('seq'))
+        except ValueError:
+            cache.add(self._key('seq'), 0, timeout=None)
+            seq = cache.incr(self._key('seq'))
+        timeout = getattr(settings, 'CHANGEFEED_EVENT_TIMEOUT', 3600)
+        cache.set(self._key(f"event:{seq}"), (event_type, data), timeout)
+        # Readers never look further back, so the cache holds at most maxlen events
+        cache.delete(self._key(f"event:{seq - self.maxlen}"))
+        return seq
+
+    def publish_on_commit(self, event_type, data):
+        transaction.on_commit(lambda: self.publish(event_type, data))
+
+    def _since(self, seq, current):
+        """
+        Events after ``seq`` up to ``current``, whether any were dropped and
+        the sequence number to resume from.
+        """
+        if current < seq:
+            # The counter restarted (cleared cache); the position is lost
+            return [], True, current
+        first = max(seq + 1, current - self.maxlen + 1)
+        missed = first > seq + 1
+        keys = {n: self._key(f"event:{n}") for n in range(first, current + 1)}
+        found = cache.get_many(keys.values())
+        if keys and keys[current] not in found:
+            # The newest event may be between its counter bump and its write
+            time.sleep(0.05)
+            found.update(cache.get_many([keys[current]]))
+        epoch = self.epoch
+        events = []
+        for n, key in keys.items():
+            if key not in found:
+                # Expired or never written: the reader has to refetch
+                missed = True
+                continue
+            event_type, data = found[key]
+            events.append({'id': self.format_id(n, epoch), 'type': event_type, 'data': data})
+        return events, missed, current
+
+    def wait(self, seq, timeout):
+        """
+        Wait until events newer than ``seq`` exist or ``timeout`` expires.
+        Returns ``(events, missed, seq)``: the events as ``id``/``type``/
+        ``data`` dicts, whether older ones were dropped and the sequence
+        number to resume from.
+        """
+        interval = getattr(settings, 'CHANGEFEED_POLL_INTERVAL', 0.5)
+        deadline = time.monotonic() + timeout
+        while True:
+            current = self._current()
+            remaining = deadline - time.monotonic()
+            if current != seq or remaining <= 0:
+                return self._since(seq, current)
+            time.sleep(min(interval, remaining))
+
+
+feed = ChangeFeed()
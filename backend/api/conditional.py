@@ -0,0 +1,70 @@
+"""
+Strong ETags for API resources derived from change watermarks.
+
+A detail tag covers the row's primary key and ``updated_at``; a list tag
+covers the ids and latest ``updated_at`` of the rows on the requested page
+and whether pages follow or precede it. Both include everything else that
+shapes the body (path and query string, user, media type). A list tag is
+read with the page's own keyset query, never an aggregate over the whole
+filtered table, so deep pages and their 304s cost the same as the first.
+"""
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.http import parse_etags, quote_etag
+
+
+def queryset_watermark(queryset):
+    """Row count, max primary key and max ``updated_at`` for ``queryset``."""
+    return queryset.order_by().aggregate(
+        count=Count('pk'),
+        max_id=Max('pk'),
+        updated=Max('updated_at'),
+    )
+
+
+def page_watermark(paginator, queryset, request, view):
+    """
+    Ids and latest ``updated_at`` of the rows ``paginator`` serves from
+    ``queryset`` for this request, or None if the view does not paginate.
+    """
+    ordering = paginator.get_ordering(request, queryset, view)
+    columns = {queryset.model._meta.pk.attname, 'updated_at', *(field.lstrip('-') for field in ordering)}
+    rows = paginator.paginate_queryset(queryset.values(*columns), request, view)
+    if rows is None:
+        return None
+    return {
+        'ids': [row[queryset.model._meta.pk.attname] for row in rows],
+        'updated': max((row['updated_at'] for row in rows), default=None),
+        'has_next': paginator.has_next,
+        'has_previous': paginator.has_previous,
+        'total': getattr(paginator, 'approximate_total', None),
+    }
+
+
+def _etag_part(value):
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return '' if value is None else str(value)
+
+
+def compute_etag(request, watermark):
+    parts = [
+        request.get_full_path(),
+        str(request.user.pk),
+        getattr(request, 'accepted_media_type', '') or '',
+    ]
+    parts.extend(f"{name}={_etag_part(value)}" for name, value in sorted(watermark.items()))
+    return quote_etag(hashlib.sha1('|'.join(parts).encode()).hexdigest())
+
+
+def etag_matches(request, etag):
+    """True if the request's ``If-None-Match`` header matches ``etag``."""
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    if etags == ['*']:
+        return True
+    # If-None-Match uses weak comparison, and compressing proxies weaken tags
+    return any(tag.removeprefix('W/') == etag for tag in etags)
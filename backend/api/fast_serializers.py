@@ -0,0 +1,143 @@
+"""
+Read-only fast path for rendering large list responses.
+
+A ``ValuesPlan`` is compiled once per request from a ModelSerializer: it
+lists the columns to fetch with ``.values()`` and one precompiled transform
+per output field. Rendering a row is then a dict lookup plus a cheap
+conversion per field instead of DRF's per-field ``get_attribute`` and
+``to_representation`` machinery. The output renders to exactly the same
+JSON as the serializer it was compiled from.
+"""
+import decimal
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+# Field classes whose to_representation() returns plain DB values unchanged
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class _Row:
+    """Attribute view over a values() dict, handed to SerializerMethodFields."""
+
+
+def _decimal_transform(field):
+    if (
+        field.decimal_places is None
+        or field.normalize_output
+        or field.localize
+        or not getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+    ):
+        return field.to_representation
+    exponent = decimal.Decimal('.1') ** field.decimal_places
+    context = decimal.getcontext().copy()
+    if field.max_digits is not None:
+        context.prec = field.max_digits
+    rounding = field.rounding
+
+    def transform(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return f'{value.quantize(exponent, rounding=rounding, context=context):f}'
+    return transform
+
+
+def _datetime_transform(field):
+    if getattr(field, 'format', api_settings.DATETIME_FORMAT).lower() != 'iso-8601':
+        return field.to_representation
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if field_timezone is None:
+        return field.to_representation
+
+    def transform(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return transform
+
+
+def _date_transform(field):
+    if getattr(field, 'format', api_settings.DATE_FORMAT).lower() != 'iso-8601':
+        return field.to_representation
+    return lambda value: value.isoformat()
+
+
+def _field_transform(field):
+    """Return a callable for non-empty values, or None to pass them through."""
+    if isinstance(field, serializers.DecimalField):
+        return _decimal_transform(field)
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime_transform(field)
+    if isinstance(field, serializers.DateField):
+        return _date_transform(field)
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return None
+    if isinstance(field, serializers.JSONField) and not field.binary:
+        return None
+    return field.to_representation
+
+
+class ValuesPlan:
+    """Columns to fetch and per-field transforms for one serializer."""
+
+    def __init__(self, columns, steps):
+        self.columns = columns
+        self.steps = steps
+
+    def render(self, rows):
+        steps = self.steps
+        output = []
+        append = output.append
+        for row in rows:
+            item = {}
+            for name, key, transform, method in steps:
+                if method is not None:
+                    obj = _Row()
+                    obj.__dict__ = row
+                    item[name] = method(obj)
+                    continue
+                value = row[key]
+                if value is None or transform is None:
+                    item[name] = value
+                else:
+                    item[name] = transform(value)
+            append(item)
+        return output
+
+
+def compile_values_plan(serializer):
+    """
+    Compile ``serializer`` (an unbound ModelSerializer instance) into a
+    ValuesPlan, or return None if a field cannot be read from ``.values()``.
+    """
+    model = serializer.Meta.model
+    concrete = {f.name for f in model._meta.concrete_fields}
+    field_columns = getattr(serializer, 'field_columns', {})
+    columns = {model._meta.pk.name}
+    steps = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField):
+            if name not in field_columns:
+                return None
+            columns.update(field_columns[name])
+            steps.append((name, None, None, getattr(serializer, field.method_name)))
+            continue
+        source = field.source
+        if '.' in source or source not in concrete or isinstance(field, serializers.FileField):
+            # Nested sources and file URLs need model instances
+            return None
+        columns.add(source)
+        steps.append((name, source, _field_transform(field), None))
+    return ValuesPlan(columns, steps)
@@ -0,0 +1,78 @@
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import models
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+LOOKUP_SUFFIXES = ('in', 'gte', 'lte', 'gt', 'lt', 'exact')
+TRUE_VALUES = ('1', 'true', 'yes')
+FALSE_VALUES = ('0', 'false', 'no')
+
+
+class QueryParamFilter(BaseFilterBackend):
+    """
+    Filter a viewset's queryset from whitelisted query parameters.
+
+    Views declare ``filter_params`` as a mapping of query parameter to ORM
+    lookup, e.g. ``{'status': 'status__in', 'due_after': 'due_date__gte'}``.
+    Only those lookups are applied, and each one is backed by an index (see
+    ``Meta.indexes`` on the models; ``check_query_plans`` checks every one
+    with the ``-id`` cursor page). ``__in`` lookups take comma separated
+    values. Invalid values are rejected with a 400.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filter_params = getattr(view, 'filter_params', None) or {}
+        filters = {}
+        for param, lookup in filter_params.items():
+            raw = request.query_params.get(param)
+            if raw is None or raw == '':
+                continue
+            filters[lookup] = self.parse_value(queryset.model, lookup, param, raw)
+        return queryset.filter(**filters) if filters else queryset
+
+    def parse_value(self, model, lookup, param, raw):
+        parts = lookup.split('__')
+        suffix = parts[-1] if len(parts) > 1 and parts[-1] in LOOKUP_SUFFIXES else None
+        field = self._resolve_field(model, parts[:-1] if suffix else parts)
+        if suffix == 'in':
+            return [self._to_python(field, param, value.strip()) for value in raw.split(',') if value.strip()]
+        return self._to_python(field, param, raw)
+
+    def _resolve_field(self, model, names):
+        field = None
+        for name in names:
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                raise ValidationError({name: 'Unknown filter field'})
+            if field.is_relation and field.related_model is not None:
+                model = field.related_model
+        if field.is_relation:
+            # Filtering on a relation compares against its primary key
+            return field.target_field
+        return field
+
+    def _to_python(self, field, param, value):
+        if isinstance(field, models.BooleanField):
+            lowered = value.lower()
+            if lowered in TRUE_VALUES:
+                return True
+            if lowered in FALSE_VALUES:
+                return False
+            raise ValidationError({param: 'Expected true or false'})
+        try:
+            return field.to_python(value)
+        except DjangoValidationError as e:
+            raise ValidationError({param: e.messages})
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': param,
+                'required': False,
+                'in': 'query',
+                'description': f"Filter on {lookup}",
+                'schema': {'type': 'string'},
+            }
+            for param, lookup in (getattr(view, 'filter_params', None) or {}).items()
+        ]
@@ -0,0 +1,220 @@
+"""
+Full-text search over properties, tenants and maintenance requests.
+
+Documents live in one ``api_search_index`` table: an FTS5 virtual table on
+SQLite, and a table with a generated, GIN-indexed ``tsvector`` on
+PostgreSQL. Each document has a title (ranked highest), a body and a short
+summary that is returned with results, so a search never touches the model
+tables. Signal handlers keep documents in sync on save and delete, bulk
+inserts call ``index_objects``, and ``manage.py rebuild_search_index``
+rebuilds everything.
+
+Document ids pack the kind into the low bits (``object_id * 4 + code``), so
+updates and deletes are primary-key lookups on both backends.
+"""
+import re
+
+from django.db import connection as default_connection
+
+TABLE = 'api_search_index'
+SUPPORTED_VENDORS = ('sqlite', 'postgresql')
+MAX_TERMS = 8
+KIND_CODES = {'property': 1, 'tenant': 2, 'maintenance': 3}
+
+SQLITE_SCHEMA = [
+    f"CREATE VIRTUAL TABLE {TABLE} USING fts5("
+    "kind UNINDEXED, object_id UNINDEXED, title, body, summary UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+]
+POSTGRES_SCHEMA = [
+    f"CREATE TABLE {TABLE} ("
+    "doc_id bigint PRIMARY KEY, kind varchar(20) NOT NULL, object_id integer NOT NULL, "
+    "title text NOT NULL, body text NOT NULL, summary text NOT NULL, "
+    "document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')"
+    ") STORED)",
+    f"CREATE INDEX {TABLE}_document_idx ON {TABLE} USING GIN (document)",
+]
+
+
+def _digits(value):
+    return re.sub(r'\D', '', value or '')
+
+
+def _property_document(obj):
+    return obj.name, f"{obj.location} {obj.property_type}", obj.location
+
+
+def _tenant_document(obj):
+    email = obj.email or ''
+    phone = obj.phone or ''
+    # Index the email and phone whole and in parts so partial input matches
+    body = ' '.join([email, re.sub(r'[@.+_-]', ' ', email), phone, _digits(phone)])
+    return f"{obj.first_name} {obj.last_name}", body, email
+
+
+def _maintenance_document(obj):
+    issue = obj.issue_description or ''
+    title = issue.splitlines()[0][:120] if issue.strip() else ''
+    body = ' '.join([issue, obj.resolution_notes or '', obj.category or '', obj.vendor_name or ''])
+    return title, body, obj.status
+
+
+# model_name -> (kind, document builder, fields the document is built from)
+DOCUMENTS = {
+    'property': ('property', _property_document, {'name', 'location', 'property_type'}),
+    'tenant': ('tenant', _tenant_document, {'first_name', 'last_name', 'email', 'phone'}),
+    'maintenancerequest': ('maintenance', _maintenance_document, {
+        'issue_description', 'resolution_notes', 'category', 'vendor_name', 'status',
+    }),
+}
+
+
+def is_supported(connection=None):
+    return (connection or default_connection).vendor in SUPPORTED_VENDORS
+
+
+def is_indexed(model):
+    return model._meta.model_name in DOCUMENTS
+
+
+def needs_reindex(model, update_fields):
+    """False when a save only touched fields the document is not built from."""
+    if update_fields is None:
+        return True
+    return bool(DOCUMENTS[model._meta.model_name][2] & set(update_fields))
+
+
+def _doc_id(kind, object_id):
+    return object_id * 4 + KIND_CODES[kind]
+
+
+def _key_column(connection):
+    return 'rowid' if connection.vendor == 'sqlite' else 'doc_id'
+
+
+def create_index(connection=None):
+    connection = connection or default_connection
+    statements = SQLITE_SCHEMA if connection.vendor == 'sqlite' else POSTGRES_SCHEMA
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def drop_index(connection=None):
+    with (connection or default_connection).cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+
+
+def index_objects(objects, connection=None):
+    """Insert or replace the documents for ``objects`` (instances of indexed models)."""
+    connection = connection or default_connection
+    if not is_supported(connection):
+        return
+    rows = []
+    for obj in objects:
+        kind, build, _ = DOCUMENTS[obj._meta.model_name]
+        title, body, summary = build(obj)
+        rows.append((_doc_id(kind, obj.pk), kind, obj.pk, title, body, summary or ''))
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            # FTS5 has no upsert; rowid lookups keep the delete cheap
+            cursor.execute(
+                f"DELETE FROM {TABLE} WHERE rowid IN ({', '.join(['%s'] * len(rows))})",
+                [row[0] for row in rows],
+            )
+            cursor.executemany(
+                f"INSERT INTO {TABLE} (rowid, kind, object_id, title, body, summary) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                rows,
+            )
+        else:
+            cursor.executemany(
+                f"INSERT INTO {TABLE} (doc_id, kind, object_id, title, body, summary) "
+                "VALUES (%s, %s, %s, %s, %s, %s) ON CONFLICT (doc_id) DO UPDATE SET "
+                "title = EXCLUDED.title, body = EXCLUDED.body, summary = EXCLUDED.summary",
+                rows,
+            )
+
+
+def remove_objects(model, pks, connection=None):
+    connection = connection or default_connection
+    if not is_supported(connection) or not pks:
+        return
+    kind = DOCUMENTS[model._meta.model_name][0]
+    doc_ids = [_doc_id(kind, pk) for pk in pks]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {TABLE} WHERE {_key_column(connection)} IN ({', '.join(['%s'] * len(doc_ids))})",
+            doc_ids,
+        )
+
+
+def rebuild_index(models, connection=None, batch_size=1000):
+    """Replace every document of ``models``. Returns the number indexed."""
+    connection = connection or default_connection
+    if not is_supported(connection):
+        return 0
+    indexed = 0
+    for model in models:
+        kind = DOCUMENTS[model._meta.model_name][0]
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE kind = %s", [kind])
+        batch = []
+        for obj in model.objects.order_by().iterator(chunk_size=batch_size):
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                index_objects(batch, connection)
+                indexed += len(batch)
+                batch = []
+        index_objects(batch, connection)
+        indexed += len(batch)
+    return indexed
+
+
+def search(query, kinds=None, limit=20, connection=None):
+    """
+    Return up to ``limit`` ranked matches for ``query`` as dicts with
+    ``type``, ``id``, ``title``, ``summary`` and ``score`` (higher is
+    better). Every term must match, and the last characters typed match
+    as a prefix.
+    """
+    connection = connection or default_connection
+    if not is_supported(connection):
+        raise NotImplementedError(f"Full-text search is not available on {connection.vendor}")
+    terms = re.findall(r'\w+', query.lower())[:MAX_TERMS]
+    kinds = [kind for kind in (kinds or KIND_CODES) if kind in KIND_CODES]
+    if not terms or not kinds:
+        return []
+    kind_placeholders = ', '.join(['%s'] * len(kinds))
+
+    if connection.vendor == 'sqlite':
+        sql = (
+            f"SELECT kind, object_id, title, summary, -bm25({TABLE}, 0, 0, 10.0, 1.0, 0) AS score "
+            f"FROM {TABLE} WHERE {TABLE} MATCH %s AND kind IN ({kind_placeholders}) "
+            "ORDER BY score DESC LIMIT %s"
+        )
+        match = ' '.join(f'"{term}"*' for term in terms)
+    else:
+        sql = (
+            f"SELECT kind, object_id, title, summary, ts_rank(document, query) AS score "
+            f"FROM {TABLE}, to_tsquery('simple', %s) query "
+            f"WHERE document @@ query AND kind IN ({kind_placeholders}) "
+            "ORDER BY score DESC LIMIT %s"
+        )
+        match = ' & '.join(f"{term}:*" for term in terms)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, *kinds, limit])
+        return [
+            {'type': kind, 'id': object_id, 'title': title, 'summary': summary, 'score': round(score, 4)}
+            for kind, object_id, title, summary, score in cursor.fetchall()
+        ]
+
+
+def search_ids(model, query, limit=1000, connection=None):
+    """Primary keys of ``model`` rows matching ``query``, best match first."""
+    kind = DOCUMENTS[model._meta.model_name][0]
+    return [match['id'] for match in search(query, [kind], limit, connection)]
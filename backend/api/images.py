@@ -0,0 +1,241 @@
+"""
+Responsive image variants for property and maintenance photos.
+
+``images`` on ``Property`` and ``MaintenanceRequest`` hold the original
+references. ``image_variants`` holds one manifest per reference with the
+sizes and content-hashed file names generated by ``api.imaging`` in a
+process pool that is started once per process and reused. Manifests are
+rebuilt in the background after a save whose images changed, or in bulk by
+the ``build_image_variants`` command. Variants are served by
+``api.views.image_variant``.
+"""
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+
+from .imaging import CONTENT_TYPES, process_source
+from .versioning import bump_data_version_on_commit
+
+logger = logging.getLogger(__name__)
+
+# Rows with a refresh running, and those saved again while it ran
+_scheduled = set()
+_rescheduled = set()
+_scheduled_lock = threading.Lock()
+
+_pool = None
+_pool_workers = None
+_pool_lock = threading.Lock()
+
+
+def variant_root():
+    root = Path(getattr(settings, 'IMAGE_VARIANT_ROOT', settings.BASE_DIR / 'media' / 'variants'))
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def _widths():
+    return list(getattr(settings, 'IMAGE_VARIANT_WIDTHS', [320, 640, 1024, 1600]))
+
+
+def _formats():
+    return list(getattr(settings, 'IMAGE_VARIANT_FORMATS', ['avif', 'webp']))
+
+
+def resolve_source(ref):
+    """
+    Map an image reference to a local file under one of
+    ``IMAGE_SOURCE_DIRS`` or return None (remote URLs, data URIs, missing
+    files and paths escaping the source directories).
+    """
+    if not isinstance(ref, str) or not ref or ref.startswith('data:'):
+        return None
+    parsed = urlparse(ref)
+    if parsed.scheme or parsed.netloc:
+        return None
+    relative = parsed.path.lstrip('/')
+    for prefix, directory in getattr(settings, 'IMAGE_SOURCE_DIRS', {}).items():
+        if not relative.startswith(prefix):
+            continue
+        directory = Path(directory).resolve()
+        candidate = (directory / relative[len(prefix):]).resolve()
+        if candidate.is_relative_to(directory) and candidate.is_file():
+            return candidate
+    return None
+
+
+def _get_pool(workers):
+    """The process pool, started on first use and kept for later builds."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # spawn: workers must not inherit DB connections or locks held by other threads
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    global _pool, _pool_workers
+    with _pool_lock:
+        pool, _pool, _pool_workers = _pool, None, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_pool)
+
+
+def build_manifests(refs, workers=None):
+    """
+    Generate variants for ``refs`` and return ``{ref: manifest}``. Local
+    sources are processed in a pool of ``workers`` processes
+    (``IMAGE_PIPELINE_WORKERS``); 0 processes them inline.
+    """
+    if workers is None:
+        workers = getattr(settings, 'IMAGE_PIPELINE_WORKERS', 2)
+    output_dir = str(variant_root())
+    widths, formats = _widths(), _formats()
+
+    paths = {ref: resolve_source(ref) for ref in dict.fromkeys(refs)}
+    unique_paths = sorted({str(path) for path in paths.values() if path is not None})
+    jobs = [(path, output_dir, widths, formats) for path in unique_paths]
+    if workers and len(jobs) > 1:
+        try:
+            results = dict(zip(unique_paths, _get_pool(workers).map(process_source, jobs)))
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool next time
+            shutdown_pool()
+            raise
+    else:
+        results = {job[0]: process_source(job) for job in jobs}
+
+    manifests = {}
+    for ref, path in paths.items():
+        result = results.get(str(path)) if path is not None else None
+        if result is not None and 'error' in result:
+            logger.error(f"Error generating variants for {ref}: {result['error']}")
+            result = None
+        manifests[ref] = {'src': ref, **(result or {})}
+    return manifests
+
+
+def needs_refresh(instance):
+    stored = [entry.get('src') for entry in instance.image_variants or []]
+    return stored != list(instance.images or [])
+
+
+def refresh_image_variants(model, pks=None, force=False, batch_size=200, workers=None):
+    """
+    Rebuild ``image_variants`` for ``model`` rows whose images changed (all
+    rows with ``force``). Returns the number of rows updated.
+    """
+    queryset = model.objects.all() if pks is None else model.objects.filter(pk__in=pks)
+    updated = 0
+    batch = []
+
+    def write(rows):
+        manifests = build_manifests([ref for row in rows for ref in row.images or []], workers=workers)
+        now = timezone.now()
+        for row in rows:
+            row.image_variants = [manifests[ref] for ref in row.images or []]
+            row.updated_at = now
+        # bulk_update skips signals, so saving variants never re-triggers the pipeline
+        with transaction.atomic():
+            model.objects.bulk_update(rows, ['image_variants', 'updated_at'])
+            bump_data_version_on_commit()
+        return len(rows)
+
+    for row in queryset.only('id', 'images', 'image_variants').iterator(chunk_size=batch_size):
+        if force or needs_refresh(row):
+            batch.append(row)
+        if len(batch) >= batch_size:
+            updated += write(batch)
+            batch = []
+    if batch:
+        updated += write(batch)
+    return updated
+
+
+def schedule_refresh(model, pk):
+    """
+    Rebuild variants for one row in a background thread after commit. A
+    save while that row's rebuild runs makes it run once more afterwards.
+    """
+    if not getattr(settings, 'IMAGE_PIPELINE_IN_PROCESS', True):
+        return
+    key = (model._meta.label, pk)
+
+    def run():
+        try:
+            while True:
+                try:
+                    refresh_image_variants(model, pks=[pk])
+                except Exception as e:
+                    logger.error(f"Error refreshing image variants for {key}: {str(e)}")
+                with _scheduled_lock:
+                    if key not in _rescheduled:
+                        _scheduled.discard(key)
+                        return
+                    _rescheduled.discard(key)
+        finally:
+            close_old_connections()
+
+    def start():
+        with _scheduled_lock:
+            if key in _scheduled:
+                _rescheduled.add(key)
+                return
+            _scheduled.add(key)
+        threading.Thread(target=run, name=f"image-variants-{pk}", daemon=True).start()
+
+    transaction.on_commit(start)
+
+
+def expand_variants(entries, request=None):
+    """Serializer output for stored manifests: variant URLs plus srcset strings."""
+    prefix = reverse('image-variant', args=['_'])[:-1]
+    if request is not None:
+        prefix = request.build_absolute_uri(prefix)
+    expanded = []
+    for entry in entries or []:
+        item = {'src': entry.get('src')}
+        if entry.get('variants'):
+            item['width'] = entry['width']
+            item['height'] = entry['height']
+            item['variants'] = {
+                fmt: [
+                    {'url': prefix + v['name'], 'width': v['width'], 'height': v['height']}
+                    for v in variants
+                ]
+                for fmt, variants in entry['variants'].items()
+            }
+            item['srcset'] = {
+                fmt: ', '.join(f"{v['url']} {v['width']}w" for v in variants)
+                for fmt, variants in item['variants'].items()
+            }
+        expanded.append(item)
+    return expanded
+
+
+def variant_path(name):
+    """Local path for a served variant name, or None if it does not exist."""
+    path = variant_root() / name
+    return path if path.is_file() else None
+
+
+def variant_content_type(name):
+    return CONTENT_TYPES.get(os.path.splitext(name)[1].lstrip('.'), 'application/octet-stream')
@@ -0,0 +1,84 @@
+"""
+Pillow side of the image pipeline.
+
+These functions run in worker processes (see ``api.images``), so this
+module must not import Django. Variants are written under content-hashed
+names: the same source always maps to the same files, existing files are
+never regenerated, and clients may cache them forever.
+"""
+import hashlib
+import os
+import tempfile
+
+from PIL import Image, ImageOps
+
+EXTENSIONS = {'avif': 'avif', 'webp': 'webp', 'jpeg': 'jpg'}
+CONTENT_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'jpg': 'image/jpeg'}
+SAVE_OPTIONS = {
+    'avif': {'quality': 50},
+    'webp': {'quality': 75, 'method': 4},
+    'jpeg': {'quality': 80, 'optimize': True, 'progressive': True},
+}
+
+
+def content_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def variant_name(digest, width, fmt):
+    return f"{digest}-{width}w.{EXTENSIONS[fmt]}"
+
+
+def _save(image, dest, fmt):
+    if fmt == 'jpeg' and image.mode not in ('RGB', 'L'):
+        image = image.convert('RGB')
+    elif image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+    # Write to a temporary name first so readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix='.tmp')
+    os.close(fd)
+    try:
+        image.save(tmp, format=fmt.upper(), **SAVE_OPTIONS[fmt])
+        os.replace(tmp, dest)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def generate_variants(path, output_dir, widths, formats):
+    """
+    Write resized copies of the image at ``path`` for every width in
+    ``widths`` narrower than the original (plus the original width when it
+    is below the largest) in each of ``formats``. Returns the manifest.
+    """
+    digest = content_hash(path)
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        width, height = image.size
+        targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+        variants = {fmt: [] for fmt in formats}
+        for target in targets:
+            size = (target, max(round(height * target / width), 1))
+            resized = None
+            for fmt in formats:
+                name = variant_name(digest, target, fmt)
+                dest = os.path.join(output_dir, name)
+                if not os.path.exists(dest):
+                    if resized is None:
+                        resized = image if size == image.size else image.resize(size, Image.LANCZOS)
+                    _save(resized, dest, fmt)
+                variants[fmt].append({'name': name, 'width': size[0], 'height': size[1]})
+    return {'hash': digest, 'width': width, 'height': height, 'variants': variants}
+
+
+def process_source(job):
+    """``ProcessPoolExecutor.map`` entry point; never raises."""
+    path, output_dir, widths, formats = job
+    try:
+        return generate_variants(path, output_dir, widths, formats)
+    except Exception as e:
+        return {'error': str(e)}
@@ -0,0 +1,331 @@
+"""
+Streaming bulk import of properties, tenants and payments.
+
+Records are read lazily from CSV or JSONL and processed in fixed size
+chunks. Each chunk resolves the properties and tenants it references with
+one query per model, validates rows without touching the database and
+inserts the valid ones with ``bulk_create`` in its own transaction. Only
+one chunk is held in memory at a time, and at most
+``MAX_REPORTED_ERRORS`` row errors are kept for the report.
+"""
+import csv
+import io
+import json
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+
+from . import fulltext
+from .filters import TRUE_VALUES, FALSE_VALUES
+from .ledger import recompute_balances
+from .models import Property, Tenant, Payment
+from .versioning import bump_data_version_on_commit
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+FORMATS = ('csv', 'jsonl')
+
+# Columns accepted per import kind; anything else in the file is ignored
+IMPORT_FIELDS = {
+    'properties': (Property, [
+        'name', 'property_type', 'location', 'price', 'suggested_price',
+        'bedrooms', 'bathrooms', 'square_feet', 'available',
+    ]),
+    'tenants': (Tenant, [
+        'first_name', 'last_name', 'email', 'phone', 'active', 'status',
+        'unit_number', 'lease_start', 'lease_end', 'monthly_rent',
+        'security_deposit', 'emergency_contact_name', 'emergency_contact_phone',
+        'notes', 'budget_min', 'budget_max', 'preferred_property_type',
+        'preferred_location',
+    ]),
+    'payments': (Payment, [
+        'amount', 'due_date', 'payment_date', 'status', 'payment_method',
+        'payment_type', 'notes', 'billing_period',
+    ]),
+}
+
+
+def detect_format(name, default='csv'):
+    """Guess the record format from a file name."""
+    name = (name or '').lower()
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def iter_records(stream, fmt):
+    """
+    Yield ``(line, record, error)`` for each record in a binary stream.
+    ``record`` is a dict, or None when the line could not be parsed.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    if fmt == 'csv':
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record, None
+    elif fmt == 'jsonl':
+        for line, raw in enumerate(text, start=1):
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except ValueError as e:
+                yield line, None, {'__all__': [f"Invalid JSON: {e}"]}
+                continue
+            if not isinstance(record, dict):
+                yield line, None, {'__all__': ['Expected a JSON object']}
+                continue
+            yield line, record, None
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _to_python(field, value):
+    if isinstance(field, models.BooleanField) and not isinstance(value, bool):
+        lowered = str(value).strip().lower()
+        if lowered in TRUE_VALUES:
+            return True
+        if lowered in FALSE_VALUES:
+            return False
+        raise ValidationError('Expected true or false')
+    if isinstance(value, str):
+        value = value.strip()
+    return field.to_python(value)
+
+
+def _int_or_none(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ChunkLookups:
+    """Properties, tenants and conflicts referenced by one chunk, fetched in bulk."""
+
+    def __init__(self, kind, records):
+        property_ids, property_names = set(), set()
+        tenant_ids, tenant_emails = set(), set()
+        for record in records:
+            if not _blank(record.get('property')):
+                property_ids.add(_int_or_none(record['property']))
+            if not _blank(record.get('property_name')):
+                property_names.add(str(record['property_name']).strip())
+            if kind == 'payments':
+                if not _blank(record.get('tenant')):
+                    tenant_ids.add(_int_or_none(record['tenant']))
+                if not _blank(record.get('tenant_email')):
+                    tenant_emails.add(str(record['tenant_email']).strip())
+            elif kind == 'tenants' and not _blank(record.get('email')):
+                tenant_emails.add(str(record['email']).strip())
+        property_ids.discard(None)
+        tenant_ids.discard(None)
+
+        self.property_ids = set()
+        self.properties_by_name = {}
+        if property_ids or property_names:
+            for pk, name in Property.objects.filter(
+                Q(id__in=property_ids) | Q(name__in=property_names)
+            ).values_list('id', 'name'):
+                self.property_ids.add(pk)
+                self.properties_by_name.setdefault(name, []).append(pk)
+
+        self.tenants_by_id = {}
+        self.tenants_by_email = {}
+        if tenant_ids or tenant_emails:
+            for pk, email, property_id in Tenant.objects.filter(
+                Q(id__in=tenant_ids) | Q(email__in=tenant_emails)
+            ).values_list('id', 'email', 'property_id'):
+                self.tenants_by_id[pk] = property_id
+                self.tenants_by_email[email] = (pk, property_id)
+
+        self.rent_periods = set()
+        if kind == 'payments' and self.tenants_by_id:
+            periods = set()
+            period_field = Payment._meta.get_field('billing_period')
+            for record in records:
+                try:
+                    period = _to_python(period_field, record.get('billing_period'))
+                except ValidationError:
+                    continue
+                if period is not None:
+                    periods.add(period.replace(day=1))
+            if periods:
+                self.rent_periods = {
+                    (tenant_id, period.isoformat())
+                    for tenant_id, period in Payment.objects.filter(
+                        payment_type='rent', tenant_id__in=self.tenants_by_id, billing_period__in=periods,
+                    ).values_list('tenant_id', 'billing_period')
+                }
+
+    def property_for(self, record, errors):
+        if not _blank(record.get('property')):
+            pk = _int_or_none(record['property'])
+            if pk not in self.property_ids:
+                errors['property'] = [f"Property {record['property']} does not exist"]
+            return pk
+        if not _blank(record.get('property_name')):
+            matches = self.properties_by_name.get(str(record['property_name']).strip(), [])
+            if len(matches) != 1:
+                errors['property_name'] = [
+                    'No property with this name' if not matches else 'Property name is ambiguous'
+                ]
+                return None
+            return matches[0]
+        return None
+
+    def tenant_for(self, record, errors):
+        """Return ``(tenant_id, tenant_property_id)`` for a payment record."""
+        if not _blank(record.get('tenant')):
+            pk = _int_or_none(record['tenant'])
+            if pk not in self.tenants_by_id:
+                errors['tenant'] = [f"Tenant {record['tenant']} does not exist"]
+                return None, None
+            return pk, self.tenants_by_id[pk]
+        if not _blank(record.get('tenant_email')):
+            match = self.tenants_by_email.get(str(record['tenant_email']).strip())
+            if match is None:
+                errors['tenant_email'] = ['No tenant with this email']
+                return None, None
+            return match
+        errors['tenant'] = ['This field is required.']
+        return None, None
+
+
+class Importer:
+    """Import one kind of record; call ``run()`` with ``iter_records`` output."""
+
+    def __init__(self, kind, chunk_size=DEFAULT_CHUNK_SIZE, owner=None):
+        if kind not in IMPORT_FIELDS:
+            raise ValueError(f"Unknown import kind: {kind}")
+        self.kind = kind
+        self.model, self.fields = IMPORT_FIELDS[kind]
+        self.model_fields = [self.model._meta.get_field(name) for name in self.fields]
+        self.chunk_size = chunk_size
+        self.owner = owner
+        self.rows = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def _error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line, 'errors': errors})
+
+    def run(self, records):
+        records = iter(records)
+        try:
+            while True:
+                chunk = list(islice(records, self.chunk_size))
+                if not chunk:
+                    break
+                self._import_chunk(chunk)
+        finally:
+            if self.created:
+                # bulk_create skips model signals; chunks committed before a
+                # file turns out unreadable are data changes too
+                bump_data_version_on_commit()
+        return self.summary()
+
+    def summary(self):
+        return {
+            'kind': self.kind,
+            'rows': self.rows,
+            'created': self.created,
+            'failed': self.failed,
+            'errors': self.errors,
+            'errors_truncated': self.failed > len(self.errors),
+        }
+
+    def _import_chunk(self, chunk):
+        self.rows += len(chunk)
+        lookups = ChunkLookups(self.kind, [record for _, record, error in chunk if not error])
+        seen = set()
+        valid = []
+        for line, record, errors in chunk:
+            if not errors:
+                instance, errors = self._build(record, lookups, seen)
+            if errors:
+                self._error(line, errors)
+            else:
+                valid.append((line, instance))
+        if not valid:
+            return
+        try:
+            with transaction.atomic():
+                self.model.objects.bulk_create([instance for _, instance in valid])
+                # bulk_create skips the signals that maintain these
+                if self.kind == 'payments':
+                    recompute_balances([instance.tenant_id for _, instance in valid])
+                else:
+                    fulltext.index_objects([instance for _, instance in valid])
+            self.created += len(valid)
+        except IntegrityError:
+            # A concurrent writer won a race; insert row by row to pinpoint it
+            for line, instance in valid:
+                try:
+                    with transaction.atomic():
+                        instance.save(force_insert=True)
+                    self.created += 1
+                except IntegrityError as e:
+                    self._error(line, {'__all__': [str(e)]})
+
+    def _build(self, record, lookups, seen):
+        errors = {}
+        values = {}
+        for name, field in zip(self.fields, self.model_fields):
+            raw = record.get(name)
+            if _blank(raw):
+                continue
+            try:
+                values[name] = _to_python(field, raw)
+            except ValidationError as e:
+                errors[name] = e.messages
+
+        if self.kind == 'properties':
+            values['owner'] = self.owner
+        elif self.kind == 'tenants':
+            values['property_id'] = lookups.property_for(record, errors)
+            email = values.get('email')
+            if email:
+                if email in lookups.tenants_by_email or email in seen:
+                    errors['email'] = ['A tenant with this email already exists']
+                seen.add(email)
+        else:
+            tenant_id, tenant_property_id = lookups.tenant_for(record, errors)
+            property_id = lookups.property_for(record, errors)
+            values['tenant_id'] = tenant_id
+            values['property_id'] = property_id or tenant_property_id
+            if tenant_id is not None and values['property_id'] is None and not (
+                'property' in errors or 'property_name' in errors
+            ):
+                errors['property'] = ['This field is required.']
+            period = values.get('billing_period')
+            if tenant_id is not None and period is not None and values.get('payment_type', 'rent') == 'rent':
+                period = values['billing_period'] = period.replace(day=1)
+                key = (tenant_id, period.isoformat())
+                if key in lookups.rent_periods or key in seen:
+                    errors['billing_period'] = ['Rent for this tenant and period already exists']
+                seen.add(key)
+
+        instance = self.model(**values)
+        try:
+            # Relations were resolved in bulk above; skip their per-row queries
+            instance.full_clean(
+                exclude=['owner', 'property', 'tenant', 'user'],
+                validate_unique=False,
+                validate_constraints=False,
+            )
+        except ValidationError as e:
+            for name, messages in e.message_dict.items():
+                errors.setdefault(name, messages)
+        return instance, errors
@@ -0,0 +1,149 @@
+"""
+Tenant ledgers and materialized balances.
+
+Every Payment row is a charge of ``amount`` on its due date; rows marked
+paid are settled by the same amount. ``tenant_ledger`` computes the running
+balance in SQL with a window over ``(tenant, due_date, id)``, so a tenant's
+history is never summed in Python or on the client.
+
+``Tenant.balance`` stores the outstanding total so a balance check is a
+single-row read. ``recompute_balances`` refreshes it with one set-based
+UPDATE; it runs from the payment signal handlers and explicitly after bulk
+inserts, which skip signals. Deleted payments go through
+``recompute_balances_on_commit``, so a cascade that deletes many payments
+recomputes each affected tenant once, when the transaction commits.
+"""
+import threading
+from decimal import Decimal
+
+from django.db import transaction
+
+from django.db.models import Case, DecimalField, F, OuterRef, RowRange, Subquery, Sum, Value, When, Window
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Tenant, Payment
+
+SETTLED_STATUSES = ('paid',)
+MONEY = DecimalField(max_digits=12, decimal_places=2)
+ZERO = Decimal('0.00')
+
+
+def _settled():
+    return Case(
+        When(status__in=SETTLED_STATUSES, then=F('amount')),
+        default=Value(ZERO),
+        output_field=MONEY,
+    )
+
+
+def _outstanding():
+    """Outstanding total of the tenant in ``OuterRef('pk')``."""
+    totals = Payment.objects.filter(tenant=OuterRef('pk')).exclude(
+        status__in=SETTLED_STATUSES,
+    ).order_by().values('tenant').annotate(total=Sum('amount')).values('total')
+    return Coalesce(Subquery(totals[:1]), Value(ZERO), output_field=MONEY)
+
+
+def recompute_balances(tenant_ids=None):
+    """
+    Refresh ``Tenant.balance`` for ``tenant_ids`` (every tenant when None).
+    Only rows whose balance changed are written, and their ``updated_at``
+    moves with it so conditional GETs on the tenant list stay correct.
+    Returns the number of tenants updated.
+    """
+    tenants = Tenant.objects.all()
+    if tenant_ids is not None:
+        tenant_ids = {tenant_id for tenant_id in tenant_ids if tenant_id is not None}
+        if not tenant_ids:
+            return 0
+        tenants = tenants.filter(pk__in=tenant_ids)
+    return tenants.annotate(outstanding=_outstanding()).exclude(
+        balance=F('outstanding'),
+    ).update(balance=_outstanding(), updated_at=timezone.now())
+
+
+_pending = threading.local()
+
+
+def _pending_ids():
+    if not hasattr(_pending, 'tenant_ids'):
+        _pending.tenant_ids = set()
+    return _pending.tenant_ids
+
+
+def recompute_balances_on_commit(tenant_ids):
+    """
+    Recompute the balances of ``tenant_ids`` when the current transaction
+    commits (immediately outside one). Ids collected during a transaction
+    are recomputed together by the first callback to run.
+    """
+    tenant_ids = {tenant_id for tenant_id in tenant_ids if tenant_id is not None}
+    if tenant_ids:
+        _pending_ids().update(tenant_ids)
+        transaction.on_commit(_recompute_pending)
+
+
+def forget_pending_balances(tenant_ids):
+    """Drop deleted tenants from the balances waiting for the commit."""
+    _pending_ids().difference_update(tenant_ids)
+
+
+def _recompute_pending():
+    tenant_ids = _pending_ids()
+    if tenant_ids:
+        pending = set(tenant_ids)
+        tenant_ids.clear()
+        recompute_balances(pending)
+
+
+def tenant_ledger(tenant, start=None, end=None):
+    """
+    Return the ledger of ``tenant`` between the ``start`` and ``end`` due
+    dates (inclusive, both optional). Entries before ``start`` are folded
+    into ``opening_balance`` with one aggregate query.
+    """
+    payments = Payment.objects.filter(tenant=tenant)
+    opening = ZERO
+    if start is not None:
+        opening = payments.filter(due_date__lt=start).aggregate(
+            total=Sum(F('amount') - _settled(), output_field=MONEY),
+        )['total'] or ZERO
+        payments = payments.filter(due_date__gte=start)
+    if end is not None:
+        payments = payments.filter(due_date__lte=end)
+
+    rows = payments.annotate(
+        charge=F('amount'),
+        paid=_settled(),
+        running=Window(
+            Sum(F('amount') - _settled(), output_field=MONEY),
+            partition_by=[F('tenant_id')],
+            order_by=[F('due_date').asc(), F('id').asc()],
+            frame=RowRange(start=None, end=0),
+        ),
+    ).order_by('due_date', 'id').values(
+        'id', 'due_date', 'payment_date', 'billing_period', 'payment_type', 'status', 'notes',
+        'charge', 'paid', 'running',
+    )
+
+    entries = []
+    total_charged = total_paid = ZERO
+    for row in rows:
+        running = row.pop('running')
+        total_charged += row['charge']
+        total_paid += row['paid']
+        row['balance'] = opening + running
+        entries.append(row)
+
+    return {
+        'tenant_id': tenant.pk,
+        'balance': tenant.balance,
+        'start': start,
+        'end': end,
+        'opening_balance': opening,
+        'total_charged': total_charged,
+        'total_paid': total_paid,
+        'closing_balance': opening + total_charged - total_paid,
+        'entries': entries,
+    }
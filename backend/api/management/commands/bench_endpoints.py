@@ -0,0 +1,365 @@
+import json
+import platform
+import statistics
+import time
+import django
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import URLPattern, URLResolver, reverse
+from django.utils import timezone
+
+from api.benchmarking import benchmark_database, compare_to_baseline, latency_summary, without_background_work
+from api.sqlstats import record_queries
+
+ADMIN_PASSWORD = 'bench-admin-password'
+IMPORT_ROWS = 200
+
+# Routes that cannot be requested meaningfully against generated data
+SKIPPED_ROUTES = {
+    'image-variant': 'serves resized uploads; the generated properties have no images',
+}
+
+
+def _route_names(urlpatterns):
+    names = set()
+    for pattern in urlpatterns:
+        if isinstance(pattern, URLResolver):
+            names |= _route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+def _import_file():
+    lines = ['name,property_type,location,price,bedrooms']
+    lines += [f"Bench Import {i},apartment,Kilimani,{30000 + i},2" for i in range(IMPORT_ROWS)]
+    return SimpleUploadedFile('properties.csv', '\n'.join(lines).encode(), content_type='text/csv')
+
+
+def _period(months_ahead):
+    today = timezone.now().date()
+    month = today.month - 1 + months_ahead
+    return f"{today.year + month // 12}-{month % 12 + 1:02d}"
+
+
+def scenarios(ids):
+    """
+    One request per route (more for routes with several methods). Each is
+    ``(url name, method, url kwargs, payload, max iterations)``; the payload
+    is the query string for GET and the JSON body otherwise, or multipart
+    when it holds an uploaded file. ``None`` iterations use ``--repeat``.
+
+    Writes are committed, so url kwargs and payloads may be callables taking
+    the iteration number: writes that cannot repeat use fresh rows, and
+    status changes alternate so every iteration does the same work.
+    """
+    tenant, prop, payment = ids['tenant'], ids['property'], ids['payment']
+    return [
+        ('api-root', 'GET', {}, {}, None),
+        ('available-properties', 'GET', {}, {}, None),
+        ('property-list', 'GET', {}, {}, None),
+        ('property-list', 'POST', {}, {'name': 'Bench Property', 'price': '45000.00', 'location': 'Kilimani'}, None),
+        ('property-detail', 'GET', {'pk': prop}, {}, None),
+        ('property-detail', 'PATCH', {'pk': prop}, {'price': '47500.00'}, None),
+        ('tenant-list', 'GET', {}, {}, None),
+        ('tenant-detail', 'GET', {'pk': tenant}, {}, None),
+        ('tenant-detail', 'PATCH', {'pk': tenant}, {'notes': 'Benchmark'}, None),
+        ('tenant-ledger', 'GET', {'pk': tenant}, {}, None),
+        ('tenant-create-user', 'POST', lambda i: {'pk': ids['spare_tenants'][i]},
+         {'password': 'bench-tenant-password'}, 5),
+        ('payment-list', 'GET', {}, {}, None),
+        ('payment-detail', 'GET', {'pk': payment}, {}, None),
+        ('payment-detail', 'PATCH', {'pk': payment}, lambda i: {'status': ('paid', 'pending')[i % 2]}, None),
+        ('payment-generate-rent', 'POST', {}, lambda i: {'period': _period(i + 1)}, 3),
+        ('maintenance-list', 'GET', {}, {}, None),
+        ('maintenance-detail', 'GET', {'pk': ids['maintenance']}, {}, None),
+        ('maintenance-detail', 'PATCH', {'pk': ids['maintenance']},
+         lambda i: {'status': ('in_progress', 'submitted')[i % 2]}, None),
+        ('auth-me', 'GET', {}, {}, None),
+        # Password hashing dominates these, so a few samples suffice
+        ('token_obtain_pair', 'POST', {}, {
+            'username': ids['admin_email'], 'email': ids['admin_email'], 'password': ADMIN_PASSWORD,
+        }, 5),
+        ('token_refresh', 'POST', {}, {'refresh': ids['refresh']}, None),
+        ('create-tenant', 'POST', {}, lambda i: {
+            'email': f'bench-new-tenant-{i}@example.com', 'password': 'bench-tenant-password',
+            'first_name': 'Bench', 'last_name': 'Tenant', 'property_id': prop,
+        }, 5),
+        ('create-admin', 'POST', {}, lambda i: {
+            'email': f'bench-new-admin-{i}@example.com', 'password': 'bench-admin-password',
+            'first_name': 'Bench', 'last_name': 'Admin',
+        }, 5),
+        ('dashboard-stats', 'GET', {}, {}, None),
+        ('dashboard-stream', 'GET', {}, {'mode': 'poll', 'timeout': 0}, None),
+        ('ai-insights', 'GET', {}, {}, None),
+        ('user-management', 'GET', {}, {}, None),
+        ('user-bulk-action', 'POST', {},
+         lambda i: {'action': ('suspend', 'activate')[i % 2], 'user_ids': [ids['tenant_user']]}, None),
+        ('user-action', 'POST', lambda i: {'user_id': ids['tenant_user'], 'action': ('suspend', 'activate')[i % 2]},
+         {}, None),
+        ('system-activity', 'GET', {}, {}, None),
+        ('analytics-data', 'GET', {}, {}, None),
+        ('system-configuration', 'POST', {}, {'maintenance_mode': False}, None),
+        ('bulk-import', 'POST', {'kind': 'properties'}, lambda i: {'file': _import_file()}, 5),
+        ('export-data', 'GET', {'kind': 'tenants'}, {}, 5),
+        ('search', 'GET', {}, {'q': 'Kilimani'}, None),
+        ('announcements', 'GET', {}, {}, None),
+        ('announcements', 'POST', {}, {'title': 'Water outage', 'content': 'Benchmark announcement'}, None),
+        ('ai-tenant-recommendations', 'GET', {}, {'tenant_id': tenant}, None),
+        ('ai-tenant-risk-assessment', 'GET', {}, {'tenant_id': tenant}, None),
+        ('ai-property-risk-assessment', 'GET', {}, {'property_id': prop}, None),
+        ('ai-update-payment-prediction', 'POST', {}, {'payment_id': payment}, None),
+        ('ai-update-property-pricing', 'POST', {}, {'property_id': prop}, None),
+        ('ai-update-property-forecasts', 'POST', {}, {'property_id': prop}, None),
+        ('ai-update-risk-scores', 'POST', {}, {'tenant_id': tenant, 'property_id': prop}, None),
+        ('ai-dashboard-analytics', 'GET', {}, {}, None),
+    ]
+
+
+def scoring_paths(sample):
+    """``(name, function, items)`` for each AI engine's scoring path."""
+    from ai_services.ai_manager import ai_service
+
+    tenants, properties, payments = sample
+    pairs = [(tenant, prop) for tenant in tenants[:20] for prop in properties[:50]]
+    return [
+        ('tenant_allocation.calculate_match_score',
+         lambda pair: ai_service.tenant_allocation.calculate_match_score(*pair), pairs),
+        ('payment_prediction.predict_late_payment',
+         lambda payment: ai_service.payment_prediction.predict_late_payment(payment.tenant, payment), payments),
+        ('dynamic_pricing.suggest_optimal_price', ai_service.dynamic_pricing.suggest_optimal_price, properties),
+        ('occupancy_forecast.forecast_occupancy', ai_service.occupancy_forecast.forecast_occupancy, properties),
+        ('risk_assessment.calculate_tenant_risk_score', ai_service.risk_assessment.calculate_tenant_risk_score, tenants),
+        ('risk_assessment.calculate_property_risk_score',
+         ai_service.risk_assessment.calculate_property_risk_score, properties),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database with a synthetic portfolio and measure the "
+        "latency (p50/p95/p99) and query count of every API and AI route, and "
+        "the throughput of each AI engine's scoring path. Writes the results "
+        "as a JSON baseline and can compare a run against an earlier baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tenants', type=int, default=10000,
+                            help='Tenants to seed; properties, payments, maintenance and behaviour events scale with it.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--repeat', type=int, default=50, help='Timed requests per route after the cold one.')
+        parser.add_argument('--ai-items', type=int, default=200, help='Entities scored per AI scoring path.')
+        parser.add_argument('--route', action='append', default=[],
+                            help='Only benchmark these url names (repeatable).')
+        parser.add_argument('--output', help='Write the results to this JSON file.')
+        parser.add_argument('--compare', help='Baseline JSON file to check the results against.')
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help='Relative slowdown that counts as a regression (default 0.2 = 20%%).')
+        parser.add_argument('--noise-ms', type=float, default=1.0,
+                            help='Ignore p95 changes smaller than this many milliseconds.')
+
+    def handle(self, *args, **options):
+        if options['tenants'] < 10:
+            raise CommandError("--tenants must be at least 10")
+        if options['repeat'] < 1:
+            raise CommandError("--repeat must be at least 1")
+        baseline = None
+        if options['compare']:
+            try:
+                with open(options['compare']) as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                raise CommandError(f"Could not read baseline {options['compare']}: {e}")
+
+        # No background refresher: payloads are computed by the requests
+        # being timed, not concurrently with them
+        with benchmark_database(), without_background_work():
+            results = self._run(options)
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            self.stdout.write(f"Wrote {options['output']}")
+
+        # A scenario that gets a 4xx is broken and would be timing an error path
+        failed = [name for name, result in results['endpoints'].items() if result['status'] >= 400]
+        regressions = []
+        if baseline is not None:
+            if options['route']:
+                # A partial run is compared with the same routes only
+                baseline = {'endpoints': {
+                    key: result for key, result in baseline.get('endpoints', {}).items()
+                    if key.split(' ', 1)[1] in options['route']
+                }}
+            regressions = compare_to_baseline(
+                baseline, results, threshold=options['threshold'], noise_ms=options['noise_ms'],
+            )
+            for name, message in regressions:
+                self.stdout.write(self.style.ERROR(f"REGRESSED  {name}: {message}"))
+            if not regressions:
+                self.stdout.write(self.style.SUCCESS(f"No regressions against {options['compare']}"))
+        if failed or regressions:
+            raise CommandError(
+                f"{len(failed)} endpoints returned errors, {len(regressions)} regressions"
+            )
+
+    def _run(self, options):
+        from django.conf import settings
+        from django.contrib.auth.models import User
+        from django.test import Client
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        from api import synthetic
+        from api.models import MaintenanceRequest, Payment, Property, Tenant
+
+        tenants = options['tenants']
+        sizes = {
+            'properties': max(tenants // 10, 1), 'tenants': tenants, 'payments': tenants * 12,
+            'maintenance': tenants // 5, 'behaviors': tenants * 5,
+        }
+        self.stdout.write(f"Seeding {', '.join(f'{size} {name}' for name, size in sizes.items())}...")
+        started = time.perf_counter()
+        counts = synthetic.generate(**sizes, seed=options['seed'])
+        self.stdout.write(f"  {sum(counts.values())} rows in {time.perf_counter() - started:.1f}s")
+
+        admin = User.objects.create_superuser('bench-admin', 'bench-admin@example.com', ADMIN_PASSWORD)
+        tenant, *spare_tenants = Tenant.objects.filter(active=True, user__isnull=True).order_by('id')[:7]
+        tenant_user = User.objects.create_user('bench-tenant', 'bench-tenant@example.com', None)
+        refresh = RefreshToken.for_user(admin)
+        ids = {
+            'tenant': tenant.id,
+            'property': tenant.property_id,
+            'payment': Payment.objects.filter(tenant=tenant).order_by('-due_date').values_list('id', flat=True).first(),
+            'maintenance': MaintenanceRequest.objects.order_by('id').values_list('id', flat=True).first(),
+            'tenant_user': tenant_user.id,
+            'spare_tenants': [spare.id for spare in spare_tenants],
+            'admin_email': admin.email,
+            'refresh': str(refresh),
+        }
+        client = Client(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+        settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+
+        selected = [s for s in scenarios(ids) if not options['route'] or s[0] in options['route']]
+        if not options['route']:
+            self._check_coverage(selected)
+        # Reads first, so the rows committed by the writes do not shift them
+        selected.sort(key=lambda scenario: scenario[1] != 'GET')
+
+        endpoints = {}
+        for name, method, kwargs, payload, max_repeat in selected:
+            repeat = min(options['repeat'], max_repeat or options['repeat'])
+            result = self._bench_route(client, name, method, kwargs, payload, repeat)
+            endpoints[f"{method} {name}"] = result
+            line = (
+                f"{method:5} {name}: p50 {result['p50_ms']}ms  p95 {result['p95_ms']}ms  "
+                f"p99 {result['p99_ms']}ms  {result['queries']} queries  "
+                f"(cold {result['cold_ms']}ms, {result['cold_queries']} queries)"
+            )
+            if result['status'] >= 400:
+                self.stdout.write(self.style.ERROR(f"HTTP {result['status']} {line}"))
+            else:
+                self.stdout.write(line)
+
+        ai = {}
+        if not options['route']:
+            items = options['ai_items']
+            sample = (
+                list(Tenant.objects.select_related('property').order_by('id')[:items]),
+                list(Property.objects.order_by('id')[:items]),
+                list(Payment.objects.select_related('tenant', 'property').order_by('-id')[:items]),
+            )
+            for name, score, entities in scoring_paths(sample):
+                ai[name] = self._bench_scoring(score, entities)
+                self.stdout.write(
+                    f"AI    {name}: {ai[name]['items_per_s']}/s, "
+                    f"{ai[name]['queries_per_item']} queries per item"
+                )
+
+        return {
+            'meta': {
+                'created': timezone.now().isoformat(),
+                'rows': counts,
+                'seed': options['seed'],
+                'repeat': options['repeat'],
+                'database': connection.vendor,
+                'django': django.get_version(),
+                'python': platform.python_version(),
+            },
+            'endpoints': endpoints,
+            'ai': ai,
+        }
+
+    def _check_coverage(self, selected):
+        from ai_services import urls as ai_urls
+        from api import urls as api_urls
+
+        routes = _route_names(api_urls.urlpatterns) | _route_names(ai_urls.urlpatterns)
+        missing = routes - {name for name, *_ in selected} - set(SKIPPED_ROUTES)
+        for name, reason in sorted(SKIPPED_ROUTES.items()):
+            self.stdout.write(f"skipped    {name} ({reason})")
+        if missing:
+            raise CommandError(f"No benchmark scenario for: {', '.join(sorted(missing))}")
+
+    def _request(self, client, method, url, payload):
+        if method == 'GET':
+            response = client.get(url, payload)
+        elif any(isinstance(value, UploadedFile) for value in payload.values()):
+            response = client.post(url, payload)
+        else:
+            response = client.generic(method, url, json.dumps(payload), content_type='application/json')
+        if response.streaming:
+            # Streamed exports do their work while the body is consumed
+            for _ in response.streaming_content:
+                pass
+        return response
+
+    def _bench_route(self, client, name, method, kwargs, payload, repeat):
+        samples, queries, statuses = [], [], []
+        cold_ms = cold_queries = path = None
+        cache.clear()
+        for i in range(repeat + 1):
+            # Writes commit, so their on_commit work (activity log, data
+            # versions, balances, change feed) is part of the measurement
+            url = reverse(name, kwargs=kwargs(i) if callable(kwargs) else kwargs)
+            body = payload(i) if callable(payload) else payload
+            with record_queries() as stats:
+                started = time.perf_counter()
+                response = self._request(client, method, url, body)
+                elapsed = (time.perf_counter() - started) * 1000
+            statuses.append(response.status_code)
+            if i == 0:
+                path = url
+                cold_ms, cold_queries = round(elapsed, 3), stats.count
+            else:
+                samples.append(elapsed)
+                queries.append(stats.count)
+        return {
+            'method': method,
+            'path': path,
+            # The worst iteration's status, so a scenario failing later counts
+            'status': max(statuses),
+            'cold_ms': cold_ms,
+            'cold_queries': cold_queries,
+            'queries': round(statistics.median(queries)),
+            'samples': len(samples),
+            **latency_summary(samples),
+        }
+
+    def _bench_scoring(self, score, entities, rounds=3):
+        # The fastest round is the least disturbed by the rest of the machine
+        seconds = float('inf')
+        for _ in range(rounds):
+            with record_queries() as stats:
+                started = time.perf_counter()
+                for entity in entities:
+                    score(entity)
+                seconds = min(seconds, time.perf_counter() - started)
+        count = max(len(entities), 1)
+        return {
+            'items': len(entities),
+            'items_per_s': round(len(entities) / max(seconds, 1e-9), 1),
+            'ms_per_item': round(seconds * 1000 / count, 3),
+            'queries_per_item': round(stats.count / count, 2),
+        }
@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from api.benchmarking import benchmark_database, time_call
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/sec of the DRF list serializers against the compiled "
+        ".values() fast path in a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='Rows per model.')
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+
+        with benchmark_database():
+            from api.fast_serializers import compile_values_plan
+            from api.models import Property, Tenant, Payment, MaintenanceRequest
+            from api.serializers import (
+                PropertySerializer, TenantSerializer, PaymentSerializer, MaintenanceRequestSerializer,
+            )
+
+            today = timezone.now().date()
+            Property.objects.bulk_create(
+                [Property(name=f'Bench {i}', price=Decimal('1250.50'), location='Bench Road') for i in range(rows)],
+                batch_size=5000,
+            )
+            prop = Property.objects.first()
+            Tenant.objects.bulk_create(
+                [
+                    Tenant(
+                        first_name='Bench', last_name=f'Tenant {i}', email=f'bench{i}@example.com',
+                        property=prop, lease_start=today, monthly_rent=Decimal('1250.50'),
+                    )
+                    for i in range(rows)
+                ],
+                batch_size=5000,
+            )
+            tenant = Tenant.objects.first()
+            Payment.objects.bulk_create(
+                [
+                    Payment(
+                        tenant=tenant, property=prop, amount=Decimal('1250.50'), due_date=today,
+                        payment_date=today if i % 2 else None, status='paid' if i % 2 else 'pending',
+                    )
+                    for i in range(rows)
+                ],
+                batch_size=5000,
+            )
+            MaintenanceRequest.objects.bulk_create(
+                [
+                    MaintenanceRequest(tenant=tenant, property=prop, issue_description=f'Issue {i}')
+                    for i in range(rows)
+                ],
+                batch_size=5000,
+            )
+
+            renderer = JSONRenderer()
+            self.stdout.write(f"{'serializer':>28} {'drf rows/s':>12} {'fast rows/s':>12} {'speedup':>8}")
+            for serializer_class in (
+                PropertySerializer, TenantSerializer, PaymentSerializer, MaintenanceRequestSerializer,
+            ):
+                queryset = serializer_class.Meta.model.objects.order_by('-id')
+                plan = compile_values_plan(serializer_class())
+                if plan is None:
+                    raise CommandError(f"{serializer_class.__name__} cannot be compiled")
+
+                def drf():
+                    return renderer.render(serializer_class(queryset, many=True).data)
+
+                def fast():
+                    return renderer.render(plan.render(queryset.values(*plan.columns)))
+
+                if drf() != fast():
+                    raise CommandError(f"{serializer_class.__name__}: fast path output differs")
+                baseline = time_call(drf, repeat=options['repeat'])
+                current = time_call(fast, repeat=options['repeat'])
+                drf_rate = rows / baseline['median_ms'] * 1000
+                fast_rate = rows / current['median_ms'] * 1000
+                self.stdout.write(
+                    f"{serializer_class.__name__:>28} {drf_rate:>12,.0f} {fast_rate:>12,.0f} "
+                    f"{fast_rate / drf_rate:>7.1f}x"
+                )
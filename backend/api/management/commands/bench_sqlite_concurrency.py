@@ -0,0 +1,129 @@
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, transaction
+from django.db.models import Sum
+from django.test.utils import override_settings
+
+from api.benchmarking import benchmark_database, percentile
+
+# Stock SQLite behaviour: rollback journal, full fsync, deferred transactions
+BASELINE_PRAGMAS = {'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure SQLite read and write throughput under a mixed concurrent "
+        "load, with stock settings and with the tuned connection settings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--seconds', type=float, default=5.0)
+        parser.add_argument('--rows', type=int, default=2000, help='Tenants to seed.')
+        parser.add_argument('--mode', choices=['baseline', 'tuned', 'both'], default='both')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("This benchmark only applies to SQLite")
+        modes = ['baseline', 'tuned'] if options['mode'] == 'both' else [options['mode']]
+        self.stdout.write(
+            f"{'mode':>9} {'reads/s':>9} {'writes/s':>9} {'read p95 ms':>12} "
+            f"{'write p95 ms':>13} {'write p99 ms':>13} {'errors':>7}"
+        )
+        for mode in modes:
+            result = self._run(mode, options)
+            self.stdout.write(
+                f"{mode:>9} {result['reads_per_s']:>9.0f} {result['writes_per_s']:>9.0f} "
+                f"{result['read_p95_ms']:>12.2f} {result['write_p95_ms']:>13.2f} "
+                f"{result['write_p99_ms']:>13.2f} {result['errors']:>7}"
+            )
+
+    def _run(self, mode, options):
+        options_dict = connection.settings_dict.setdefault('OPTIONS', {})
+        saved_options = dict(options_dict)
+        if mode == 'baseline':
+            options_dict.pop('transaction_mode', None)
+            options_dict.pop('timeout', None)
+            overrides = override_settings(SQLITE_PRAGMAS=BASELINE_PRAGMAS)
+        else:
+            overrides = override_settings()
+
+        with tempfile.TemporaryDirectory() as directory, overrides:
+            try:
+                with benchmark_database(test_name=os.path.join(directory, f'{mode}.sqlite3')):
+                    from api.queryplans import seed
+                    seed(options['rows'])
+                    connection.close()
+                    return self._load(options)
+            finally:
+                options_dict.clear()
+                options_dict.update(saved_options)
+
+    def _load(self, options):
+        from api.models import ActivityLog, Payment, Tenant
+
+        tenant_ids = list(Tenant.objects.values_list('id', flat=True))
+        payment_ids = list(Payment.objects.values_list('id', flat=True))
+        deadline = time.perf_counter() + options['seconds']
+        stats = {'reads': [], 'writes': [], 'errors': 0}
+        lock = threading.Lock()
+        start = threading.Barrier(options['readers'] + options['writers'])
+
+        def read(rng):
+            tenant_id = rng.choice(tenant_ids)
+            Payment.objects.filter(tenant_id=tenant_id).aggregate(total=Sum('amount'))
+            Tenant.objects.filter(pk=tenant_id).values_list('balance', flat=True).first()
+
+        def write(rng):
+            with transaction.atomic():
+                payment_id = rng.choice(payment_ids)
+                Payment.objects.filter(pk=payment_id).update(status=rng.choice(['paid', 'late']))
+                ActivityLog.objects.create(activity_type='payment', title='Benchmark', object_id=payment_id)
+
+        def worker(kind, operation, seed):
+            rng = random.Random(seed)
+            samples = []
+            errors = 0
+            start.wait()
+            try:
+                while time.perf_counter() < deadline:
+                    began = time.perf_counter()
+                    try:
+                        operation(rng)
+                    except OperationalError:
+                        errors += 1
+                        continue
+                    samples.append((time.perf_counter() - began) * 1000)
+            finally:
+                connection.close()
+            with lock:
+                stats[kind].extend(samples)
+                stats['errors'] += errors
+
+        threads = [
+            threading.Thread(target=worker, args=('reads', read, i)) for i in range(options['readers'])
+        ] + [
+            threading.Thread(target=worker, args=('writes', write, 1000 + i)) for i in range(options['writers'])
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        seconds = options['seconds']
+        return {
+            'reads_per_s': len(stats['reads']) / seconds,
+            'writes_per_s': len(stats['writes']) / seconds,
+            'read_p95_ms': percentile(stats['reads'], 0.95),
+            'write_p95_ms': percentile(stats['writes'], 0.95),
+            'write_p99_ms': percentile(stats['writes'], 0.99),
+            'read_median_ms': statistics.median(stats['reads']) if stats['reads'] else 0.0,
+            'errors': stats['errors'],
+        }
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from api.images import refresh_image_variants
+from api.models import Property, MaintenanceRequest
+
+MODELS = {'properties': Property, 'maintenance': MaintenanceRequest}
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate responsive image variants for property and maintenance "
+        "photos. Only rows whose images changed are processed unless --force."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', choices=[*MODELS, 'all'], default='all')
+        parser.add_argument('--workers', type=int, help='Worker processes (default: IMAGE_PIPELINE_WORKERS).')
+        parser.add_argument('--batch-size', type=int, default=200)
+        parser.add_argument('--force', action='store_true', help='Rebuild manifests for every row.')
+
+    def handle(self, *args, **options):
+        names = list(MODELS) if options['model'] == 'all' else [options['model']]
+        for name in names:
+            updated = refresh_image_variants(
+                MODELS[name], force=options['force'],
+                batch_size=options['batch_size'], workers=options['workers'],
+            )
+            self.stdout.write(f"{name}: updated {updated} rows")
@@ -0,0 +1,104 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from api.benchmarking import benchmark_database, without_background_work
+from api.sqlstats import budget_for, record_queries
+
+# Query strings for endpoints that do little work without one
+SAMPLE_QUERIES = {
+    'search': {'q': 'seed'},
+}
+
+
+def _patterns(resolver):
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _patterns(pattern)
+        elif isinstance(pattern, URLPattern):
+            yield pattern
+
+
+def budgeted_endpoints():
+    """``[(url name, view, budget, url kwargs)]`` for every GET endpoint with a query budget."""
+    endpoints = {}
+    for pattern in _patterns(get_resolver()):
+        budget = budget_for(pattern.callback, 'GET')
+        if budget is None or pattern.name is None or pattern.name in endpoints:
+            continue
+        kwargs = set(pattern.pattern.regex.groupindex) - {'format'}
+        endpoints[pattern.name] = (pattern.name, pattern.callback, budget, kwargs)
+    return list(endpoints.values())
+
+
+def _url_kwargs(view, names):
+    """Fill a detail route's ``pk`` with an existing row; None when the route needs more."""
+    if not names:
+        return {}
+    serializer_class = getattr(getattr(view, 'cls', None), 'serializer_class', None)
+    if names != {'pk'} or serializer_class is None:
+        return None
+    pk = serializer_class.Meta.model.objects.order_by('id').values_list('id', flat=True).first()
+    return {'pk': pk} if pk is not None else None
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database and request every GET endpoint that declares "
+        "a query budget; fails if any of them runs more queries than its budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=500, help='Tenants to seed (other tables scale with it).')
+
+    def handle(self, *args, **options):
+        with benchmark_database(), without_background_work():
+            from django.conf import settings
+            from django.contrib.auth.models import User
+            from django.test import Client
+            from rest_framework_simplejwt.tokens import RefreshToken
+
+            from api.queryplans import seed
+
+            self.stdout.write(f"Seeding {options['rows']} tenants...")
+            seed(options['rows'])
+            admin = User.objects.create_superuser('budget-admin', 'budget-admin@example.com', None)
+            client = Client(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(admin).access_token}")
+            settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+
+            failures = 0
+            for name, view, budget, kwarg_names in budgeted_endpoints():
+                kwargs = _url_kwargs(view, kwarg_names)
+                if kwargs is None:
+                    self.stdout.write(f"skipped    {name} (needs {', '.join(sorted(kwarg_names))})")
+                    continue
+                url = reverse(name, kwargs=kwargs)
+                # Cold caches: the budget covers the slowest path
+                cache.clear()
+                requested_at = timezone.now()
+                with record_queries() as stats:
+                    response = client.get(url, SAMPLE_QUERIES.get(name, {}))
+                # Prewarmed payloads must have been built by this request to be counted
+                computed_at = response.get('X-Computed-At')
+                precomputed = computed_at is not None and parse_datetime(computed_at) < requested_at
+
+                line = f"{name} {url}: {stats.count}/{budget} queries, {stats.milliseconds}ms"
+                if response.status_code >= 400:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f"HTTP {response.status_code}   {line}"))
+                elif precomputed:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f"PRECOMPUTED {line} (payload from {computed_at})"))
+                elif stats.count > budget:
+                    failures += 1
+                    self.stdout.write(self.style.ERROR(f"OVER       {line}"))
+                    for sql, times in stats.repeated()[:5]:
+                        self.stdout.write(f"    {times}x {sql}")
+                else:
+                    self.stdout.write(self.style.SUCCESS(f"ok         {line}"))
+
+        if failures:
+            raise CommandError(f"{failures} endpoints failed or went over their query budget")
+        self.stdout.write("All budgeted endpoints are within their query budgets")
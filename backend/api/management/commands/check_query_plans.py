@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.benchmarking import benchmark_database
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database and EXPLAIN every hot query; fails if any "
+        "of them reads a whole table instead of using an index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='Tenants to seed (other tables scale with it).')
+        parser.add_argument('--verbose-plans', action='store_true', help='Print every plan, not only failures.')
+
+    def handle(self, *args, **options):
+        with benchmark_database() as connection:
+            from api.queryplans import seed, check_plans
+
+            self.stdout.write(f"Seeding {options['rows']} tenants on {connection.vendor}...")
+            seed(options['rows'])
+            results = check_plans()
+
+        failures = [result for result in results if result['full_scans']]
+        for result in results:
+            if result['full_scans']:
+                self.stdout.write(self.style.ERROR(
+                    f"FULL SCAN  {result['name']} ({', '.join(result['full_scans'])})"
+                ))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"ok         {result['name']}"))
+            if result['full_scans'] or options['verbose_plans']:
+                self.stdout.write('    ' + result['plan'].replace('\n', '\n    '))
+
+        if failures:
+            raise CommandError(f"{len(failures)} of {len(results)} hot queries fall back to a full scan")
+        self.stdout.write(f"All {len(results)} hot queries use indexes")
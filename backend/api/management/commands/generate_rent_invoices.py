@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api.billing import parse_period, generate_rent_invoices, DEFAULT_BATCH_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the pending rent payments for a billing period for every "
+        "active tenant. Safe to re-run: existing invoices are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--period', help='Billing month as YYYY-MM (default: current month).')
+        parser.add_argument('--due-day', type=int, default=1, help='Day of the month rent is due (1-28).')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            period = parse_period(options['period'])
+            summary = generate_rent_invoices(
+                period, due_day=options['due_day'], batch_size=options['batch_size'],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        self.stdout.write(
+            f"{summary['period']}: created {summary['created']}, "
+            f"already invoiced {summary['already_invoiced']}, "
+            f"skipped {summary['skipped_without_property']} tenants without a property"
+        )
@@ -0,0 +1,60 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from api.synthetic import DEFAULT_BATCH_SIZE, generate
+
+PROGRESS_EVERY = 100000
+
+
+class Command(BaseCommand):
+    help = (
+        "Add a synthetic rental portfolio (Nairobi properties, tenants, rent "
+        "payments, maintenance requests and behaviour events) for load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--properties', type=int, default=1000)
+        parser.add_argument('--tenants', type=int, default=10000)
+        parser.add_argument('--payments', type=int, default=200000,
+                            help='Spread over the tenants as consecutive monthly rent invoices.')
+        parser.add_argument('--maintenance', type=int, default=2000)
+        parser.add_argument('--behaviors', type=int, default=50000)
+        parser.add_argument('--seed', type=int, default=0, help='The same seed generates the same data.')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--no-index', action='store_true',
+                            help='Skip rebuilding the full-text search index afterwards.')
+
+    def handle(self, *args, **options):
+        sizes = {name: options[name] for name in ('properties', 'tenants', 'payments', 'maintenance', 'behaviors')}
+        if any(size < 0 for size in sizes.values()):
+            raise CommandError("Row counts cannot be negative")
+        self.stdout.write(
+            f"Generating {', '.join(f'{size} {name}' for name, size in sizes.items())} "
+            f"into {connection.settings_dict['NAME']} (seed {options['seed']})..."
+        )
+
+        reported = {}
+
+        def progress(model_name, written):
+            if written - reported.get(model_name, 0) >= PROGRESS_EVERY:
+                reported[model_name] = written
+                self.stdout.write(f"  {model_name}: {written}...")
+
+        started = time.perf_counter()
+        try:
+            counts = generate(
+                **sizes, seed=options['seed'], batch_size=options['batch_size'],
+                index=not options['no_index'], progress=progress,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        seconds = time.perf_counter() - started
+
+        total = sum(counts.values())
+        for model_name, count in counts.items():
+            self.stdout.write(f"  {model_name}: {count}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {total} rows in {seconds:.1f}s ({total / max(seconds, 0.001):.0f} rows/s)"
+        ))
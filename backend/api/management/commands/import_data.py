@@ -0,0 +1,55 @@
+import csv
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from api.importing import IMPORT_FIELDS, FORMATS, DEFAULT_CHUNK_SIZE, Importer, detect_format, iter_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream properties, tenants or payments from a CSV or JSONL file into "
+        "the database in chunks, reporting rejected rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(IMPORT_FIELDS))
+        parser.add_argument('path', help="File to import, or '-' for stdin.")
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to the file extension, else csv.')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--owner', help='Email of the user who owns imported properties.')
+        parser.add_argument('--max-errors', type=int, default=20, help='Row errors to print.')
+
+    def handle(self, *args, **options):
+        owner = None
+        if options['owner']:
+            owner = User.objects.filter(email=options['owner']).first()
+            if owner is None:
+                raise CommandError(f"No user with email {options['owner']}")
+        fmt = options['format'] or detect_format(options['path'])
+        importer = Importer(options['kind'], chunk_size=options['chunk_size'], owner=owner)
+
+        unreadable = None
+        try:
+            if options['path'] == '-':
+                summary = importer.run(iter_records(sys.stdin.buffer, fmt))
+            else:
+                with open(options['path'], 'rb') as stream:
+                    summary = importer.run(iter_records(stream, fmt))
+        except OSError as e:
+            raise CommandError(str(e))
+        except (UnicodeDecodeError, csv.Error) as e:
+            # Rows before the unreadable part have already been imported
+            summary = importer.summary()
+            unreadable = e
+
+        self.stdout.write(
+            f"{summary['rows']} rows: {summary['created']} created, {summary['failed']} failed"
+        )
+        for error in summary['errors'][:options['max_errors']]:
+            self.stdout.write(f"  line {error['line']}: {error['errors']}")
+        if summary['failed'] > options['max_errors']:
+            self.stdout.write(f"  ... {summary['failed'] - options['max_errors']} more")
+        if unreadable is not None:
+            raise CommandError(f"Could not read file after {summary['rows']} rows: {unreadable}")
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from api import prewarm
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute cached admin dashboard payloads whenever the data version "
+        "changes. Runs continuously unless --once is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=30, help='Seconds between checks.')
+        parser.add_argument('--once', action='store_true', help='Refresh once and exit.')
+        parser.add_argument('--force', action='store_true', help='Recompute even if nothing changed.')
+
+    def handle(self, *args, **options):
+        if options['once']:
+            refreshed = prewarm.refresh_all(force=options['force'])
+            self.stdout.write(f"Refreshed: {', '.join(refreshed) or 'nothing'}")
+            return
+        self.stdout.write(f"Prewarming dashboards every {options['interval']}s")
+        prewarm.run_refresher(options['interval'])
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from api import fulltext
+from api.models import Property, Tenant, MaintenanceRequest
+
+MODELS = {'properties': Property, 'tenants': Tenant, 'maintenance': MaintenanceRequest}
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from the property, tenant and maintenance tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--model', choices=[*MODELS, 'all'], default='all')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if not fulltext.is_supported():
+            raise CommandError("Full-text search requires SQLite or PostgreSQL")
+        models = list(MODELS.values()) if options['model'] == 'all' else [MODELS[options['model']]]
+        indexed = fulltext.rebuild_index(models, batch_size=options['batch_size'])
+        self.stdout.write(f"Indexed {indexed} documents")
@@ -0,0 +1,84 @@
+import logging
+
+from django.conf import settings
+
+from . import activity, replicas, sqlstats
+
+logger = logging.getLogger('api.sql')
+
+
+class ActivityLogMiddleware:
+    """
+    Write the activity events a request commits in one batch when its
+    response is ready (see api.activity).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with activity.request_batch():
+            return self.get_response(request)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pin a user's replica-eligible reads to the primary for
+    ``REPLICA_PIN_SECONDS`` after a request in which they wrote, so they
+    never read data older than their own changes (see api.replicas).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with replicas.request_scope(request) as state:
+            response = self.get_response(request)
+        if state.wrote:
+            # DRF authenticates inside the view and copies the user onto the request
+            replicas.pin_to_primary(getattr(request, 'user', None))
+        return response
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Record the SQL each request runs (see api.sqlstats). The query count,
+    database time and number of repeated and similar queries go into
+    ``X-DB-*`` and ``Server-Timing`` response headers and a log record on
+    ``api.sql`` whose ``sql_stats`` attribute carries the details.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not getattr(settings, 'SQL_INSTRUMENTATION', True):
+            return self.get_response(request)
+        request.query_budget = None
+        with sqlstats.record_queries() as stats:
+            response = self.get_response(request)
+
+        if getattr(settings, 'SQL_STATS_HEADERS', True):
+            response['X-DB-Query-Count'] = str(stats.count)
+            response['X-DB-Time-Ms'] = str(stats.milliseconds)
+            response['X-DB-Duplicate-Queries'] = str(stats.duplicates)
+            response['X-DB-Similar-Queries'] = str(stats.similar)
+            response['Server-Timing'] = f'db;dur={stats.milliseconds};desc="{stats.count} queries"'
+
+        budget = request.query_budget
+        over_budget = budget is not None and stats.count > budget
+        details = dict(stats.as_dict(), method=request.method, path=request.path,
+                       status=response.status_code, budget=budget)
+        level = logging.WARNING if over_budget else logging.INFO
+        logger.log(
+            level,
+            f"{request.method} {request.path} ran {stats.count} queries in {stats.milliseconds}ms "
+            f"({stats.duplicates} duplicate, {stats.similar} similar, budget {budget})",
+            extra={'sql_stats': details},
+        )
+        if over_budget and sqlstats.strict_budgets():
+            sqlstats.check_budget(stats, budget, f"{request.method} {request.path}")
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = sqlstats.budget_for(view_func, request.method)
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:06
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_maintenancerequest_category_maintenancerequest_cost_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activity_type', models.CharField(choices=[('payment', 'Payment'), ('maintenance', 'Maintenance'), ('user', 'User'), ('ai', 'AI')], max_length=20)),
+                ('title', models.CharField(max_length=200)),
+                ('description', models.TextField(blank=True)),
+                ('status', models.CharField(choices=[('success', 'Success'), ('warning', 'Warning'), ('error', 'Error'), ('info', 'Info')], default='info', max_length=20)),
+                ('actor_id', models.IntegerField(blank=True, null=True)),
+                ('object_id', models.IntegerField(blank=True, null=True)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['activity_type', 'created_at'], name='activity_type_created_idx'), models.Index(fields=['created_at'], name='activity_created_idx')],
+            },
+        ),
+    ]
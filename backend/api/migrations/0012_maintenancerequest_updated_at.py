@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:31
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='maintenancerequest',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_maintenancerequest_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='payment',
+            name='billing_period',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.UniqueConstraint(condition=models.Q(('billing_period__isnull', False), ('payment_type', 'rent')), fields=('tenant', 'billing_period'), name='payment_unique_rent_period'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_payment_billing_period'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='maintenancerequest',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='images',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
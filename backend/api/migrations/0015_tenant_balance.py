@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:43
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_balances(apps, schema_editor):
+    """Set every tenant's balance to the total of their unpaid payments."""
+    Tenant = apps.get_model('api', 'Tenant')
+    Payment = apps.get_model('api', 'Payment')
+    totals = Payment.objects.filter(tenant=OuterRef('pk')).exclude(status='paid').order_by().values(
+        'tenant',
+    ).annotate(total=Sum('amount')).values('total')
+    Tenant.objects.update(balance=Coalesce(
+        Subquery(totals[:1]), Value(Decimal('0.00')),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenant',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, max_digits=12),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['tenant', 'due_date'], name='payment_tenant_due_idx'),
+        ),
+        migrations.RunPython(populate_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_tenant_balance'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['available', 'property_type', 'id'], name='property_avail_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['available', 'location', 'id'], name='property_avail_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['available', 'price'], name='property_avail_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['available', 'bedrooms'], name='property_avail_bedrooms_idx'),
+        ),
+    ]
@@ -0,0 +1,92 @@
+import re
+
+from django.db import migrations
+
+# Frozen copy of the api.fulltext schema and document builders as of this
+# migration; later changes there must not change what this migration does.
+TABLE = 'api_search_index'
+KIND_CODES = {'property': 1, 'tenant': 2, 'maintenance': 3}
+
+SQLITE_SCHEMA = [
+    f"CREATE VIRTUAL TABLE {TABLE} USING fts5("
+    "kind UNINDEXED, object_id UNINDEXED, title, body, summary UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+]
+POSTGRES_SCHEMA = [
+    f"CREATE TABLE {TABLE} ("
+    "doc_id bigint PRIMARY KEY, kind varchar(20) NOT NULL, object_id integer NOT NULL, "
+    "title text NOT NULL, body text NOT NULL, summary text NOT NULL, "
+    "document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', title), 'A') || setweight(to_tsvector('simple', body), 'B')"
+    ") STORED)",
+    f"CREATE INDEX {TABLE}_document_idx ON {TABLE} USING GIN (document)",
+]
+
+
+def _property_document(obj):
+    return obj.name, f"{obj.location} {obj.property_type}", obj.location
+
+
+def _tenant_document(obj):
+    email = obj.email or ''
+    phone = obj.phone or ''
+    body = ' '.join([email, re.sub(r'[@.+_-]', ' ', email), phone, re.sub(r'\D', '', phone)])
+    return f"{obj.first_name} {obj.last_name}", body, email
+
+
+def _maintenance_document(obj):
+    issue = obj.issue_description or ''
+    title = issue.splitlines()[0][:120] if issue.strip() else ''
+    body = ' '.join([issue, obj.resolution_notes or '', obj.category or '', obj.vendor_name or ''])
+    return title, body, obj.status
+
+
+DOCUMENTS = {
+    'Property': ('property', _property_document),
+    'Tenant': ('tenant', _tenant_document),
+    'MaintenanceRequest': ('maintenance', _maintenance_document),
+}
+
+
+def _insert(cursor, vendor, rows):
+    if not rows:
+        return
+    key = 'rowid' if vendor == 'sqlite' else 'doc_id'
+    cursor.executemany(
+        f"INSERT INTO {TABLE} ({key}, kind, object_id, title, body, summary) VALUES (%s, %s, %s, %s, %s, %s)",
+        rows,
+    )
+
+
+def create_search_index(apps, schema_editor, batch_size=1000):
+    connection = schema_editor.connection
+    if connection.vendor not in ('sqlite', 'postgresql'):
+        return
+    with connection.cursor() as cursor:
+        for statement in SQLITE_SCHEMA if connection.vendor == 'sqlite' else POSTGRES_SCHEMA:
+            cursor.execute(statement)
+        for model_name, (kind, build) in DOCUMENTS.items():
+            rows = []
+            for obj in apps.get_model('api', model_name).objects.order_by().iterator(chunk_size=batch_size):
+                title, body, summary = build(obj)
+                rows.append((obj.pk * 4 + KIND_CODES[kind], kind, obj.pk, title, body, summary or ''))
+                if len(rows) >= batch_size:
+                    _insert(cursor, connection.vendor, rows)
+                    rows = []
+            _insert(cursor, connection.vendor, rows)
+
+
+def drop_search_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_property_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:50
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='aimodelprediction',
+            index=models.Index(fields=['model_type', 'created_at'], name='prediction_type_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerequest',
+            index=models.Index(fields=['status', 'priority_score'], name='maint_status_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('status', 'paid')), fields=['payment_date'], name='payment_paid_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['location', 'property_type', 'available'], name='property_loc_type_avail_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['behavior_risk_score'], name='tenant_risk_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenant',
+            index=models.Index(fields=['payment_reliability_score'], name='tenant_reliability_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tenantbehavior',
+            index=models.Index(fields=['tenant', 'timestamp'], name='behavior_tenant_time_idx'),
+        ),
+    ]
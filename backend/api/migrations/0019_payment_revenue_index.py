@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='payment_payment_date_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='payment_paid_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['status', 'payment_date'], name='payment_status_paid_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from datetime import datetime, date
 
 def default_due_date():
@@ -53,12 +54,37 @@ class Property(models.Model):
     bathrooms = models.IntegerField(default=1)
     square_feet = models.IntegerField(default=0)
     available = models.BooleanField(default=True)
+    # Original photo references and their generated size variants (see api.images)
+    images = models.JSONField(default=list, blank=True)
+    image_variants = models.JSONField(default=list, blank=True)
     occupancy_rate = models.FloatField(default=0.0)  # AI-calculated
     demand_score = models.FloatField(default=0.0)  # AI-calculated demand
     risk_score = models.FloatField(default=0.0)  # AI-calculated risk
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['property_type', 'id'], name='property_type_id_idx'),
+            models.Index(fields=['location', 'id'], name='property_location_id_idx'),
+            models.Index(fields=['available', 'id'], name='property_available_id_idx'),
+            models.Index(fields=['price'], name='property_price_idx'),
+            # Available-properties search (see api.search)
+            models.Index(fields=['available', 'property_type', 'id'], name='property_avail_type_idx'),
+            models.Index(fields=['available', 'location', 'id'], name='property_avail_location_idx'),
+            models.Index(fields=['available', 'price'], name='property_avail_price_idx'),
+            models.Index(fields=['available', 'bedrooms'], name='property_avail_bedrooms_idx'),
+            # Comparable-property lookups in ai_services (same location and type)
+            models.Index(fields=['location', 'property_type', 'available'], name='property_loc_type_avail_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded risk score so signal handlers can detect changes
+        instance._loaded_risk_score = instance.__dict__.get('risk_score')
+        return instance
+
     def __str__(self):
         return self.name
 
@@ -122,9 +148,31 @@ class Tenant(models.Model):
     tenant_satisfaction_score = models.FloatField(default=0.0)  # AI-calculated
     late_payment_count = models.IntegerField(default=0)
     total_payments_made = models.IntegerField(default=0)
+    # Outstanding total of unpaid payments, maintained by api.ledger
+    balance = models.DecimalField(max_digits=12, decimal_places=2, default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'id'], name='tenant_status_id_idx'),
+            models.Index(fields=['active', 'id'], name='tenant_active_id_idx'),
+            models.Index(fields=['last_name'], name='tenant_last_name_idx'),
+            # Risk and reliability thresholds on the dashboards and AI insights
+            models.Index(fields=['behavior_risk_score'], name='tenant_risk_score_idx'),
+            models.Index(fields=['payment_reliability_score'], name='tenant_reliability_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded risk score so signal handlers can detect changes
+        instance._loaded_risk_score = instance.__dict__.get('behavior_risk_score')
+        # and the account it was linked to, whose cached profile showed it
+        instance._loaded_user_id = instance.__dict__.get('user_id')
+        instance._loaded_email = instance.__dict__.get('email')
+        return instance
+
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
@@ -156,6 +204,8 @@ class Payment(models.Model):
         default='rent',
     )
     notes = models.TextField(blank=True)
+    # First day of the month a generated rent invoice covers
+    billing_period = models.DateField(null=True, blank=True)
     
     # AI prediction fields
     late_payment_probability = models.FloatField(default=0.0)  # AI-calculated
@@ -165,6 +215,35 @@ class Payment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'id'], name='payment_status_id_idx'),
+            models.Index(fields=['status', 'due_date'], name='payment_status_due_idx'),
+            models.Index(fields=['due_date'], name='payment_due_date_idx'),
+            models.Index(fields=['tenant', 'status'], name='payment_tenant_status_idx'),
+            models.Index(fields=['tenant', 'due_date'], name='payment_tenant_due_idx'),
+            # Revenue totals only ever read paid payments by payment date. Not a
+            # partial index on status='paid': SQLite cannot match that condition
+            # against the bound parameter of a Django query.
+            models.Index(fields=['status', 'payment_date'], name='payment_status_paid_idx'),
+        ]
+        constraints = [
+            # One rent invoice per tenant and billing period (see api.billing)
+            models.UniqueConstraint(
+                fields=['tenant', 'billing_period'],
+                condition=models.Q(payment_type='rent', billing_period__isnull=False),
+                name='payment_unique_rent_period',
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded status so signal handlers can detect transitions
+        instance._loaded_status = instance.__dict__.get('status')
+        instance._loaded_tenant_id = instance.__dict__.get('tenant_id')
+        return instance
+
     def __str__(self):
         return f"Payment {self.id} - {self.amount}"
 
@@ -196,13 +275,31 @@ class MaintenanceRequest(models.Model):
     vendor_phone = models.CharField(max_length=50, blank=True)
     resolution_notes = models.TextField(blank=True)
     images = models.JSONField(default=list, blank=True)
+    image_variants = models.JSONField(default=list, blank=True)
 
     # AI-calculated fields
     priority_score = models.FloatField(default=0.0)  # AI-calculated urgency
     completion_time_predicted = models.IntegerField(default=0)  # AI-predicted hours
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'id'], name='maint_status_id_idx'),
+            models.Index(fields=['priority', 'id'], name='maint_priority_id_idx'),
+            models.Index(fields=['category', 'id'], name='maint_category_id_idx'),
+            models.Index(fields=['created_at'], name='maint_created_at_idx'),
+            models.Index(fields=['status', 'priority_score'], name='maint_status_priority_idx'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded status so signal handlers can detect transitions
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
     def __str__(self):
         return f"Maintenance {self.id} - {self.status}"
 
@@ -223,6 +320,11 @@ class TenantBehavior(models.Model):
     risk_score = models.FloatField(default=0.0)  # AI-calculated risk for this behavior
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['tenant', 'timestamp'], name='behavior_tenant_time_idx'),
+        ]
+
     def __str__(self):
         return f"{self.tenant.first_name} - {self.behavior_type}"
 
@@ -242,5 +344,54 @@ class AIModelPrediction(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_accurate = models.BooleanField(null=True, blank=True)  # For model improvement feedback
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['model_type', 'created_at'], name='prediction_type_created_idx'),
+        ]
+
     def __str__(self):
         return f"{self.model_type} - {self.created_at}"
+
+class ActivityLog(models.Model):
+    """
+    Append-only log of system events shown in the admin activity feed.
+
+    Rows are written in batches by ``api.activity`` and never updated.
+    """
+    ACTIVITY_TYPES = [
+        ('payment', 'Payment'),
+        ('maintenance', 'Maintenance'),
+        ('user', 'User'),
+        ('ai', 'AI'),
+    ]
+    ACTIVITY_STATUS = [
+        ('success', 'Success'),
+        ('warning', 'Warning'),
+        ('error', 'Error'),
+        ('info', 'Info'),
+    ]
+
+    activity_type = models.CharField(max_length=20, choices=ACTIVITY_TYPES)
+    title = models.CharField(max_length=200)
+    description = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=ACTIVITY_STATUS, default='info')
+    # Plain id rather than a FK so deleting a user never rewrites log rows
+    actor_id = models.IntegerField(null=True, blank=True)
+    object_id = models.IntegerField(null=True, blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['activity_type', 'created_at'], name='activity_type_created_idx'),
+            models.Index(fields=['created_at'], name='activity_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('ActivityLog entries are append-only')
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.activity_type} - {self.title}"
@@ -0,0 +1,64 @@
+import json
+
+from django.db import connections
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+def approximate_count(queryset):
+    """
+    Estimate the number of rows in ``queryset`` without a full COUNT.
+
+    On PostgreSQL the planner's row estimate is used; other backends fall
+    back to an exact ``count()``.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+    sql, params = queryset.order_by().values('pk').query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination on ``-id`` for the API viewsets.
+
+    Every page is a ``WHERE id < cursor ORDER BY id DESC LIMIT n`` query, so
+    deep pages cost the same as the first. Clients choose the page size with
+    ``page_size`` and can ask for an approximate total with ``count=1``.
+    """
+    ordering = '-id'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    count_query_param = 'count'
+    approximate_total = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # A paginator serves one request, and the ETag watermark pages the
+        # same queryset before the response does: count it only once
+        if self.approximate_total is None and request.query_params.get(self.count_query_param) in ('1', 'true'):
+            self.approximate_total = approximate_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+        if self.approximate_total is not None:
+            payload['count'] = self.approximate_total
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count'] = {
+            'type': 'integer',
+            'description': 'Approximate total, only present when count=1 is passed.',
+        }
+        return response_schema
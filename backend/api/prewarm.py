@@ -0,0 +1,184 @@
+"""
+Stale-while-revalidate cache for expensive admin dashboard payloads.
+
+Payload builders are registered by name. Requests always get the latest
+computed copy straight from the cache; when the data version has moved on
+(or the copy is older than ``DASHBOARD_PREWARM_MAX_AGE``) a refresh runs in
+the background. A refresher thread, or the ``prewarm_dashboards`` command
+in a separate worker, recomputes payloads whose data version has changed.
+Entries expire from the cache after twice ``DASHBOARD_PREWARM_MAX_AGE``.
+Like the data version, they must live in a cache shared by all workers (see
+api.versioning); otherwise a worker only notices its own writes, and picks
+up the others' once its copy is ``DASHBOARD_PREWARM_MAX_AGE`` old.
+"""
+import importlib
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.response import Response
+
+from .replicas import replica_reads
+from .versioning import get_data_version
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAYLOAD_MODULES = ['api.admin_views', 'ai_services.views']
+
+_registry = {}
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+_refresher = None
+_refresher_stop = None
+_refresher_lock = threading.Lock()
+
+
+def register_payload(name, compute):
+    """Register ``compute()`` as the builder for payload ``name``."""
+    _registry[name] = compute
+
+
+def _load_registry():
+    for module in getattr(settings, 'DASHBOARD_PREWARM_MODULES', DEFAULT_PAYLOAD_MODULES):
+        importlib.import_module(module)
+
+
+def _cache_key(name):
+    return f"prewarm:{name}"
+
+
+def _max_age():
+    return getattr(settings, 'DASHBOARD_PREWARM_MAX_AGE', 3600)
+
+
+def _age_seconds(entry):
+    return (timezone.now() - parse_datetime(entry['computed_at'])).total_seconds()
+
+
+def _is_current(entry, version):
+    return entry['version'] == version and _age_seconds(entry) < _max_age()
+
+
+def refresh_payload(name, force=False):
+    """Recompute payload ``name`` unless the cached copy is still current."""
+    # Read the version first so writes made while computing trigger another refresh
+    version = get_data_version()
+    entry = cache.get(_cache_key(name))
+    if not force and entry is not None and _is_current(entry, version):
+        return entry
+    # Payloads are already served stale-while-revalidate, so replica lag is harmless
+    with replica_reads():
+        data = _registry[name]()
+    entry = {
+        'data': data,
+        'version': version,
+        'computed_at': timezone.now().isoformat(),
+    }
+    # Kept past max age so a stale copy can still be served while it refreshes
+    cache.set(_cache_key(name), entry, _max_age() * 2)
+    return entry
+
+
+def refresh_all(force=False):
+    """Refresh every registered payload; returns the names recomputed."""
+    _load_registry()
+    refreshed = []
+    for name in list(_registry):
+        try:
+            before = cache.get(_cache_key(name))
+            entry = refresh_payload(name, force=force)
+            if before is None or entry['computed_at'] != before['computed_at']:
+                refreshed.append(name)
+        except Exception as e:
+            logger.error(f"Error prewarming {name}: {str(e)}")
+    return refreshed
+
+
+def _refresh_in_background(name):
+    with _refreshing_lock:
+        if name in _refreshing:
+            return
+        _refreshing.add(name)
+
+    def run():
+        try:
+            refresh_payload(name)
+        except Exception as e:
+            logger.error(f"Error refreshing {name}: {str(e)}")
+        finally:
+            close_old_connections()
+            with _refreshing_lock:
+                _refreshing.discard(name)
+
+    threading.Thread(target=run, name=f"prewarm-{name}", daemon=True).start()
+
+
+def get_payload(name):
+    """
+    Return the cached entry for ``name``, computing it only if it has never
+    been computed. Out-of-date entries are served as-is and refreshed in the
+    background.
+    """
+    ensure_refresher()
+    entry = cache.get(_cache_key(name))
+    if entry is None:
+        return refresh_payload(name, force=True)
+    if not _is_current(entry, get_data_version()):
+        _refresh_in_background(name)
+    return entry
+
+
+def payload_response(entry):
+    """Build a Response for a cached entry with its staleness metadata."""
+    response = Response(entry['data'])
+    response['X-Computed-At'] = entry['computed_at']
+    response['Age'] = str(max(int(_age_seconds(entry)), 0))
+    return response
+
+
+def run_refresher(interval, stop_event=None):
+    """Refresh changed payloads every ``interval`` seconds until stopped."""
+    while stop_event is None or not stop_event.is_set():
+        refresh_all()
+        close_old_connections()
+        if stop_event is None:
+            time.sleep(interval)
+        else:
+            stop_event.wait(interval)
+
+
+def ensure_refresher():
+    """Start the in-process refresher thread if enabled and not running."""
+    global _refresher, _refresher_stop
+    if _refresher is not None or not getattr(settings, 'DASHBOARD_PREWARM_IN_PROCESS', True):
+        return
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher_stop = threading.Event()
+            _refresher = threading.Thread(
+                target=run_refresher,
+                args=(getattr(settings, 'DASHBOARD_PREWARM_INTERVAL', 30), _refresher_stop),
+                name='dashboard-prewarmer',
+                daemon=True,
+            )
+            _refresher.start()
+
+
+def stop_refresher(timeout=None):
+    """
+    Stop the in-process refresher thread, waiting for a refresh in progress
+    to finish. ``ensure_refresher()`` starts a new one on the next request
+    unless ``DASHBOARD_PREWARM_IN_PROCESS`` is off.
+    """
+    global _refresher, _refresher_stop
+    with _refresher_lock:
+        thread, stop_event = _refresher, _refresher_stop
+        _refresher = _refresher_stop = None
+    if thread is not None:
+        stop_event.set()
+        thread.join(timeout)
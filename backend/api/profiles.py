@@ -0,0 +1,114 @@
+"""
+Cached profile payload for ``/auth/me/``.
+
+The frontend asks for the current profile on every page load. The profile
+is built from one query that joins the user, their tenant record (through
+the ``tenant_profile`` relation) and its property, and is cached per user.
+Signal handlers drop the cached copy whenever the user, their tenant or the
+tenant's property changes.
+"""
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Tenant
+
+
+def _cache_key(user_id):
+    return f"profile:{user_id}"
+
+
+def _timeout():
+    return getattr(settings, 'PROFILE_CACHE_TIMEOUT', 300)
+
+
+def _linked_tenant(user):
+    """
+    The tenant record shown on ``user``'s profile. Accounts without a linked
+    tenant (staff and tenants created before accounts were linked) take one
+    more query, an email lookup, on every cache miss.
+    """
+    try:
+        return user.tenant_profile
+    except Tenant.DoesNotExist:
+        pass
+    # Tenants created before accounts were linked are matched by email
+    return Tenant.objects.select_related('property').filter(email=user.email).first()
+
+
+def build_profile(user_id):
+    """Build the profile payload for ``user_id`` from the database."""
+    user = User.objects.select_related('tenant_profile__property').get(pk=user_id)
+    tenant = _linked_tenant(user)
+
+    if tenant is not None:
+        user_type = 'tenant'
+    elif user.is_staff:
+        user_type = 'super_admin' if user.is_superuser else 'admin'
+    else:
+        user_type = 'user'  # Regular user without tenant record
+
+    profile = {
+        'id': user.id,
+        'email': user.email,
+        'username': user.username,
+        'full_name': user.get_full_name(),
+        'is_staff': user.is_staff,
+        'is_superuser': user.is_superuser,
+        'user_type': user_type,
+    }
+    if tenant is not None:
+        property = tenant.property
+        profile.update({
+            'tenant_id': tenant.id,
+            'property_id': property.id if property else None,
+            'property_name': property.name if property else None,
+            'active': tenant.active,
+            'credit_score': tenant.credit_score,
+            'payment_reliability_score': tenant.payment_reliability_score,
+        })
+    return profile
+
+
+def get_profile(user):
+    """Return the cached profile for ``user``, building it on a miss."""
+    key = _cache_key(user.pk)
+    profile = cache.get(key)
+    if profile is None:
+        profile = build_profile(user.pk)
+        cache.set(key, profile, _timeout())
+    return profile
+
+
+def users_for_tenant(tenant):
+    """
+    Ids of the users whose profile shows ``tenant``, both now and as it was
+    loaded: relinking a tenant changes the profile of the old account too.
+    """
+    links = {(tenant.user_id, tenant.email)}
+    if hasattr(tenant, '_loaded_user_id'):
+        links.add((tenant._loaded_user_id, tenant._loaded_email))
+    user_ids = {user_id for user_id, _ in links if user_id is not None}
+    emails = {email for user_id, email in links if user_id is None and email}
+    if emails:
+        user_ids.update(User.objects.filter(email__in=emails).values_list('id', flat=True))
+    return list(user_ids)
+
+
+def users_for_property(property_id):
+    """Ids of the users whose profile shows property ``property_id``."""
+    return list(User.objects.filter(
+        Q(tenant_profile__property_id=property_id)
+        | Q(email__in=Tenant.objects.filter(
+            property_id=property_id, user__isnull=True,
+        ).values('email'))
+    ).values_list('id', flat=True))
+
+
+def invalidate_profiles(user_ids):
+    """Drop cached profiles for ``user_ids`` once the transaction commits."""
+    keys = [_cache_key(user_id) for user_id in user_ids if user_id is not None]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
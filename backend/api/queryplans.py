@@ -0,0 +1,136 @@
+"""
+Query-plan checks for the hot query paths.
+
+``_hot_queries`` mirrors the filters the dashboards, AI services, billing
+and search run most often; ``_list_filter_queries`` is every ``filter_params``
+filter of the API viewsets with their ``-id`` keyset page. ``check_plans``
+runs EXPLAIN on each one and reports any that read a whole table instead of
+using an index. The
+``check_query_plans`` command runs the checks against a seeded throwaway
+database, so plans reflect a realistically sized and analyzed dataset.
+"""
+import random
+import re
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from . import synthetic
+from .models import (
+    Property, Tenant, Payment, MaintenanceRequest, TenantBehavior, AIModelPrediction, ActivityLog,
+)
+
+SEED_BATCH_SIZE = 5000
+
+
+def _hot_queries():
+    """``[(name, queryset)]`` with the same filters and ordering as the code that runs them."""
+    now = timezone.now()
+    today = now.date()
+    month_start = today.replace(day=1)
+    tenant_id = Tenant.objects.order_by('id').values_list('id', flat=True).first() or 1
+    return [
+        ('payments: paid this month (revenue)',
+         Payment.objects.filter(status='paid', payment_date__gte=month_start).values('amount')),
+        ('payments: overdue by due date',
+         Payment.objects.filter(status__in=['pending', 'late'], due_date__lt=today).order_by('due_date')),
+        ('payments: due date range',
+         Payment.objects.filter(due_date__gte=month_start, due_date__lte=today)),
+        ('payments: late payments of a tenant',
+         Payment.objects.filter(tenant_id=tenant_id, status__in=['late', 'overdue'])),
+        ('payments: tenant ledger',
+         Payment.objects.filter(tenant_id=tenant_id).order_by('due_date', 'id')),
+        ('properties: comparable occupied units',
+         Property.objects.filter(location='Kilimani', property_type='studio', available=False)),
+        ('properties: available search by type',
+         Property.objects.filter(available=True, property_type__in=['studio']).order_by('-id')[:50]),
+        ('tenants: high behaviour risk',
+         Tenant.objects.filter(behavior_risk_score__gt=7.0)),
+        ('tenants: top payment reliability',
+         Tenant.objects.filter(payment_reliability_score__gt=8.0)),
+        ('tenants: at risk',
+         Tenant.objects.filter(behavior_risk_score__gt=6.0, payment_reliability_score__lt=6.0)),
+        ('maintenance: urgent submitted requests',
+         MaintenanceRequest.objects.filter(status='submitted', priority_score__gt=7.0)),
+        ('behaviours: recent for a tenant',
+         TenantBehavior.objects.filter(tenant_id=tenant_id, timestamp__gte=now - timedelta(days=90))),
+        ('predictions: latest of a model type',
+         AIModelPrediction.objects.filter(model_type='risk_assessment').order_by('-created_at')[:20]),
+        ('activity: recent feed',
+         ActivityLog.objects.order_by('-created_at', '-id')[:20]),
+    ]
+
+
+def _list_filter_queries():
+    """
+    ``[(name, queryset)]`` for each list filter of the API viewsets on its
+    own, as the first cursor page runs it: ordered by ``-id`` with the page
+    size plus one. Filter values are taken from a row of the seeded data.
+    """
+    from rest_framework.settings import api_settings
+
+    from .views import PropertyViewSet, TenantViewSet, PaymentViewSet, MaintenanceRequestViewSet
+
+    queries = []
+    for viewset in (PropertyViewSet, TenantViewSet, PaymentViewSet, MaintenanceRequestViewSet):
+        model = viewset.serializer_class.Meta.model
+        for param, lookup in viewset.filter_params.items():
+            field, _, suffix = lookup.partition('__')
+            attname = model._meta.get_field(field).attname
+            value = model.objects.filter(**{f"{attname}__isnull": False}).order_by('id').values_list(
+                attname, flat=True,
+            ).first()
+            queryset = model.objects.filter(**{lookup: [value] if suffix == 'in' else value})
+            queries.append((
+                f"{model._meta.verbose_name} list: ?{param}=",
+                queryset.order_by('-id')[:api_settings.PAGE_SIZE + 1],
+            ))
+    return queries
+
+
+def full_scans(plan, vendor):
+    """Tables ``plan`` (EXPLAIN output) reads in full."""
+    if vendor == 'sqlite':
+        # "SCAN api_payment" is a table scan; index scans read "... USING [COVERING] INDEX ..."
+        return re.findall(r'SCAN (\w+)(?! USING)\s*$', plan, flags=re.MULTILINE)
+    if vendor == 'postgresql':
+        return re.findall(r'Seq Scan on (\w+)', plan)
+    return []
+
+
+def check_plans(queries=None):
+    """Return ``[{'name', 'plan', 'full_scans'}]`` for the hot queries."""
+    results = []
+    for name, queryset in queries or _hot_queries() + _list_filter_queries():
+        plan = queryset.explain()
+        results.append({'name': name, 'plan': plan, 'full_scans': full_scans(plan, connection.vendor)})
+    return results
+
+
+def seed(rows, seed_value=0):
+    """
+    Fill an empty database with ``rows`` tenants and proportionate
+    properties, payments, requests, behaviours and predictions (see
+    api.synthetic). Score and status distributions are skewed like
+    production data, so threshold filters are selective.
+    """
+    synthetic.generate(
+        properties=max(rows // 2, 1), tenants=rows, payments=rows * 12,
+        maintenance=rows // 2, behaviors=rows * 2, seed=seed_value,
+    )
+    rng = random.Random(seed_value)
+    now = timezone.now()
+    model_types = [choice for choice, _ in AIModelPrediction.MODEL_TYPES]
+    AIModelPrediction.objects.bulk_create([
+        AIModelPrediction(model_type=rng.choice(model_types), input_data={}, prediction_result={})
+        for _ in range(rows)
+    ], batch_size=SEED_BATCH_SIZE)
+    ActivityLog.objects.bulk_create([
+        ActivityLog(activity_type='payment', title='Seed', created_at=now - timedelta(minutes=i))
+        for i in range(rows)
+    ], batch_size=SEED_BATCH_SIZE)
+
+    # Planner statistics, as a production database would have them
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
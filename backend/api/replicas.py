@@ -0,0 +1,136 @@
+"""
+Read-replica routing.
+
+Reads go to the primary (``default``) unless they run inside
+``replica_reads()`` (or a function decorated with ``@use_replica``); those
+reads are spread across ``DATABASE_REPLICAS``. Dashboard payloads, AI
+feature extraction and exports opt in. Writes always go to the primary.
+
+Replicas lag behind the primary, so replica reads fall back to the primary
+when:
+
+- a transaction is open on the primary;
+- the current request has already written; or
+- the requesting user wrote within the last ``REPLICA_PIN_SECONDS``
+  (read-your-writes, tracked by ``api.middleware.ReadYourWritesMiddleware``).
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_replica_reads = ContextVar('replica_reads', default=False)
+_request_state = ContextVar('replica_request_state', default=None)
+
+
+@dataclass
+class RequestState:
+    request: object
+    wrote: bool = False
+    pinned: bool = None
+
+
+def replica_aliases():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def _pin_key(user_id):
+    return f"replica-pin:{user_id}"
+
+
+def _pin_seconds():
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+
+@contextmanager
+def replica_reads():
+    """Let reads in this block go to a read replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def use_replica(func):
+    """Decorator form of ``replica_reads()``."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with replica_reads():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _user_pinned(state):
+    if state.pinned is None:
+        # Resolving a lazy request.user queries the database; do it on the primary
+        state.pinned = False
+        token = _replica_reads.set(False)
+        try:
+            user = getattr(state.request, 'user', None)
+            state.pinned = bool(
+                user is not None and user.is_authenticated and cache.get(_pin_key(user.pk))
+            )
+        finally:
+            _replica_reads.reset(token)
+    return state.pinned
+
+
+def primary_required():
+    """True when a replica read must use the primary to see recent writes."""
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return True
+    state = _request_state.get()
+    return state is not None and (state.wrote or _user_pinned(state))
+
+
+def read_alias():
+    """Database alias for a replica-eligible read made now."""
+    replicas = replica_aliases()
+    if not replicas or primary_required():
+        return DEFAULT_DB_ALIAS
+    return random.choice(replicas)
+
+
+@contextmanager
+def request_scope(request):
+    """Track writes made while handling ``request``; yields the RequestState."""
+    state = RequestState(request)
+    token = _request_state.set(state)
+    try:
+        yield state
+    finally:
+        _request_state.reset(token)
+
+
+def pin_to_primary(user):
+    """Keep ``user``'s replica-eligible reads on the primary for a while."""
+    if replica_aliases() and user is not None and user.is_authenticated:
+        cache.set(_pin_key(user.pk), True, _pin_seconds())
+
+
+class ReplicaRouter:
+    """Database router for ``DATABASE_ROUTERS``."""
+
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get():
+            return read_alias()
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
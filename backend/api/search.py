@@ -0,0 +1,120 @@
+"""
+Faceted search over available properties.
+
+Filters are whitelisted query parameters applied by ``QueryParamFilter``;
+each one is backed by an ``(available, ...)`` index on Property. Results are
+keyset-paginated on ``-id``. The first page also carries facet counts for
+type, location and price band, computed from one ``GROUP BY`` over the
+filtered rows. Whole pages are cached under the data version, so a repeated
+search costs one cache read until a write changes the data.
+"""
+import hashlib
+from decimal import Decimal
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, CharField, Count, Q, Value, When
+
+from .filters import QueryParamFilter
+from .models import Property
+from .pagination import IdCursorPagination
+from .versioning import versioned_key
+
+SEARCH_FILTERS = {
+    'type': 'property_type__in',
+    'location': 'location__in',
+    'min_price': 'price__gte',
+    'max_price': 'price__lte',
+    'bedrooms': 'bedrooms__in',
+    'min_bedrooms': 'bedrooms__gte',
+}
+RESULT_FIELDS = (
+    'id', 'name', 'location', 'property_type', 'price',
+    'bedrooms', 'bathrooms', 'square_feet',
+)
+
+
+def _price_bands():
+    """``[(label, lower, upper)]`` from the ascending PROPERTY_PRICE_BANDS bounds."""
+    bounds = [Decimal(str(bound)) for bound in getattr(settings, 'PROPERTY_PRICE_BANDS', [10000, 20000, 35000, 50000])]
+    lowers = [Decimal('0')] + bounds
+    uppers = bounds + [None]
+    return [
+        (f"{lower:.0f}-{upper:.0f}" if upper is not None else f"{lower:.0f}+", lower, upper)
+        for lower, upper in zip(lowers, uppers)
+    ]
+
+
+def _price_band_expression(bands):
+    return Case(
+        *[When(price__lt=upper, then=Value(label)) for label, _, upper in bands if upper is not None],
+        default=Value(bands[-1][0]),
+        output_field=CharField(),
+    )
+
+
+def facet_counts(queryset):
+    """Counts per type, location and price band for ``queryset`` in one grouped query."""
+    bands = _price_bands()
+    groups = queryset.order_by().annotate(price_band=_price_band_expression(bands)).values(
+        'property_type', 'location', 'price_band',
+    ).annotate(count=Count('id'))
+
+    types, locations, prices = {}, {}, {label: 0 for label, _, _ in bands}
+    for group in groups:
+        count = group['count']
+        types[group['property_type']] = types.get(group['property_type'], 0) + count
+        locations[group['location']] = locations.get(group['location'], 0) + count
+        prices[group['price_band']] += count
+
+    def ranked(counts):
+        return [
+            {'value': value, 'count': count}
+            for value, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        ]
+
+    return {
+        'total': sum(types.values()),
+        'facets': {
+            'type': ranked(types),
+            'location': ranked(locations),
+            'price': [
+                {'value': label, 'min': lower, 'max': upper, 'count': prices[label]}
+                for label, lower, upper in bands
+            ],
+        },
+    }
+
+
+def search_available_properties(request):
+    """
+    Build the response payload for one page of available properties. Raises
+    DRF ValidationError for invalid filter values.
+    """
+    queryset = QueryParamFilter().filter_queryset(
+        request, Property.objects.filter(available=True), SimpleNamespace(filter_params=SEARCH_FILTERS),
+    )
+    paginator = IdCursorPagination()
+    page = paginator.paginate_queryset(queryset.values(*RESULT_FIELDS), request)
+    payload = {
+        'properties': page,
+        'next': paginator.get_next_link(),
+        'previous': paginator.get_previous_link(),
+    }
+    if paginator.cursor_query_param not in request.query_params:
+        # Facets describe the whole result set; later pages reuse the first page's
+        payload.update(facet_counts(queryset))
+    return payload
+
+
+def cached_search(request):
+    """``search_available_properties`` cached per query under the data version."""
+    params = sorted((key, value) for key, values in request.query_params.lists() for value in values)
+    fingerprint = hashlib.md5(repr((request.build_absolute_uri(request.path), params)).encode()).hexdigest()
+    key = versioned_key(f"property-search:{fingerprint}")
+    payload = cache.get(key)
+    if payload is None:
+        payload = search_available_properties(request)
+        cache.set(key, payload, getattr(settings, 'PROPERTY_SEARCH_CACHE_TIMEOUT', 300))
+    return payload
@@ -1,10 +1,56 @@
 from rest_framework import serializers
+from .images import expand_variants
 from .models import Property, Tenant, Payment, MaintenanceRequest
 
 
-class PropertySerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Limit serializer output to the comma separated ``?fields=`` parameter on
+    GET requests. ``field_columns`` lists the model columns needed by fields
+    that are not backed by a single model field, so views can project the
+    query with ``.only()``.
+    """
+    field_columns = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.requested_fields(self.context.get('request'))
+        if requested is not None:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+    @classmethod
+    def requested_fields(cls, request):
+        if request is None or request.method != 'GET':
+            return None
+        raw = request.query_params.get('fields')
+        if not raw:
+            return None
+        # Always keep the primary key so clients can address rows
+        return {name.strip() for name in raw.split(',') if name.strip()} | {'id'}
+
+    @classmethod
+    def columns_for(cls, field_names):
+        """Model columns required to render ``field_names``."""
+        model = cls.Meta.model
+        concrete = {f.name for f in model._meta.concrete_fields}
+        fields = cls().fields
+        columns = {model._meta.pk.name}
+        for name in field_names:
+            if name in cls.field_columns:
+                columns.update(cls.field_columns[name])
+            elif name in fields:
+                source = fields[name].source.split('.')[0]
+                if source in concrete:
+                    columns.add(source)
+        return columns
+
+
+class PropertySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    field_columns = {'status': ['available'], 'address': ['location'], 'image_variants': ['image_variants']}
     status = serializers.SerializerMethodField()
     address = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     monthly_rent = serializers.DecimalField(source='price', max_digits=10, decimal_places=2, read_only=True)
 
     class Meta:
@@ -23,6 +69,8 @@ class PropertySerializer(serializers.ModelSerializer):
             'status',
             'address',
             'monthly_rent',
+            'images',
+            'image_variants',
         ]
 
     def get_status(self, obj):
@@ -31,8 +79,11 @@ class PropertySerializer(serializers.ModelSerializer):
     def get_address(self, obj):
         return obj.location or ''
 
+    def get_image_variants(self, obj):
+        return expand_variants(obj.image_variants, self.context.get('request'))
+
 
-class TenantSerializer(serializers.ModelSerializer):
+class TenantSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
@@ -57,10 +108,12 @@ class TenantSerializer(serializers.ModelSerializer):
             'notes',
             'profile_image',
             'user',
+            'balance',
         ]
 
 
-class PaymentSerializer(serializers.ModelSerializer):
+class PaymentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    field_columns = {'paid_date': ['payment_date', 'status']}
     paid_date = serializers.SerializerMethodField()
     created_date = serializers.DateTimeField(source='created_at', read_only=True)
 
@@ -88,8 +141,10 @@ class PaymentSerializer(serializers.ModelSerializer):
         return obj.payment_date if obj.status == 'paid' else None
 
 
-class MaintenanceRequestSerializer(serializers.ModelSerializer):
+class MaintenanceRequestSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    field_columns = {'title': ['issue_description'], 'image_variants': ['image_variants']}
     title = serializers.SerializerMethodField(read_only=True)
+    image_variants = serializers.SerializerMethodField()
     created_date = serializers.DateTimeField(source='created_at', read_only=True)
 
     class Meta:
@@ -110,6 +165,7 @@ class MaintenanceRequestSerializer(serializers.ModelSerializer):
             'vendor_phone',
             'resolution_notes',
             'images',
+            'image_variants',
             'created_at',
             'title',
             'created_date',
@@ -118,6 +174,9 @@ class MaintenanceRequestSerializer(serializers.ModelSerializer):
     def get_title(self, obj):
         return obj.issue_description or ''
 
+    def get_image_variants(self, obj):
+        return expand_variants(obj.image_variants, self.context.get('request'))
+
     def _get_issue_description(self, validated_data):
         desc = validated_data.get('issue_description')
         if desc:
@@ -0,0 +1,241 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
+from django.dispatch import receiver
+
+from .activity import record_activity
+from .changefeed import feed
+from .models import Property, Tenant, Payment, MaintenanceRequest, AIModelPrediction, Announcement
+from . import fulltext
+from .images import needs_refresh, schedule_refresh
+from .ledger import forget_pending_balances, recompute_balances, recompute_balances_on_commit
+from .profiles import invalidate_profiles, users_for_tenant, users_for_property
+from .versioning import ANNOUNCEMENTS_VERSION_KEY, bump_data_version_on_commit, bump_version
+
+
+def _log_payment_activity(instance, created, previous_status):
+    if created:
+        record_activity(
+            'payment',
+            'Payment Recorded',
+            f"Payment of {instance.amount} recorded for tenant #{instance.tenant_id}",
+            status='success' if instance.status == 'paid' else 'info',
+            object_id=instance.pk,
+            metadata={'status': instance.status},
+        )
+    elif instance.status != previous_status:
+        if instance.status == 'paid':
+            title, level = 'Payment Received', 'success'
+        elif instance.status in ('late', 'overdue'):
+            title, level = 'Late Payment Alert', 'warning'
+        else:
+            title, level = 'Payment Updated', 'info'
+        record_activity(
+            'payment',
+            title,
+            f"Payment #{instance.pk} changed from {previous_status} to {instance.status}",
+            status=level,
+            object_id=instance.pk,
+            metadata={'status': instance.status, 'previous_status': previous_status},
+        )
+
+
+def _log_maintenance_activity(instance, created, previous_status):
+    if created:
+        record_activity(
+            'maintenance',
+            'Maintenance Request',
+            (instance.issue_description or '')[:200],
+            status='warning',
+            object_id=instance.pk,
+            metadata={'status': instance.status, 'property_id': instance.property_id},
+        )
+    elif instance.status != previous_status:
+        record_activity(
+            'maintenance',
+            'Maintenance Completed' if instance.status == 'completed' else 'Maintenance Updated',
+            f"Request #{instance.pk} changed from {previous_status} to {instance.status}",
+            status='success' if instance.status == 'completed' else 'info',
+            object_id=instance.pk,
+            metadata={'status': instance.status, 'previous_status': previous_status},
+        )
+
+
+@receiver(post_save, sender=Payment)
+def payment_saved(sender, instance, created, **kwargs):
+    previous_status = getattr(instance, '_loaded_status', None)
+    previous_tenant_id = getattr(instance, '_loaded_tenant_id', None)
+    instance._loaded_status = instance.status
+    instance._loaded_tenant_id = instance.tenant_id
+    recompute_balances([instance.tenant_id, previous_tenant_id])
+    _log_payment_activity(instance, created, previous_status)
+    if created or instance.status != previous_status:
+        feed.publish_on_commit('payment', {
+            'id': instance.pk,
+            'tenant_id': instance.tenant_id,
+            'property_id': instance.property_id,
+            'amount': str(instance.amount),
+            'status': instance.status,
+            'previous_status': None if created else previous_status,
+        })
+
+
+@receiver(post_delete, sender=Payment)
+def payment_deleted(sender, instance, **kwargs):
+    # Once per tenant per transaction, not once per payment of a cascade
+    recompute_balances_on_commit([instance.tenant_id])
+    feed.publish_on_commit('payment', {
+        'id': instance.pk,
+        'tenant_id': instance.tenant_id,
+        'property_id': instance.property_id,
+        'amount': str(instance.amount),
+        'status': None,
+        'previous_status': instance.status,
+    })
+
+
+@receiver(post_save, sender=MaintenanceRequest)
+def maintenance_saved(sender, instance, created, **kwargs):
+    previous_status = getattr(instance, '_loaded_status', None)
+    instance._loaded_status = instance.status
+    _log_maintenance_activity(instance, created, previous_status)
+    if created or instance.status != previous_status:
+        feed.publish_on_commit('maintenance', {
+            'id': instance.pk,
+            'property_id': instance.property_id,
+            'priority': instance.priority,
+            'status': instance.status,
+            'previous_status': None if created else previous_status,
+        })
+
+
+@receiver(post_delete, sender=MaintenanceRequest)
+def maintenance_deleted(sender, instance, **kwargs):
+    feed.publish_on_commit('maintenance', {
+        'id': instance.pk,
+        'property_id': instance.property_id,
+        'priority': instance.priority,
+        'status': None,
+        'previous_status': instance.status,
+    })
+
+
+@receiver(post_save, sender=Tenant)
+def tenant_saved(sender, instance, created, **kwargs):
+    previous_score = getattr(instance, '_loaded_risk_score', None)
+    instance._loaded_risk_score = instance.behavior_risk_score
+    if not created and instance.behavior_risk_score != previous_score:
+        feed.publish_on_commit('risk', {
+            'tenant_id': instance.pk,
+            'behavior_risk_score': instance.behavior_risk_score,
+            'previous_score': previous_score,
+        })
+
+
+@receiver(post_delete, sender=Tenant)
+def tenant_deleted(sender, instance, **kwargs):
+    forget_pending_balances([instance.pk])
+
+
+@receiver(post_save, sender=Property)
+def property_saved(sender, instance, created, **kwargs):
+    previous_score = getattr(instance, '_loaded_risk_score', None)
+    instance._loaded_risk_score = instance.risk_score
+    if not created and instance.risk_score != previous_score:
+        feed.publish_on_commit('risk', {
+            'property_id': instance.pk,
+            'risk_score': instance.risk_score,
+            'previous_score': previous_score,
+        })
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_delete, sender=Property)
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+@receiver(post_save, sender=Payment)
+@receiver(post_delete, sender=Payment)
+@receiver(post_save, sender=MaintenanceRequest)
+@receiver(post_delete, sender=MaintenanceRequest)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def bump_data_version(sender, update_fields=None, **kwargs):
+    # Logins save last_login, which no cached payload shows
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    bump_data_version_on_commit()
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_save, sender=MaintenanceRequest)
+def refresh_image_variants(sender, instance, **kwargs):
+    if needs_refresh(instance):
+        schedule_refresh(sender, instance.pk)
+
+
+@receiver(post_save, sender=Announcement)
+@receiver(post_delete, sender=Announcement)
+def bump_announcements_version(sender, **kwargs):
+    transaction.on_commit(lambda: bump_version(ANNOUNCEMENTS_VERSION_KEY))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_profile(sender, instance, **kwargs):
+    invalidate_profiles([instance.pk])
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+def invalidate_tenant_profile(sender, instance, **kwargs):
+    invalidate_profiles(users_for_tenant(instance))
+    instance._loaded_user_id = instance.user_id
+    instance._loaded_email = instance.email
+
+
+@receiver(post_save, sender=Property)
+@receiver(pre_delete, sender=Property)
+def invalidate_property_profiles(sender, instance, **kwargs):
+    # pre_delete: tenants still reference the property at that point
+    invalidate_profiles(users_for_property(instance.pk))
+
+
+@receiver(post_save, sender=User)
+def log_user_activity(sender, instance, created, **kwargs):
+    if created:
+        role = 'admin' if instance.is_staff else 'tenant'
+        record_activity(
+            'user',
+            'New User Registration',
+            f"{instance.get_full_name() or instance.email} registered as {role}",
+            status='success',
+            object_id=instance.pk,
+        )
+
+
+@receiver(post_save, sender=AIModelPrediction)
+def log_ai_activity(sender, instance, created, **kwargs):
+    if created:
+        record_activity(
+            'ai',
+            f"{instance.get_model_type_display()} Prediction",
+            f"Confidence {instance.confidence_score:.2f}",
+            status='info',
+            object_id=instance.pk,
+            metadata={'model_type': instance.model_type},
+        )
+
+
+@receiver(post_save, sender=Property)
+@receiver(post_save, sender=Tenant)
+@receiver(post_save, sender=MaintenanceRequest)
+def index_search_document(sender, instance, update_fields=None, **kwargs):
+    if fulltext.needs_reindex(sender, update_fields):
+        fulltext.index_objects([instance])
+
+
+@receiver(post_delete, sender=Property)
+@receiver(post_delete, sender=Tenant)
+@receiver(post_delete, sender=MaintenanceRequest)
+def remove_search_document(sender, instance, **kwargs):
+    fulltext.remove_objects(sender, [instance.pk])
@@ -0,0 +1,34 @@
+"""
+Per-connection SQLite tuning for sites that run SQLite in production.
+
+``configure_connection`` runs on every new connection (``connection_created``)
+and applies ``SQLITE_PRAGMAS``. The defaults switch to WAL so readers and the
+writer no longer block each other and give each connection a larger page
+cache and memory-mapped reads. How long a connection waits on a locked
+database is ``OPTIONS['timeout']`` in the database settings; it sets SQLite's
+busy timeout, so it is not repeated here.
+"""
+from django.conf import settings
+
+DEFAULT_PRAGMAS = {
+    # Readers keep reading while a write commits; persists in the database file
+    'journal_mode': 'WAL',
+    # In WAL mode NORMAL only fsyncs at checkpoints and is still crash-safe
+    'synchronous': 'NORMAL',
+    # Negative values are KiB: 64 MB page cache per connection
+    'cache_size': -64000,
+    'mmap_size': 256 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+}
+
+
+def pragmas():
+    return getattr(settings, 'SQLITE_PRAGMAS', DEFAULT_PRAGMAS)
+
+
+def configure_connection(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for name, value in pragmas().items():
+            cursor.execute(f"PRAGMA {name} = {value}")
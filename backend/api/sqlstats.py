@@ -0,0 +1,145 @@
+"""
+Per-request SQL statistics and query budgets.
+
+``record_queries()`` installs an execute wrapper on every database
+connection and counts the queries run in its block, their total time, how
+often the same statement ran with the same parameters (``duplicates``) and
+how often the same SQL ran with any parameters (``similar``; a statement
+repeated with different ids or timestamps is usually an N+1, a missing
+``select_related`` or a write inside a loop).
+``api.middleware.SQLInstrumentationMiddleware`` records every request this
+way, adds the figures to the response headers and logs them to the
+``api.sql`` logger.
+
+Views declare how many queries a request may take with ``@query_budget``
+(function views) or a ``query_budget`` attribute (viewsets, optionally per
+action). Requests over budget are logged as warnings, or raise
+``QueryBudgetExceeded`` when ``SQL_QUERY_BUDGET_STRICT`` is on, as it should
+be in CI. ``manage.py check_query_budgets`` requests every budgeted endpoint
+against a seeded database, and ``assert_max_queries`` does the same check
+around any block of code.
+"""
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+MAX_REPORTED_REPEATS = 5
+# Distinct statements tracked per block; keeps a large import's memory flat
+MAX_TRACKED_STATEMENTS = 1000
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryStats:
+    """Execute wrapper that accumulates statistics for the queries it sees."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        # Keyed by a hash so the parameters of every row written are not kept alive
+        self.statements = Counter()
+        self.sql = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+            self._track(self.statements, hash((sql, repr(params))))
+            self._track(self.sql, sql)
+
+    @staticmethod
+    def _track(counter, key):
+        if key in counter or len(counter) < MAX_TRACKED_STATEMENTS:
+            counter[key] += 1
+
+    @property
+    def milliseconds(self):
+        return round(self.seconds * 1000, 2)
+
+    def repeated(self):
+        """``[(sql, times)]`` for SQL run more than once, whatever the parameters."""
+        return [(sql, times) for sql, times in self.sql.most_common() if times > 1]
+
+    @property
+    def duplicates(self):
+        """Queries that repeated an earlier identical query."""
+        return sum(times - 1 for times in self.statements.values())
+
+    @property
+    def similar(self):
+        """Queries that repeated the SQL of an earlier query, whatever the parameters."""
+        return sum(times - 1 for times in self.sql.values())
+
+    def as_dict(self):
+        return {
+            'queries': self.count,
+            'db_time_ms': self.milliseconds,
+            'duplicates': self.duplicates,
+            'similar': self.similar,
+            'repeated': [
+                {'sql': sql, 'times': times} for sql, times in self.repeated()[:MAX_REPORTED_REPEATS]
+            ],
+        }
+
+
+@contextmanager
+def record_queries(aliases=None):
+    """Yield a ``QueryStats`` counting the queries run in the block."""
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for alias in aliases or connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        yield stats
+
+
+def query_budget(limit):
+    """
+    Declare the most queries a request to a function view may take. Apply it
+    above ``@api_view``. Viewsets set a ``query_budget`` class attribute
+    instead: a number, or a dict of action name to number.
+    """
+    def decorator(view):
+        view.query_budget = limit
+        return view
+    return decorator
+
+
+def budget_for(view_func, method):
+    """The query budget declared for ``view_func`` handling ``method``, or None."""
+    budget = getattr(view_func, 'query_budget', None)
+    if budget is None:
+        budget = getattr(getattr(view_func, 'cls', None), 'query_budget', None)
+    if isinstance(budget, dict):
+        # Router-generated viewset views map HTTP methods to actions
+        action = (getattr(view_func, 'actions', None) or {}).get(method.lower())
+        budget = budget.get(action)
+    return budget
+
+
+def strict_budgets():
+    return getattr(settings, 'SQL_QUERY_BUDGET_STRICT', False)
+
+
+def check_budget(stats, budget, label):
+    """Raise ``QueryBudgetExceeded`` when ``stats`` went over ``budget``."""
+    if budget is not None and stats.count > budget:
+        repeated = ''.join(f"\n  {times}x {sql}" for sql, times in stats.repeated()[:MAX_REPORTED_REPEATS])
+        raise QueryBudgetExceeded(
+            f"{label} ran {stats.count} queries, over its budget of {budget}{repeated}"
+        )
+
+
+@contextmanager
+def assert_max_queries(budget, label='Block'):
+    """Fail when the block runs more than ``budget`` queries."""
+    with record_queries() as stats:
+        yield stats
+    check_budget(stats, budget, label)
@@ -3,11 +3,11 @@ from django.urls import path, include
 from .views import (
     PropertyViewSet, TenantViewSet, PaymentViewSet, MaintenanceRequestViewSet, 
     me, EmailTokenObtainPairView, create_tenant_user, create_admin_user, 
-    get_available_properties, announcements
+    get_available_properties, announcements, image_variant, search
 )
 from .admin_views import (
-    dashboard_stats, ai_insights, user_management, user_action, 
-    system_activity, analytics_data, system_configuration
+    dashboard_stats, dashboard_stream, ai_insights, user_management, user_action, bulk_user_action,
+    system_activity, analytics_data, system_configuration, bulk_import, export_data
 )
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
@@ -21,23 +21,33 @@ router.register(r'payments', PaymentViewSet, basename='payment')
 router.register(r'maintenance', MaintenanceRequestViewSet, basename='maintenance')
 
 urlpatterns = [
+    # Before the router, whose properties/<pk>/ route would match 'available'
+    path('properties/available/', get_available_properties, name='available-properties'),
     path('', include(router.urls)),
     path('auth/me/', me, name='auth-me'),
     path('auth/token/', EmailTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('auth/create-tenant/', create_tenant_user, name='create-tenant'),
     path('auth/create-admin/', create_admin_user, name='create-admin'),
-    path('properties/available/', get_available_properties, name='available-properties'),
     
     # Admin dashboard endpoints
     path('dashboard/stats/', dashboard_stats, name='dashboard-stats'),
+    path('dashboard/stream/', dashboard_stream, name='dashboard-stream'),
     path('ai/insights/', ai_insights, name='ai-insights'),
     path('users/', user_management, name='user-management'),
+    path('users/bulk-action/', bulk_user_action, name='user-bulk-action'),
     path('users/<int:user_id>/<str:action>/', user_action, name='user-action'),
     path('activity/recent/', system_activity, name='system-activity'),
     path('analytics/', analytics_data, name='analytics-data'),
     path('system/configure/', system_configuration, name='system-configuration'),
+    path('import/<str:kind>/', bulk_import, name='bulk-import'),
+    path('export/<str:kind>/', export_data, name='export-data'),
     
+    path('search/', search, name='search'),
+
     # Announcement endpoints
     path('announcements/', announcements, name='announcements'),
+
+    # Responsive image variants
+    path('images/<str:name>', image_variant, name='image-variant'),
 ]
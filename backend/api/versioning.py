@@ -0,0 +1,89 @@
+"""
+Global data version used to key cached aggregate payloads.
+
+Every committed write to the core models bumps the version, so anything
+memoized under ``versioned_key()`` is recomputed only after data changes.
+
+The version counters live in the default cache, so every worker process
+must share it (Redis via ``REDIS_URL``). With the per-process
+``LocMemCache`` a write only bumps the version of the process that handled
+it, and other workers keep serving what they cached; ``manage.py check``
+warns about this outside DEBUG. Memoized entries also expire after
+``VERSIONED_CACHE_TIMEOUT`` seconds, which bounds that staleness and lets
+keys of old versions drop out of a shared cache.
+"""
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.db import transaction
+
+DATA_VERSION_KEY = 'api:data_version'
+# Bumped only by announcement writes (see api.views.announcements)
+ANNOUNCEMENTS_VERSION_KEY = 'api:announcements_version'
+
+
+def get_version(key):
+    """Current value of the version counter stored under ``key``."""
+    version = cache.get(key)
+    if version is None:
+        # add() keeps a concurrent bump from being overwritten
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+def bump_version(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 2, timeout=None)
+        return cache.get(key, 2)
+
+
+def get_data_version():
+    return get_version(DATA_VERSION_KEY)
+
+
+def bump_data_version():
+    return bump_version(DATA_VERSION_KEY)
+
+
+def bump_data_version_on_commit():
+    transaction.on_commit(bump_data_version)
+
+
+def versioned_key(name, version=None):
+    if version is None:
+        version = get_data_version()
+    return f"{name}:v{version}"
+
+
+def versioned_cache_timeout():
+    return getattr(settings, 'VERSIONED_CACHE_TIMEOUT', 600)
+
+
+def memoize_by_version(name, compute, timeout=None):
+    """
+    Return the cached result of ``compute()`` for the current data version,
+    kept for ``timeout`` seconds (default ``VERSIONED_CACHE_TIMEOUT``).
+    """
+    key = versioned_key(name)
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result, timeout or versioned_cache_timeout())
+    return result
+
+
+def check_shared_cache(app_configs, **kwargs):
+    """Warn when data versions live in a per-process cache in production."""
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if settings.DEBUG or not backend.endswith('LocMemCache'):
+        return []
+    return [checks.Warning(
+        'Data versions are stored in a per-process LocMemCache.',
+        hint='Writes handled by one worker do not invalidate cached payloads or '
+             'reach the dashboard change feed in the others; set REDIS_URL so '
+             'all workers share one cache.',
+        id='api.W001',
+    )]
@@ -1,21 +1,142 @@
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser, AllowAny, IsAuthenticated
 from .models import Property, Tenant, Payment, MaintenanceRequest, Announcement
 from .serializers import PropertySerializer, TenantSerializer, PaymentSerializer, MaintenanceRequestSerializer
+from .fast_serializers import compile_values_plan
+from .conditional import queryset_watermark, page_watermark, compute_etag, etag_matches
+from .profiles import get_profile
+from .pagination import IdCursorPagination
+from .versioning import ANNOUNCEMENTS_VERSION_KEY, get_version, versioned_key
+from .billing import parse_period, generate_rent_invoices, DEFAULT_BATCH_SIZE
+from .ledger import tenant_ledger
+from .search import cached_search
+from . import fulltext
+from .images import variant_path, variant_content_type
+from .sqlstats import query_budget
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login
 from rest_framework_simplejwt.tokens import RefreshToken
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.utils.cache import patch_vary_headers
+from django.utils.crypto import get_random_string
+from django.utils.dateparse import parse_date
+from django.http import (
+    FileResponse, Http404, HttpResponse, HttpResponseNotAllowed, HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+import hashlib
 import logging
+import re
 
 from .permissions import IsOwnerOrAdmin, IsStaffUser, IsSuperAdmin
 
 logger = logging.getLogger(__name__)
 
-class PropertyViewSet(viewsets.ModelViewSet):
+
+class SparseFieldsMixin:
+    """
+    Project list/detail queries down to the columns needed for ``?fields=``
+    so wide text columns are never loaded for table views.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        requested = serializer_class.requested_fields(self.request)
+        if requested is None:
+            return queryset
+        columns = serializer_class.columns_for(requested) | self.ordering_columns()
+        return queryset.only(*columns)
+
+    def ordering_columns(self):
+        # Cursor pagination reads the ordering column from the page edges
+        ordering = self.request.query_params.get('ordering', '').lstrip('-')
+        if ordering in getattr(self, 'ordering_fields', ()):
+            return {ordering}
+        return set()
+
+
+class ConditionalGetMixin:
+    """
+    Tag list and detail responses with a strong ETag computed from the
+    page's or the row's watermark (see ``api.conditional``) and answer a matching
+    ``If-None-Match`` with a 304 before anything is serialized.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        watermark = None
+        if self.paginator is not None:
+            watermark = page_watermark(self.paginator, queryset, request, self)
+        if watermark is None:
+            watermark = queryset_watermark(queryset)
+        return self._conditional_response(request, watermark, super().list, args, kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: kwargs[lookup_url_kwarg]}
+            )
+            watermark = queryset_watermark(queryset)
+        except (TypeError, ValueError, DjangoValidationError):
+            # Let get_object() turn malformed lookups into its usual 404
+            return super().retrieve(request, *args, **kwargs)
+        if not watermark['count']:
+            return super().retrieve(request, *args, **kwargs)
+        return self._conditional_response(request, watermark, super().retrieve, args, kwargs)
+
+    def _conditional_response(self, request, watermark, handler, args, kwargs):
+        # Tag before rendering: a write in between yields a body newer than its
+        # tag, which only costs the client one extra refetch.
+        etag = compute_etag(request, watermark)
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response['ETag'] = etag
+        patch_vary_headers(response, ['Accept', 'Authorization'])
+        return response
+
+
+class FastListMixin:
+    """
+    Serve ``list`` from ``.values()`` rows rendered by a compiled plan
+    (see ``api.fast_serializers``) instead of building a model instance and
+    running the serializer per row. Output is identical to the serializer;
+    views whose serializer cannot be compiled use the regular path.
+    """
+
+    def list(self, request, *args, **kwargs):
+        plan = compile_values_plan(self.get_serializer())
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*(plan.columns | self.ordering_columns()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(plan.render(page))
+        return Response(plan.render(queryset))
+
+
+class PropertyViewSet(ConditionalGetMixin, FastListMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = PropertySerializer
+    # Most queries a request may take, per action (see api/sqlstats.py)
+    query_budget = {'list': 5, 'retrieve': 4}
+    # Index-backed list filters (see Property.Meta.indexes)
+    filter_params = {
+        'type': 'property_type__in',
+        'location': 'location',
+    }
+    ordering_fields = ['id', 'price']
 
     def get_queryset(self):
         user = self.request.user
@@ -27,8 +148,15 @@ class PropertyViewSet(viewsets.ModelViewSet):
         # default owner to request.user
         serializer.save(owner=self.request.user)
 
-class TenantViewSet(viewsets.ModelViewSet):
+class TenantViewSet(ConditionalGetMixin, FastListMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = TenantSerializer
+    query_budget = {'list': 5, 'retrieve': 4, 'ledger': 4}
+    # Index-backed list filters (see Tenant.Meta.indexes)
+    filter_params = {
+        'status': 'status__in',
+        'property': 'property',
+    }
+    ordering_fields = ['id', 'last_name']
 
     def get_queryset(self):
         user = self.request.user
@@ -49,15 +177,56 @@ class TenantViewSet(viewsets.ModelViewSet):
         if tenant.user:
             return Response({'detail': 'User already exists for this tenant.'}, status=status.HTTP_400_BAD_REQUEST)
         email = tenant.email
-        password = request.data.get('password') or User.objects.make_random_password()
+        password = request.data.get('password') or get_random_string(12)
         user = User.objects.create_user(username=email, email=email, password=password)
         tenant.user = user
         tenant.save()
         # Optionally: send email here
         return Response({'email': email, 'password': password})
 
-class PaymentViewSet(viewsets.ModelViewSet):
+    @action(detail=True, methods=['get'])
+    def ledger(self, request, pk=None):
+        """
+        Charges, payments and running balance for this tenant, oldest first.
+        ``start``/``end`` (YYYY-MM-DD) limit the due-date range; earlier
+        entries are carried in ``opening_balance``.
+        """
+        tenant = self.get_object()
+        bounds = {}
+        for name in ('start', 'end'):
+            value = request.query_params.get(name)
+            try:
+                bounds[name] = parse_date(value) if value else None
+            except ValueError:
+                bounds[name] = None
+            if value and bounds[name] is None:
+                return Response({'error': f'Invalid {name} date, expected YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            data = tenant_ledger(tenant, **bounds)
+        except Exception as e:
+            logger.error(f"Error building ledger for tenant {tenant.pk}: {str(e)}")
+            return Response({'error': 'Failed to build ledger', 'details': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        money = ('charge', 'paid', 'balance')
+        for entry in data['entries']:
+            for key in money:
+                entry[key] = f"{entry[key]:.2f}"
+        for key in ('balance', 'opening_balance', 'total_charged', 'total_paid', 'closing_balance'):
+            data[key] = f"{data[key]:.2f}"
+        return Response(data)
+
+class PaymentViewSet(ConditionalGetMixin, FastListMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = PaymentSerializer
+    query_budget = {'list': 5, 'retrieve': 4}
+    # Index-backed list filters (see Payment.Meta.indexes)
+    filter_params = {
+        'status': 'status__in',
+        'tenant': 'tenant',
+        'property': 'property',
+    }
+    # Not payment_date: cursors cannot page across the nulls of unpaid rows
+    ordering_fields = ['id', 'due_date']
 
     def get_queryset(self):
         user = self.request.user
@@ -66,8 +235,38 @@ class PaymentViewSet(viewsets.ModelViewSet):
         # payments for tenants that belong to this user
         return Payment.objects.filter(tenant__user=user).order_by('-id')
 
-class MaintenanceRequestViewSet(viewsets.ModelViewSet):
+    @action(detail=False, methods=['post'], url_path='generate-rent', permission_classes=[IsAdminUser])
+    def generate_rent(self, request):
+        """Admin action: create this period's rent payments for all active tenants."""
+        try:
+            period = parse_period(request.data.get('period'))
+            due_day = int(request.data.get('due_day', 1))
+            batch_size = int(request.data.get('batch_size', DEFAULT_BATCH_SIZE))
+        except (TypeError, ValueError) as e:
+            return Response({'error': 'Invalid parameters', 'details': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if batch_size < 1:
+            return Response({'error': 'Invalid parameters', 'details': 'batch_size must be positive'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            summary = generate_rent_invoices(period, due_day=due_day, batch_size=batch_size)
+        except ValueError as e:
+            return Response({'error': 'Invalid parameters', 'details': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error generating rent invoices: {str(e)}")
+            return Response({'error': 'Failed to generate rent invoices', 'details': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        created = summary['created'] > 0
+        return Response(summary, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+class MaintenanceRequestViewSet(ConditionalGetMixin, FastListMixin, SparseFieldsMixin, viewsets.ModelViewSet):
     serializer_class = MaintenanceRequestSerializer
+    query_budget = {'list': 5, 'retrieve': 4}
+    # Index-backed list filters (see MaintenanceRequest.Meta.indexes)
+    filter_params = {
+        'status': 'status__in',
+        'priority': 'priority__in',
+        'category': 'category__in',
+        'property': 'property',
+    }
+    ordering_fields = ['id', 'created_at']
 
     def get_queryset(self):
         user = self.request.user
@@ -82,54 +281,13 @@ class EmailTokenObtainPairView(TokenObtainPairView):
     serializer_class = EmailTokenObtainPairSerializer
 
 
+@query_budget(3)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def me(request):
     # Return authenticated user info
     if request.user and request.user.is_authenticated:
-        user = request.user
-
-        # Determine user type based on staff/superuser status and tenant record
-        if user.is_superuser:
-            user_type = 'super_admin'
-        elif user.is_staff:
-            user_type = 'admin'
-        else:
-            user_type = 'tenant'
-        
-        # Check if user has a tenant record
-        try:
-            tenant = Tenant.objects.get(email=user.email)
-            user_type = 'tenant'
-        except Tenant.DoesNotExist:
-            if not user.is_staff:
-                user_type = 'user'  # Regular user without tenant record
-        
-        response_data = {
-            'email': user.email,
-            'full_name': user.get_full_name(),
-            'id': user.id,
-            'is_staff': user.is_staff,
-            'is_superuser': user.is_superuser,
-            'user_type': user_type,
-        }
-        
-        # Add tenant-specific data if user is tenant
-        if user_type == 'tenant':
-            try:
-                tenant = Tenant.objects.get(email=user.email)
-                response_data.update({
-                    'tenant_id': tenant.id,
-                    'property_id': tenant.property.id if tenant.property else None,
-                    'property_name': tenant.property.name if tenant.property else None,
-                    'active': tenant.active,
-                    'credit_score': tenant.credit_score,
-                    'payment_reliability_score': tenant.payment_reliability_score
-                })
-            except Tenant.DoesNotExist:
-                response_data['tenant_error'] = 'Tenant record not found'
-        
-        return Response(response_data)
+        return Response(get_profile(request.user))
     return Response(
         {
             'email': None,
@@ -299,22 +457,23 @@ def create_admin_user(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@query_budget(4)
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_available_properties(request):
     """
-    Get list of available properties for tenant assignment
+    Search available properties for tenant assignment and browsing.
+
+    Filters: ``type`` and ``location`` (comma separated), ``min_price``,
+    ``max_price``, ``bedrooms`` (comma separated) and ``min_bedrooms``.
+    Results are keyset-paginated (``cursor``, ``page_size``); the first page
+    includes ``total`` and facet counts per type, location and price band.
     """
     try:
-        properties = Property.objects.filter(available=True).values(
-            'id', 'name', 'location', 'property_type', 'price', 
-            'bedrooms', 'bathrooms', 'square_feet'
-        )
-        
-        return Response({
-            'properties': list(properties)
-        })
-        
+        return Response(cached_search(request))
+
+    except ValidationError as e:
+        return Response({'error': 'Invalid filter', 'details': e.detail}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         logger.error(f"Error getting available properties: {str(e)}")
         return Response({
@@ -323,49 +482,100 @@ def get_available_properties(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@query_budget(3)
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def search(request):
+    """
+    Ranked full-text search. ``q`` is required; ``type`` narrows to a comma
+    separated subset of property, tenant and maintenance (non-staff users
+    can only search properties); ``limit`` defaults to 20, max 100.
+    """
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    kinds = [kind.strip() for kind in request.query_params.get('type', '').split(',') if kind.strip()]
+    unknown = [kind for kind in kinds if kind not in fulltext.KIND_CODES]
+    if unknown:
+        return Response({'error': f"Unknown type: {', '.join(unknown)}"}, status=status.HTTP_400_BAD_REQUEST)
+    if not request.user.is_staff:
+        kinds = ['property']
+    try:
+        limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+    except ValueError:
+        return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        return Response({'query': query, 'results': fulltext.search(query, kinds or None, limit)})
+    except Exception as e:
+        logger.error(f"Error searching for {query!r}: {str(e)}")
+        return Response({
+            'error': 'Search failed',
+            'details': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 # Announcement API Views
+def _serialize_announcement(announcement):
+    return {
+        'id': announcement.id,
+        'title': announcement.title,
+        'content': announcement.content,
+        'announcement_type': announcement.announcement_type,
+        'target_audience': announcement.target_audience,
+        'author': announcement.author.get_full_name() or announcement.author.email,
+        'created_at': announcement.created_at,
+        'updated_at': announcement.updated_at,
+        'expires_at': announcement.expires_at,
+    }
+
+
+def _announcement_feed(request, audience):
+    """
+    Build one page of the announcement feed for ``audience`` ('admins' see
+    everything, 'tenants' see 'all' and 'tenants' announcements). Returns
+    the payload and how long it may be cached: never past the next expiry.
+    """
+    from django.utils import timezone
+    from django.db.models import Q, Min
+
+    now = timezone.now()
+    announcements = Announcement.objects.filter(is_active=True).filter(
+        Q(expires_at__isnull=True) | Q(expires_at__gt=now)
+    )
+    if audience == 'tenants':
+        announcements = announcements.filter(target_audience__in=['all', 'tenants'])
+
+    paginator = IdCursorPagination()
+    page = paginator.paginate_queryset(announcements.select_related('author'), request)
+    payload = paginator.get_paginated_response([_serialize_announcement(a) for a in page]).data
+
+    timeout = getattr(settings, 'ANNOUNCEMENTS_CACHE_TIMEOUT', 300)
+    next_expiry = announcements.aggregate(next_expiry=Min('expires_at'))['next_expiry']
+    if next_expiry is not None:
+        timeout = max(min(timeout, int((next_expiry - now).total_seconds()) + 1), 1)
+    return payload, timeout
+
+
+@query_budget(4)
 @api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticated])
 def announcements(request):
     """Get all announcements or create new announcement"""
-    from django.utils import timezone
-    from django.db import models
-    
     if request.method == 'GET':
-        # Filter announcements based on user role
-        user = request.user
-        announcements = Announcement.objects.filter(is_active=True)
-        
-        # Filter by target audience
-        if user.is_staff:
-            # Admins can see all announcements
-            pass
-        else:
-            # Tenants only see announcements targeted at them or all users
-            announcements = announcements.filter(
-                models.Q(target_audience='all') | models.Q(target_audience='tenants')
-            )
-        
-        # Filter out expired announcements
-        announcements = announcements.filter(
-            models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=timezone.now())
+        # Every user in an audience sees the same feed, so pages are cached per
+        # audience and dropped when announcements change or the next one expires
+        audience = 'admins' if request.user.is_staff else 'tenants'
+        key = versioned_key(
+            f"announcements:{audience}:{hashlib.md5(request.build_absolute_uri().encode()).hexdigest()}",
+            get_version(ANNOUNCEMENTS_VERSION_KEY),
         )
-        
-        serializer_data = []
-        for announcement in announcements:
-            serializer_data.append({
-                'id': announcement.id,
-                'title': announcement.title,
-                'content': announcement.content,
-                'announcement_type': announcement.announcement_type,
-                'target_audience': announcement.target_audience,
-                'author': announcement.author.get_full_name() or announcement.author.email,
-                'created_at': announcement.created_at,
-                'updated_at': announcement.updated_at,
-                'expires_at': announcement.expires_at,
-            })
-        
-        return Response(serializer_data)
+        payload = cache.get(key)
+        if payload is None:
+            payload, timeout = _announcement_feed(request, audience)
+            cache.set(key, payload, timeout)
+        return Response(payload)
     
     elif request.method == 'POST':
         # Only admins can create announcements
@@ -392,3 +602,97 @@ def announcements(request):
             'created_at': announcement.created_at,
             'message': 'Announcement created successfully'
         }, status=status.HTTP_201_CREATED)
+
+
+VARIANT_NAME_RE = re.compile(r'^[0-9a-f]{16}-\d{1,5}w\.(avif|webp|jpg)$')
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+RANGE_BLOCK_SIZE = 64 * 1024
+
+
+def _byte_range(header, size):
+    """
+    Parse a single ``bytes=`` range into inclusive ``(start, end)``. Returns
+    None to ignore the header (malformed or multi-range: serve the whole
+    file) and False when the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        length = int(last)
+        if length == 0 or size == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+def _read_range(path, start, length):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        while length > 0:
+            block = f.read(min(RANGE_BLOCK_SIZE, length))
+            if not block:
+                return
+            length -= len(block)
+            yield block
+
+
+def image_variant(request, name):
+    """
+    Serve a generated image variant. Names embed the source's content hash,
+    so a name always refers to the same bytes and responses are cacheable
+    forever. Full responses use FileResponse (sendfile under servers that
+    support wsgi.file_wrapper) or X-Accel-Redirect when
+    IMAGE_VARIANT_ACCEL_PREFIX is set; single byte ranges are honoured.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return HttpResponseNotAllowed(['GET', 'HEAD'])
+    path = variant_path(name) if VARIANT_NAME_RE.match(name) else None
+    if path is None:
+        raise Http404('Image not found')
+
+    etag = f'"{name}"'
+    headers = {
+        'ETag': etag,
+        'Cache-Control': 'public, max-age=31536000, immutable',
+        'Accept-Ranges': 'bytes',
+    }
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    content_type = variant_content_type(name)
+    accel_prefix = getattr(settings, 'IMAGE_VARIANT_ACCEL_PREFIX', '')
+    size = path.stat().st_size
+    byte_range = None
+    range_header = request.META.get('HTTP_RANGE')
+    # If-Range with a different validator means the client's copy is stale: send everything
+    if range_header and not accel_prefix and request.META.get('HTTP_IF_RANGE', etag) == etag:
+        byte_range = _byte_range(range_header, size)
+
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+    elif accel_prefix:
+        # nginx sends the file (and handles Range) from its internal location
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + name
+    elif byte_range is None:
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            _read_range(path, start, end - start + 1), status=206, content_type=content_type,
+        )
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = str(end - start + 1)
+    for header, value in headers.items():
+        response[header] = value
+    return response
@@ -1,5 +1,7 @@
 import os
 from pathlib import Path
+
+import django
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,10 +29,13 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.SQLInstrumentationMiddleware',
+    'api.middleware.ActivityLogMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.middleware.ReadYourWritesMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -72,8 +77,72 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            'OPTIONS': {
+                # Seconds to wait on a locked database (SQLite's busy timeout);
+                # the only place it is set
+                'timeout': 20,
+            },
         }
     }
+    if django.VERSION >= (5, 1):
+        # Take the write lock when a transaction starts, so two transactions
+        # that read then write cannot deadlock and fail with "database is locked"
+        DATABASES['default']['OPTIONS']['transaction_mode'] = 'IMMEDIATE'
+# Keep connections open across requests instead of reconnecting every time
+DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', '60'))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+# New SQLite connections get WAL journaling and larger caches;
+# set SQLITE_PRAGMAS to override the defaults in api/sqlite_tuning.py
+
+# Read replicas (see api/replicas.py): comma separated replica hosts for
+# PostgreSQL, or SQLite files kept in sync externally. Dashboard payloads,
+# AI feature reads and exports are served from replicas when configured.
+if os.environ.get('POSTGRES_DB'):
+    _replicas = [{'HOST': host.strip()} for host in os.environ.get('POSTGRES_REPLICA_HOSTS', '').split(',') if host.strip()]
+else:
+    _replicas = [{'NAME': path.strip()} for path in os.environ.get('SQLITE_REPLICA_PATHS', '').split(',') if path.strip()]
+DATABASE_REPLICAS = []
+for _index, _overrides in enumerate(_replicas, start=1):
+    # Tests read replicas through the test primary
+    DATABASES[f'replica_{_index}'] = {**DATABASES['default'], **_overrides, 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(f'replica_{_index}')
+DATABASE_ROUTERS = ['api.replicas.ReplicaRouter']
+# How long a user's replica reads stay on the primary after they write
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', '5'))
+
+# Cache - local memory by default, shared Redis when REDIS_URL is provided.
+# Run more than one worker process only with Redis: data versions used to
+# invalidate cached payloads (see api/versioning.py) and the dashboard
+# change feed (see api/changefeed.py) live in the cache.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds a payload memoized under a data version is kept (see api/versioning.py)
+VERSIONED_CACHE_TIMEOUT = int(os.environ.get('VERSIONED_CACHE_TIMEOUT', '600'))
+
+# Admin dashboard payloads are pre-computed in the background (see api/prewarm.py).
+# Disable the in-process refresher when running `manage.py prewarm_dashboards` as a worker.
+DASHBOARD_PREWARM_IN_PROCESS = os.environ.get('DASHBOARD_PREWARM_IN_PROCESS', '1') == '1'
+DASHBOARD_PREWARM_INTERVAL = int(os.environ.get('DASHBOARD_PREWARM_INTERVAL', '30'))
+# Seconds before a payload is refreshed even if no write bumped the data version
+DASHBOARD_PREWARM_MAX_AGE = int(os.environ.get('DASHBOARD_PREWARM_MAX_AGE', '3600'))
+
+# Live dashboard changes (see api/admin_views.dashboard_stream) are long-polled
+# by default. An event stream holds a worker thread for up to
+# DASHBOARD_STREAM_MAX_SECONDS, so only this many run per worker process.
+DASHBOARD_STREAM_MAX_CONNECTIONS = int(os.environ.get('DASHBOARD_STREAM_MAX_CONNECTIONS', '2'))
+DASHBOARD_STREAM_MAX_SECONDS = int(os.environ.get('DASHBOARD_STREAM_MAX_SECONDS', '60'))
 
 AUTH_PASSWORD_VALIDATORS = []
 
@@ -83,6 +152,36 @@ USE_I18N = True
 USE_TZ = True
 
 STATIC_URL = '/static/'
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Available-properties search (see api/search.py)
+PROPERTY_SEARCH_CACHE_TIMEOUT = 300
+# Upper bounds of the price facet bands; the last band is open-ended
+PROPERTY_PRICE_BANDS = [10000, 20000, 35000, 50000]
+
+# Responsive image variants (see api/images.py). Image references starting
+# with a prefix below are read from the matching directory.
+IMAGE_SOURCE_DIRS = {
+    'properties_images/': BASE_DIR.parent / 'properties_images',
+    'media/': MEDIA_ROOT,
+}
+IMAGE_VARIANT_ROOT = MEDIA_ROOT / 'variants'
+IMAGE_VARIANT_WIDTHS = [320, 640, 1024, 1600]
+IMAGE_VARIANT_FORMATS = ['avif', 'webp']
+IMAGE_PIPELINE_WORKERS = int(os.environ.get('IMAGE_PIPELINE_WORKERS', '2'))
+# Disable when variants are built by `manage.py build_image_variants` in a worker
+IMAGE_PIPELINE_IN_PROCESS = os.environ.get('IMAGE_PIPELINE_IN_PROCESS', '1') == '1'
+# Set to an nginx internal location (e.g. '/protected-variants/') to hand
+# variant transfer off with X-Accel-Redirect instead of streaming from Django
+IMAGE_VARIANT_ACCEL_PREFIX = os.environ.get('IMAGE_VARIANT_ACCEL_PREFIX', '')
+
+# Per-request SQL statistics and query budgets (see api/sqlstats.py)
+SQL_INSTRUMENTATION = os.environ.get('SQL_INSTRUMENTATION', '1') == '1'
+SQL_STATS_HEADERS = os.environ.get('SQL_STATS_HEADERS', '1') == '1'
+# Raise instead of logging when a request goes over its query budget (CI)
+SQL_QUERY_BUDGET_STRICT = os.environ.get('SQL_QUERY_BUDGET_STRICT', '0') == '1'
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # Django REST Framework basic settings
@@ -94,6 +193,14 @@ REST_FRAMEWORK = {
         'rest_framework_simplejwt.authentication.JWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ),
+    # Keyset pagination on -id for every list endpoint (see api/pagination.py)
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.IdCursorPagination',
+    'PAGE_SIZE': 50,
+    # Whitelisted, index-backed filters and ordering declared on each viewset
+    'DEFAULT_FILTER_BACKENDS': [
+        'api.filters.QueryParamFilter',
+        'rest_framework.filters.OrderingFilter',
+    ],
 }
 
 # Simple JWT settings (defaults OK, but exposing refresh lifetime example)
@@ -110,3 +217,6 @@ CORS_ALLOWED_ORIGINS = [
     'http://localhost:5173',
     'http://localhost:5174',
 ]
+CORS_EXPOSE_HEADERS = [
+    'X-DB-Query-Count', 'X-DB-Time-Ms', 'X-DB-Duplicate-Queries', 'X-DB-Similar-Queries', 'Server-Timing',
+]
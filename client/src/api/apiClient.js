@@ -78,6 +78,42 @@ async function apiFetch(path, { method = 'GET', body = null, params = null } = {
   return data;
 }
 
+// List endpoints are cursor-paginated (at most 500 rows per page)
+const MAX_PAGE_SIZE = 500;
+// Rows a list call loads unless it asks for more; views that show more than
+// this should page with `page()` instead
+const DEFAULT_LIST_LIMIT = 500;
+
+// One page of a list: `next` is the cursor for the following page, or null
+async function apiFetchPage(path, { params = null, cursor = null, pageSize = null } = {}) {
+  const pageParams = { ...(params || {}) };
+  if (pageSize) pageParams.page_size = pageSize;
+  if (cursor) pageParams.cursor = cursor;
+  const data = await apiFetch(path, { params: pageParams });
+  if (!data) return { results: [], next: null };
+  if (Array.isArray(data)) return { results: data, next: null };
+  const next = data.next ? new URL(data.next).searchParams.get('cursor') : null;
+  return { results: data.results || [], next };
+}
+
+// Up to `limit` rows of a list, fetched in pages as large as the API allows
+async function apiFetchList(path, { params = null, limit = DEFAULT_LIST_LIMIT } = {}) {
+  const items = [];
+  let cursor = null;
+  do {
+    const pageSize = Math.min(limit - items.length, MAX_PAGE_SIZE);
+    const page = await apiFetchPage(path, { params, cursor, pageSize });
+    items.push(...page.results);
+    cursor = page.next;
+  } while (cursor && items.length < limit);
+  return items.slice(0, limit);
+}
+
+// Rows the client-side aggregate helpers (stats, revenue, breakdowns) read:
+// the newest this many, so their totals are exact only below it. Numbers over
+// whole tables belong to the admin dashboard and analytics endpoints.
+const AGGREGATE_LIMIT = 2000;
+
 function isoToDateStr(d) {
   if (!d) return null;
   return (new Date(d)).toISOString();
@@ -133,10 +169,13 @@ export const api = {
 
   entities: {
     Property: {
-      filter: async (filters = {}) => {
-        const res = await apiFetch('/properties/', { params: filters });
+      filter: async (filters = {}, { limit } = {}) => {
+        const res = await apiFetchList('/properties/', { params: filters, limit });
         return res || [];
       },
+      page: async (filters = {}, cursor = null, pageSize = null) => {
+        return await apiFetchPage('/properties/', { params: filters, cursor, pageSize });
+      },
       create: async (data) => {
         return await apiFetch('/properties/', { method: 'POST', body: data });
       },
@@ -147,7 +186,10 @@ export const api = {
         return await apiFetch(`/properties/${id}/`, { method: 'DELETE' });
       },
       getStats: async (ownerId) => {
-        const props = await apiFetch('/properties/', { params: ownerId ? { owner_id: ownerId } : {} });
+        const props = await apiFetchList('/properties/', {
+          params: { ...(ownerId ? { owner_id: ownerId } : {}), fields: 'available,price,monthly_rent' },
+          limit: AGGREGATE_LIMIT,
+        });
         const list = props || [];
         const total = list.length;
         const available = list.filter(p => p.available === true).length;
@@ -157,24 +199,30 @@ export const api = {
       },
       getTopPerformers: async (ownerId, limit = 5) => {
         // Aggregate payments per property and sort
-        const payments = await apiFetch('/payments/', { params: ownerId ? { owner_id: ownerId } : {} });
+        const payments = await apiFetchList('/payments/', {
+          params: { ...(ownerId ? { owner_id: ownerId } : {}), fields: 'property,amount' },
+          limit: AGGREGATE_LIMIT,
+        });
         const revenueByProperty = (payments || []).reduce((acc, p) => {
           const id = p.property || p.property_id || p.property_id === 0 ? (p.property || p.property_id) : null;
           if (!id) return acc;
           acc[id] = (acc[id] || 0) + Number(p.amount || 0);
           return acc;
         }, {});
-        const props = await apiFetch('/properties/', { params: ownerId ? { owner_id: ownerId } : {} });
+        const props = await apiFetchList('/properties/', { params: ownerId ? { owner_id: ownerId } : {}, limit: AGGREGATE_LIMIT });
         const list = (props || []).map(prop => ({ ...prop, total_revenue: revenueByProperty[prop.id] || 0 })).sort((a,b)=>b.total_revenue - a.total_revenue);
         return list.slice(0, limit);
       }
     },
 
     Tenant: {
-      filter: async (filters = {}) => {
-        const res = await apiFetch('/tenants/', { params: filters });
+      filter: async (filters = {}, { limit } = {}) => {
+        const res = await apiFetchList('/tenants/', { params: filters, limit });
         return res || [];
       },
+      page: async (filters = {}, cursor = null, pageSize = null) => {
+        return await apiFetchPage('/tenants/', { params: filters, cursor, pageSize });
+      },
       create: async (data) => {
         return await apiFetch('/tenants/', { method: 'POST', body: data });
       },
@@ -187,10 +235,13 @@ export const api = {
     },
 
     Payment: {
-      filter: async (filters = {}) => {
-        const res = await apiFetch('/payments/', { params: filters });
+      filter: async (filters = {}, { limit } = {}) => {
+        const res = await apiFetchList('/payments/', { params: filters, limit });
         return res || [];
       },
+      page: async (filters = {}, cursor = null, pageSize = null) => {
+        return await apiFetchPage('/payments/', { params: filters, cursor, pageSize });
+      },
       create: async (data) => {
         return await apiFetch('/payments/', { method: 'POST', body: data });
       },
@@ -201,7 +252,10 @@ export const api = {
         return await apiFetch(`/payments/${id}/`, { method: 'DELETE' });
       },
       getRevenueStats: async (ownerId, startDate, endDate) => {
-        const all = await apiFetch('/payments/', { params: ownerId ? { owner_id: ownerId } : {} });
+        const all = await apiFetchList('/payments/', {
+          params: { ...(ownerId ? { owner_id: ownerId } : {}), fields: 'amount,payment_date,due_date,created_at' },
+          limit: AGGREGATE_LIMIT,
+        });
         const filtered = (all || []).filter(p => {
           const d = p.payment_date || p.due_date || p.created_at;
           if (!d) return false;
@@ -215,12 +269,15 @@ export const api = {
         return { total, count };
       },
       getMonthlyRevenue: async (ownerId, months = 12) => {
-        const all = await apiFetch('/payments/', { params: ownerId ? { owner_id: ownerId } : {} });
         const now = new Date();
         const monthsArr = Array.from({ length: months }).map((_, i) => {
           const d = new Date(now.getFullYear(), now.getMonth() - (months - 1 - i), 1);
           return { label: d.toISOString().slice(0,7), total: 0 };
         });
+        const all = await apiFetchList('/payments/', {
+          params: { ...(ownerId ? { owner_id: ownerId } : {}), fields: 'amount,payment_date,due_date,created_at' },
+          limit: AGGREGATE_LIMIT,
+        });
         (all || []).forEach(p => {
           const d = p.payment_date || p.due_date || p.created_at;
           if (!d) return;
@@ -231,7 +288,10 @@ export const api = {
         return monthsArr;
       },
       getPaymentMethodsBreakdown: async (ownerId) => {
-        const all = await apiFetch('/payments/', { params: ownerId ? { owner_id: ownerId } : {} });
+        const all = await apiFetchList('/payments/', {
+          params: { ...(ownerId ? { owner_id: ownerId } : {}), fields: 'payment_type,amount' },
+          limit: AGGREGATE_LIMIT,
+        });
         const breakdown = (all || []).reduce((acc, p) => {
           const k = p.payment_type || 'unknown';
           acc[k] = (acc[k] || 0) + Number(p.amount || 0);
@@ -240,18 +300,27 @@ export const api = {
         return breakdown;
       },
       getUpcomingPayments: async (ownerId, limit = 10) => {
-        const all = await apiFetch('/payments/', { params: ownerId ? { owner_id: ownerId } : {} });
-        const dateField = (p) => p.due_date || p.payment_date;
-        const upcoming = (all || []).filter(p => dateField(p) && p.status !== 'paid').sort((a, b) => new Date(dateField(a)) - new Date(dateField(b))).slice(0, limit);
-        return upcoming;
+        // Unpaid payments, soonest due first: one page of `limit` rows
+        const upcoming = await apiFetchList('/payments/', {
+          params: {
+            ...(ownerId ? { owner_id: ownerId } : {}),
+            status: 'pending,late,overdue,partial',
+            ordering: 'due_date',
+          },
+          limit,
+        });
+        return upcoming || [];
       }
     },
 
     MaintenanceRequest: {
-      filter: async (filters = {}) => {
-        const res = await apiFetch('/maintenance/', { params: filters });
+      filter: async (filters = {}, { limit } = {}) => {
+        const res = await apiFetchList('/maintenance/', { params: filters, limit });
         return res || [];
       },
+      page: async (filters = {}, cursor = null, pageSize = null) => {
+        return await apiFetchPage('/maintenance/', { params: filters, cursor, pageSize });
+      },
       create: async (data) => {
         return await apiFetch('/maintenance/', { method: 'POST', body: data });
       },
@@ -128,7 +128,8 @@ const AdminDashboard = () => {
         
         if (response.ok) {
           const data = await response.json();
-          return data;
+          // List endpoints are cursor-paginated
+          return Array.isArray(data) ? data : (data.results || []);
         }
         return [];
       } catch (error) {
@@ -201,7 +202,9 @@ const AdminDashboard = () => {
         if (!response.ok) {
           throw new Error('Announcements endpoint not available');
         }
-        return response.json();
+        // The feed is paginated newest first; the dashboard shows the first page
+        const data = await response.json();
+        return Array.isArray(data) ? data : (data.results || []);
       } catch (error) {
         console.log('Announcements API not available, using mock data');
         return [];
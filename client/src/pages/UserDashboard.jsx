@@ -78,7 +78,9 @@ const UserDashboard = () => {
         if (!response.ok) {
           throw new Error('Announcements endpoint not available');
         }
-        return response.json();
+        // The feed is paginated newest first; the dashboard shows the first page
+        const data = await response.json();
+        return Array.isArray(data) ? data : (data.results || []);
       } catch (error) {
         console.log('Announcements API not available, using mock data');
         return [];